@@ -1,13 +1,35 @@
 import asyncio
+import functools
+import io
+import json
 import logging
 import os
+import random
+import time
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
-from secret_hitler import config
-from secret_hitler.game import Game, GameStates, Player
+from secret_hitler import config, images, odds, replay
+from secret_hitler.assets import AssetCache
+from secret_hitler.fanout import fan_out
+from secret_hitler.game import Game, GameStates, Player, VoteOutcome
+from secret_hitler.journal import Journal
+from secret_hitler.locks import GameLocks
+from secret_hitler.outbox import Outbox
+from secret_hitler.registry import GameRegistry
+from secret_hitler.render_executor import RenderExecutor
+from secret_hitler.scheduler import (
+    BULK,
+    INTERACTIVE,
+    NORMAL,
+    FairScheduler,
+    ScheduledTarget,
+)
+from secret_hitler.status import StatusMessages
+from secret_hitler.telemetry import RateLimitTelemetry
+from secret_hitler.timers import TurnTimers
 
 
 class DiscordChannelHandler(logging.Handler):
@@ -70,17 +92,47 @@ intents.members = True
 intents.message_content = True
 intents.reactions = True
 
+scheduler = FairScheduler(
+    config.configuration["rest"]["rate"], config.configuration["rest"]["burst"]
+)
+# Global rate limits make the scheduler hold every request until they're over
+telemetry = RateLimitTelemetry(scheduler.back_off)
+
 c_prefix = "/sh "
-client = commands.Bot(command_prefix=c_prefix, intents=intents)
+client = commands.Bot(
+    command_prefix=c_prefix,
+    intents=intents,
+    max_messages=config.configuration["max_messages"],
+    http_trace=telemetry.trace_config(),
+)
 client.remove_command("help")
 
-running_games = {}
+registry = GameRegistry()
+assets = AssetCache(config.configuration["asset_ttl"])
+renderer = RenderExecutor(
+    config.configuration["render"]["executor"],
+    config.configuration["render"]["workers"],
+    config.configuration["render"]["max_queue"],
+)
+journal = Journal(
+    config.configuration["journal"]["path"],
+    config.configuration["journal"]["snapshot_every"],
+)
+locks = GameLocks()
+timers = TurnTimers()
 
 
 # Events
 @client.event
 async def on_ready():
     logger.info("We have logged in as {0.user}".format(client))
+    # Fills the hand cache of this process, also with a process pool
+    await asyncio.gather(
+        *(renderer.render(images.policy_hand, hand) for hand in images.POLICY_HANDS)
+    )
+    set_asset_channel()
+    timers.start(on_turn_timer)
+    client.add_view(VoteView())
     act = discord.Game(name="with Democracy")
     await client.change_presence(status=discord.Status.online, activity=act)
 
@@ -90,178 +142,191 @@ async def on_guild_available(guild):
     await setup(guild)
 
 
+# Votes are handled with raw reaction events, so they don't depend on the
+# nomination message still being in the message cache
 @client.event
-async def on_reaction_add(reaction, user):
-    if user.id == client.user.id:
+async def on_raw_reaction_add(payload):
+    if payload.user_id == client.user.id:
         return
 
-    if not reaction.is_custom_emoji():
+    if not payload.emoji.is_custom_emoji():
         return
 
-    game = get_game_with_player(user.id)
-    if not game:
+    game = registry.get_game_with_vote_message(payload.message_id)
+    if not game or not game.has_player(payload.user_id):
         return
 
-    if game.state == GameStates.ELECTION:
-        emoji = reaction.emoji
-
-        # If we've currently voted, don't let us vote again
-        if JA in emoji.name or NEIN in emoji.name:
-            for msg_reaction in reaction.message.reactions:
-                if user in [user async for user in msg_reaction.users()]:
-                    if (
-                        JA in msg_reaction.emoji.name or NEIN in msg_reaction.emoji.name
-                    ) and msg_reaction.emoji.name != emoji.name:
-                        await reaction.remove(user)
-                        return
-
-        vote = False
-        if JA in emoji.name:
-            vote = game.vote(user.id, "y")
-        elif NEIN in emoji.name:
-            vote = game.vote(user.id, "n")
-
-        if not vote:
-            return
+    async with locks.hold(game.game_id):
+        if game.is_vote_message(payload.message_id):
+            emoji = payload.emoji
 
-        if len(game.votes) == len(game.players):
-            if game.calculate_votes():
-                # Start Legislative Session
-                embed = discord.Embed(
-                    title="New Chancellor",
-                    description=client.get_user(game.chancellor.player_id).display_name
-                    + " is the new chancellor. Legislative Session starts now",
-                    color=discord.Color.dark_red(),
-                )
-                embed.set_thumbnail(
-                    url=client.get_user(game.chancellor.player_id).display_avatar.url
-                )
-                await client.get_channel(game.channel_id).send(embed=embed)
-                await start_president_legislative(game)
+            ballot = None
+            if JA in emoji.name:
+                ballot = "y"
+            elif NEIN in emoji.name:
+                ballot = "n"
+            if ballot is None:
                 return
 
-            if game.state == GameStates.GAME_OVER:
-                embed = discord.Embed(
-                    title="Game over!",
-                    description=game.winner
-                    + f"s won the game. Use {c_prefix}restart to restart the game",
-                    color=discord.Color.dark_red(),
+            # If we've currently voted, don't let us vote again
+            current = game.get_vote(payload.user_id)
+            if current is not None and current != ballot:
+                message = client.get_channel(payload.channel_id).get_partial_message(
+                    payload.message_id
+                )
+                await scheduler.call(
+                    payload.guild_id,
+                    payload.channel_id,
+                    INTERACTIVE,
+                    lambda: message.remove_reaction(
+                        emoji, discord.Object(id=payload.user_id)
+                    ),
                 )
-                for player in game.players:
-                    embed.add_field(
-                        name=client.get_user(player.player_id),
-                        value=player.role,
-                        inline=False,
-                    )
-                await client.get_channel(game.channel_id).send(embed=embed)
                 return
 
-            if game.failed_votes > 3:
-                embed = discord.Embed(
-                    title="Election Failed three times in a row",
-                    description="The election failed three times in a row. The top policy will be revealed",
-                    color=discord.Color.dark_red(),
-                )
-                await client.get_channel(game.channel_id).send(embed=embed)
-                await sendBoard(game)
-                game.failed_votes = 0
-                if game.state == GameStates.NOMINATION:
-                    game.set_president()
-                    game.nominated = None
-                    await start_nomination(game)
-                    return
-
-                if game.state == GameStates.GAME_OVER:
-                    embed = discord.Embed(
-                        title="Game over!",
-                        description=game.winner
-                        + f"s won the game. Use {c_prefix}restart to restart the game.",
-                        color=discord.Color.dark_red(),
-                    )
-                    for player in game.players:
-                        embed.add_field(
-                            name=client.get_user(player.player_id),
-                            value=player.role,
-                            inline=False,
-                        )
-                    await client.get_channel(game.channel_id).send(embed=embed)
-                    return
-
-                if game.state == GameStates.INVESTIGATION:
-                    embed = discord.Embed(
-                        title="Investigation",
-                        description=f"The current president can now investigate a players party. Please use {c_prefix}investigate <playername> to do that",
-                        color=discord.Color.dark_red(),
-                    )
-                    await client.get_channel(game.channel_id).send(embed=embed)
-                    return
-
-                if game.state == GameStates.POLICY_PEEK:
-                    game.policy_peek()
-                    file = discord.File(
-                        "secret_hitler/img/policypeek_" + str(game.game_id) + ".png",
-                        filename="president.png",
-                    )
-                    embed = discord.Embed(
-                        title="Policy Peek",
-                        description="These are the next three policies.",
-                        color=discord.Color.dark_red(),
-                    )
-                    embed.set_image(url="attachment://president.png")
-                    msg = await client.get_user(game.president.player_id).send(
-                        embed=embed, file=file
-                    )
-                    embed = discord.Embed(
-                        title="Policy Peek",
-                        description="The current president sees the top three policies. Please check your Direct Message!",
-                        color=discord.Color.dark_red(),
-                    )
-                    await client.get_channel(game.channel_id).send(embed=embed)
-                    game.set_president()
-                    game.state = GameStates.NOMINATION
-                    await start_nomination(game)
-                    return
-
-                if game.state == GameStates.EXECUTION:
-                    embed = discord.Embed(
-                        title="Execution",
-                        description=f"The current president can execute a player. Please use {c_prefix}execute <playername>",
-                        color=discord.Color.dark_red(),
-                    )
-                    await client.get_channel(game.channel_id).send(embed=embed)
-                    return
-            else:
-                embed = discord.Embed(
-                    title="Election Failed",
-                    description="The vote failed. After 3 failed votes the top policy will be revealed",
-                    color=discord.Color.dark_red(),
-                )
-                embed.add_field(
-                    name="Failed Votes", value=str(game.failed_votes) + "/3"
-                )
-            await client.get_channel(game.channel_id).send(embed=embed)
-            await start_nomination(game)
+            await cast_vote(game, payload.user_id, ballot)
 
 
 @client.event
-async def on_reaction_remove(reaction, user):
-    if user.id == client.user.id:
+async def on_raw_reaction_remove(payload):
+    if payload.user_id == client.user.id:
         return
 
-    if not reaction.is_custom_emoji():
+    if not payload.emoji.is_custom_emoji():
         return
 
-    if not (game := get_game_with_player(user.id)):
+    # Like adding a reaction, only living players of the game can take a vote
+    # back, executed players are no longer players of the game
+    game = registry.get_game_with_vote_message(payload.message_id)
+    if not game or not game.has_player(payload.user_id):
         return
 
-    if game.state == GameStates.ELECTION:
-        try:
-            if JA in reaction.emoji.name:
-                game.unvote(user.id, "y")
-            elif NEIN in reaction.emoji.name:
-                game.unvote(user.id, "n")
-        except KeyError:
-            logging.debug(f"Couldn't remove {user.id}'s vote")
+    async with locks.hold(game.game_id):
+        if game.is_vote_message(payload.message_id):
+            if JA in payload.emoji.name:
+                removed = game.unvote(payload.user_id, "y")
+            elif NEIN in payload.emoji.name:
+                removed = game.unvote(payload.user_id, "n")
+            else:
+                return
+            if removed:
+                game_changed(game)
+
+
+VOTE_REACTIONS = "Please react to this message with Ja or Nein to vote."
+VOTE_BUTTONS = "Please vote with the Ja or Nein button."
+
+
+class VoteView(discord.ui.View):
+    # Ja/Nein buttons of the "buttons" voting mode. The custom ids are the
+    # same on every vote message, so a single view registered at startup
+    # keeps handling the buttons of messages sent before a restart.
+    def __init__(self):
+        super().__init__(timeout=None)
+
+    @discord.ui.button(
+        label="Ja", style=discord.ButtonStyle.success, custom_id="secret_hitler:ja"
+    )
+    async def ja(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await button_vote(interaction, "y")
+
+    @discord.ui.button(
+        label="Nein", style=discord.ButtonStyle.danger, custom_id="secret_hitler:nein"
+    )
+    async def nein(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await button_vote(interaction, "n")
+
+
+async def button_vote(interaction: discord.Interaction, ballot):
+    # A vote costs the deferral and one followup. The deferral comes before
+    # waiting for the game's lock, which can be held for longer than the
+    # three seconds Discord waits for an answer.
+    game = registry.get_game_with_vote_message(interaction.message.id)
+    if not game or not game.has_player(interaction.user.id):
+        await interaction.response.send_message(
+            "You can't vote in this election", ephemeral=True
+        )
+        return
+
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    async with locks.hold(game.game_id):
+        if not game.is_vote_message(interaction.message.id):
+            await interaction.followup.send("This election is over", ephemeral=True)
+            return
+
+        # Buttons can't be taken back like reactions, so clicking the other
+        # button changes the vote
+        current = game.get_vote(interaction.user.id)
+        if current is not None and current != ballot:
+            game.unvote(interaction.user.id, current)
+
+        name = "Ja" if ballot == "y" else "Nein"
+        if not game.vote(interaction.user.id, ballot):
+            await interaction.followup.send("You already voted " + name, ephemeral=True)
+            return
+
+        votes = str(len(game.votes)) + "/" + str(len(game.players))
+        await interaction.followup.send(
+            f"You voted {name} ({votes} votes)", ephemeral=True
+        )
+        await vote_cast(game)
+
+
+async def cast_vote(game: Game, player_id, ballot):
+    # Shared by reaction and button votes, the caller holds the game's lock
+    if not game.vote(player_id, ballot):
+        return False
+    await vote_cast(game)
+    return True
+
+
+async def vote_cast(game: Game):
+    game_changed(game)
+
+    if len(game.votes) == len(game.players):
+        await count_votes(game)
+        game_changed(game)
+
+
+# Commands of a game are applied one at a time in the order they arrived,
+# the lock is held from before the command runs until it's saved
+@client.before_invoke
+async def lock_game(ctx):
+    ctx.game_lock = None
+    game = get_game_with_player(ctx.message.author.id)
+    if game:
+        ctx.game_lock = await locks.acquire(game.game_id)
+
+
+@client.after_invoke
+async def unlock_game(ctx):
+    game = get_game_with_player(ctx.message.author.id)
+    if game:
+        game_changed(game)
+    if getattr(ctx, "game_lock", None) is not None:
+        ctx.game_lock.release()
+
+
+def command_channel(ctx):
+    # Answers to commands are interactive and part of the author's game, or
+    # of the channel the command was sent in
+    game = get_game_with_player(ctx.message.author.id)
+    if game is not None and client.get_channel(game.channel_id) is not None:
+        return scheduled(game, ctx.channel, INTERACTIVE)
+    guild_id = ctx.guild.id if ctx.guild is not None else None
+    return ScheduledTarget(
+        scheduler, ctx.channel, guild_id, ctx.channel.id, INTERACTIVE
+    )
+
+
+async def reply(ctx, *args, **kwargs):
+    return await command_channel(ctx).send(*args, **kwargs)
+
+
+async def delete_command(ctx, game: Game):
+    # Commands like nominate are removed from the game channel
+    guild_id = client.get_channel(game.channel_id).guild.id
+    await scheduler.call(guild_id, game.channel_id, NORMAL, ctx.message.delete)
 
 
 # Commands
@@ -279,107 +344,120 @@ async def cleanup(ctx):
 
 @client.command(name="rules")
 async def rules(ctx):
-    await printRules(ctx.message.channel)
+    await printRules(command_channel(ctx))
 
 
 @client.command(name="license")
 async def license_command(ctx):
-    await printLicense(ctx.message.channel)
+    await printLicense(command_channel(ctx))
 
 
 @client.command(name="help")
 async def help(ctx):
-    await printHelp(ctx.message.channel)
+    await printHelp(command_channel(ctx))
 
 
 @client.command(name="roletest")
 async def roletest(ctx):
-    file = discord.File("secret_hitler/img/hitler_role.png", filename="role.png")
     embed = discord.Embed(
         title="Hitler",
         description="Hitler is your secret role.",
         color=discord.Color.dark_red(),
     )
-    embed.set_image(url="attachment://role.png")
-    await ctx.send(file=file, embed=embed)
+    await send_image(
+        ctx, embed, images.asset("secret_hitler/img/hitler_role.png"), "role.png"
+    )
 
-    file = discord.File("secret_hitler/img/fascist_role.png", filename="role.png")
     embed = discord.Embed(
         title="Fascist",
         description="Fascist is your secret role.",
         color=discord.Color.orange(),
     )
-    embed.set_image(url="attachment://role.png")
-    await ctx.send(file=file, embed=embed)
+    await send_image(
+        ctx, embed, images.asset("secret_hitler/img/fascist_role.png"), "role.png"
+    )
 
-    file = discord.File("secret_hitler/img/liberal_role.png", filename="role.png")
     embed = discord.Embed(
         title="Liberal",
         description="Liberal is your secret role.",
         color=discord.Color.blue(),
     )
-    embed.set_image(url="attachment://role.png")
-    await ctx.send(file=file, embed=embed)
+    await send_image(
+        ctx, embed, images.asset("secret_hitler/img/liberal_role.png"), "role.png"
+    )
 
 
 @client.command(name="startgame")
 async def start_game(ctx, players: int):
     category = get_category(ctx.guild)
     if category is None:
-        await ctx.send(
-            f"Secret Hitler is not enabled on this server. Please execute {c_prefix}setup to enable it"
+        await reply(
+            ctx,
+            f"Secret Hitler is not enabled on this server. Please execute {c_prefix}setup to enable it",
         )
         return
 
     is_in_game = get_game_with_player(ctx.message.author.id)
     if is_in_game:
-        await ctx.send("You can't create a game, because you already joined one!")
+        await reply(ctx, "You can't create a game, because you already joined one!")
         return
 
     if players > 10 or players < 5:
-        await ctx.send("You have to choose between 5-10 players!")
+        await reply(ctx, "You have to choose between 5-10 players!")
         return
 
-    k = 0
-    for i in running_games.keys():
-        k = i
+    game_id = registry.next_game_id()
 
-    game_id = k + 1
+    # Creating a game is one flow of the guild until the game has a channel
+    def create(request, *args, **kwargs):
+        return scheduler.call(
+            ctx.guild.id,
+            "startgame",
+            NORMAL,
+            functools.partial(request, *args, **kwargs),
+        )
 
-    role = await ctx.guild.create_role(name="game_" + str(game_id) + "_member")
-    admin_role = await ctx.guild.create_role(
-        name="game_" + str(game_id) + "_administrator"
+    role = await create(ctx.guild.create_role, name="game_" + str(game_id) + "_member")
+    admin_role = await create(
+        ctx.guild.create_role, name="game_" + str(game_id) + "_administrator"
     )
-    executed_role = await ctx.guild.create_role(
-        name="game_" + str(game_id) + "_executed"
+    executed_role = await create(
+        ctx.guild.create_role, name="game_" + str(game_id) + "_executed"
     )
-    await ctx.message.author.add_roles(role)
-    await ctx.message.author.add_roles(admin_role)
+    await create(ctx.message.author.add_roles, role, admin_role)
 
-    channel = await category.create_text_channel("game_" + str(game_id))
-    await channel.set_permissions(
+    channel = await create(category.create_text_channel, "game_" + str(game_id))
+    await create(
+        channel.set_permissions,
         ctx.guild.default_role,
         overwrite=discord.PermissionOverwrite(
             read_messages=False, read_message_history=True, send_messages=True
         ),
     )
-    await channel.set_permissions(
+    await create(
+        channel.set_permissions,
         ctx.guild.me,
         overwrite=discord.PermissionOverwrite(
             read_messages=True,
             manage_channels=True,
             add_reactions=True,
-            manage_messages=True
+            manage_messages=True,
         ),
     )
-    await channel.set_permissions(
-        role, overwrite=discord.PermissionOverwrite(read_messages=True)
+    await create(
+        channel.set_permissions,
+        role,
+        overwrite=discord.PermissionOverwrite(read_messages=True),
     )
-    await channel.set_permissions(
-        executed_role, overwrite=discord.PermissionOverwrite(send_messages=False, read_message_history=False, add_reactions=False)
+    await create(
+        channel.set_permissions,
+        executed_role,
+        overwrite=discord.PermissionOverwrite(
+            send_messages=False, read_message_history=False, add_reactions=False
+        ),
     )
 
-    running_games[game_id] = Game(channel.id, game_id, players, ctx.message.author.id)
+    Game(channel.id, game_id, players, ctx.message.author.id, registry)
 
     embed = discord.Embed(
         title="Starting SecretHitler...", description="Waiting for other players"
@@ -391,20 +469,20 @@ async def start_game(ctx, players: int):
         inline=False,
     )
 
-    message = await channel.send(embed=embed)
+    message = await create(channel.send, embed=embed)
 
 
 @client.command(name="invite")
 async def invite(ctx, player: commands.MemberConverter):
     game = get_game_with_player(ctx.message.author.id)
     if game is None:
-        await ctx.send("You can't invite someone because you are not in a game")
+        await reply(ctx, "You can't invite someone because you are not in a game")
         return
 
     is_in_game = get_game_with_player(player.id)
     if is_in_game:
-        await ctx.send(
-            "You can't invite this player because they've already joined a game!"
+        await reply(
+            ctx, "You can't invite this player because they've already joined a game!"
         )
         return
 
@@ -412,9 +490,11 @@ async def invite(ctx, player: commands.MemberConverter):
         ctx.guild.roles, name="game_" + str(game.get_id()) + "_member"
     )
     if not game.add_player(player.id):
-        await ctx.send("This game is already full")
+        await reply(ctx, "This game is already full")
         return
-    await player.add_roles(role)
+    await scheduler.call(
+        ctx.guild.id, game.channel_id, NORMAL, functools.partial(player.add_roles, role)
+    )
     embed = discord.Embed(
         title="Secret Hitler",
         description="You have been added to a SecretHitler game. The round will start as soon enough players have joined",
@@ -425,12 +505,10 @@ async def invite(ctx, player: commands.MemberConverter):
         + str(game.get_id())
         + ". The game will be processed in there. You will receive important information like your role as a Direct Message",
     )
-    await player.send(embed=embed)
+    await scheduled(game, player, NORMAL).send(embed=embed)
 
     if game.start_game():
-        await client.get_channel(game.channel_id).send(
-            "All players joined the game. Let's get it started. Ha."
-        )
+        post(game, content="All players joined the game. Let's get it started. Ha.")
         await send_players_info(game)
         await sendRoles(game)
         await sendBoard(game)
@@ -446,35 +524,39 @@ async def invite(ctx, player: commands.MemberConverter):
         embed.add_field(
             name="Slots", value=str(len(game.players)) + "/" + str(game.max_players)
         )
-        await client.get_channel(game.channel_id).send(embed=embed)
+        post(game, embed=embed)
 
 
 @client.command(name="stopgame")
 async def stop_game(ctx, id: int):
     user = ctx.message.author
     if discord.utils.get(user.roles, name="game_" + str(id) + "_administrator") is None:
-        await ctx.send("You don't have the permission to stop this game")
+        await reply(ctx, "You don't have the permission to stop this game")
         return
 
-    game = running_games[id]
+    game = registry.get_game(id)
     if not game:
-        await ctx.send("This game does not exist")
+        await reply(ctx, "This game does not exist")
         return
     guild = ctx.guild
     role = discord.utils.get(guild.roles, name="game_" + str(id) + "_administrator")
     if role:
-        await role.delete()
+        await scheduler.call(guild.id, game.channel_id, BULK, role.delete)
 
     member_role = discord.utils.get(guild.roles, name="game_" + str(id) + "_member")
     if role:
-        await member_role.delete()
+        await scheduler.call(guild.id, game.channel_id, BULK, member_role.delete)
     channel = client.get_channel(game.channel_id)
     if channel:
-        await channel.delete()
+        await scheduler.call(guild.id, game.channel_id, BULK, channel.delete)
 
-    running_games.pop(id)
+    registry.remove_game(id)
+    journal.remove(id)
+    locks.remove(id)
+    timers.remove(id)
+    drop_status(id)
     try:
-        await ctx.send("The Game with the id: " + str(id) + " has been deleted")
+        await reply(ctx, "The Game with the id: " + str(id) + " has been deleted")
     except discord.errors.NotFound:
         logger.debug("The Game with the id: " + str(id) + " has been deleted")
 
@@ -483,193 +565,83 @@ async def stop_game(ctx, id: int):
 async def nominate(ctx, player: commands.MemberConverter):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
-    if game.president.player_id is not ctx.message.author.id:
-        await ctx.send("You are not the president")
+    if game.president.player_id != ctx.message.author.id:
+        await reply(ctx, "You are not the president")
         return
 
     if not game.has_player(player.id):
-        await ctx.send("This player is not in the same game as you")
+        await reply(ctx, "This player is not in the same game as you")
         return
 
     if game.state is not GameStates.NOMINATION:
-        await ctx.message.delete()
+        await delete_command(ctx, game)
         return
 
     if not game.nominate(player.id):
-        await ctx.send(
-            "This player could not be nominated. They were chancellor or president in the last round"
+        await reply(
+            ctx,
+            "This player could not be nominated. They were chancellor or president in the last round",
         )
         return
 
-    await ctx.message.delete()
-
-    next_president_id: int = (
-        0 if game.president_id >= (len(game.players) - 1) else game.president_id + 1
-    )
-    embed = discord.Embed(
-        title="Player " + player.display_name + " was nominated for chancellor",
-        description="Please react to this message with Ja or Nein to vote.\nVote wisely - "
-        + client.get_user(game.players[next_president_id].player_id).display_name
-        + " will be President next round!",
-        color=discord.Color.dark_red(),
-    )
-
-    embed.set_thumbnail(url=player.display_avatar.url)
-    msg = await client.get_channel(game.channel_id).send(embed=embed)
-    await msg.add_reaction(discord.utils.get(ctx.guild.emojis, name=JA))
-    await msg.add_reaction(discord.utils.get(ctx.guild.emojis, name=NEIN))
+    await delete_command(ctx, game)
+    await start_election(game, player)
 
 
 @client.command(name="discard")
 async def discard(ctx, card):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
-    if (
-        game.president.player_id is not ctx.message.author.id
-        and game.chancellor.player_id is not ctx.message.author.id
+    if game.president.player_id != ctx.message.author.id and (
+        game.chancellor is None or game.chancellor.player_id != ctx.message.author.id
     ):
-        await ctx.send("You are not the president or the chancellor")
+        await reply(ctx, "You are not the president or the chancellor")
         return
 
     if (
         game.state is not GameStates.LEGISLATIVE_PRESIDENT
         and game.state is not GameStates.LEGISLATIVE_CHANCELLOR
     ):
-        await ctx.send("You can't discard a policy now")
+        await reply(ctx, "You can't discard a policy now")
         return
 
     if not game.discard_policy(ctx.message.author.id, card):
-        await ctx.send(
-            f"Policy can't be discarded. You either don't have the permission to do it or you cant discard this policy. Use {c_prefix}discard <f/l>"
-        )
-        return
-
-    await ctx.send("You successfully discarded a policy")
-
-    if game.state == GameStates.LEGISLATIVE_CHANCELLOR:
-        embed = discord.Embed(
-            title="The President discarded a policy",
-            description="Waiting for the chancellor to discard a policy",
-            color=discord.Color.dark_red(),
-        )
-        await client.get_channel(game.channel_id).send(embed=embed)
-        await start_chancellor_legislative(game)
-        return
-
-    await sendBoard(game)
-
-    if game.state == GameStates.NOMINATION:
-        game.set_president()
-        await start_nomination(game)
-        return
-
-    if game.fascist_board == 5:
-        embed = discord.Embed(
-            title="Veto right",
-            description=f"Five fascist policies are enacted. The chancellor can now veto an agenda. Use {c_prefix}veto to do that",
-            color=discord.Color.dark_red(),
-        )
-        await client.get_channel(game.channel_id).send(embed=embed)
-
-    if game.state == GameStates.GAME_OVER:
-        embed = discord.Embed(
-            title="Game over!",
-            description=game.winner
-            + f"s won the game. Use {c_prefix}restart to restart the game.",
-            color=discord.Color.dark_red(),
-        )
-        for player in game.players:
-            embed.add_field(
-                name=client.get_user(player.player_id), value=player.role, inline=False
-            )
-        await client.get_channel(game.channel_id).send(embed=embed)
-        return
-
-    if game.state == GameStates.INVESTIGATION:
-        embed = discord.Embed(
-            title="Investigation",
-            description=f"The current president can now investigate a players party. Please use {c_prefix}investigate <playername> to do that",
-            color=discord.Color.dark_red(),
-        )
-        await client.get_channel(game.channel_id).send(embed=embed)
-        return
-
-    if game.state == GameStates.POLICY_PEEK:
-        game.policy_peek()
-        file = discord.File(
-            "secret_hitler/img/policypeek_" + str(game.game_id) + ".png",
-            filename="president.png",
-        )
-        embed = discord.Embed(
-            title="Policy Peek",
-            description="These are the next three policies.",
-            color=discord.Color.dark_red(),
-        )
-        embed.set_image(url="attachment://president.png")
-        msg = await client.get_user(game.president.player_id).send(
-            embed=embed, file=file
-        )
-        embed = discord.Embed(
-            title="Policy Peek",
-            description="The current president sees the top three policies. Please check your Direct Message!",
-            color=discord.Color.dark_red(),
-        )
-        await client.get_channel(game.channel_id).send(embed=embed)
-        game.set_president()
-        game.state = GameStates.NOMINATION
-        await start_nomination(game)
-        return
-
-    if game.state == GameStates.EXECUTION:
-        embed = discord.Embed(
-            title="Execution",
-            description=f"The current president can execute a player. Please use {c_prefix}execute <playername>",
-            color=discord.Color.dark_red(),
+        await reply(
+            ctx,
+            f"Policy can't be discarded. You either don't have the permission to do it or you cant discard this policy. Use {c_prefix}discard <f/l>",
         )
-        await client.get_channel(game.channel_id).send(embed=embed)
         return
 
-    if game.state == GameStates.SPECIAL_ELECTION:
-        embed = discord.Embed(
-            title="Special Election",
-            description=f"The current president picks the next President. Please use {c_prefix}president <playername>",
-            color=discord.Color.dark_red(),
-        )
-        await client.get_channel(game.channel_id).send(embed=embed)
-        return
+    await reply(ctx, "You successfully discarded a policy")
+    await after_discard(game)
 
 
 @client.command(name="president")
 async def president(ctx, player: commands.UserConverter):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
     if game.state is not GameStates.SPECIAL_ELECTION:
-        await ctx.send("You can't pick a president now")
+        await reply(ctx, "You can't pick a president now")
         return
 
-    if game.president.player_id is not ctx.message.author.id:
-        await ctx.send("You are not the president")
+    if game.president.player_id != ctx.message.author.id:
+        await reply(ctx, "You are not the president")
         return
 
     if not game.has_player(player.id):
-        await ctx.send("This player is not in the same game as you")
+        await reply(ctx, "This player is not in the same game as you")
         return
 
-    player = game.get_player(player.id)
-
-    game.peeked = True
-
-    game.prev_president_id = game.president.player_id
-    game.president = player
+    game.special_election(player.id)
 
     await start_nomination(game)
 
@@ -678,27 +650,22 @@ async def president(ctx, player: commands.UserConverter):
 async def investigate(ctx, player: commands.UserConverter):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
     if game.state is not GameStates.INVESTIGATION:
-        await ctx.send("You can't investigate somebodys role at the moment")
+        await reply(ctx, "You can't investigate somebodys role at the moment")
         return
 
-    if game.president.player_id is not ctx.message.author.id:
-        await ctx.send("You are not the president")
+    if game.president.player_id != ctx.message.author.id:
+        await reply(ctx, "You are not the president")
         return
 
     if not game.has_player(player.id):
-        await ctx.send("This player is not in the same game as you")
+        await reply(ctx, "This player is not in the same game as you")
         return
 
-    party = game.get_player(player.id).get_party()
-
-    if game.fascist_board == 1:
-        game.investigated_one = True
-    else:
-        game.investigated = True
+    party = game.investigate(player.id)
 
     embed = discord.Embed(
         title="Investigation",
@@ -710,11 +677,9 @@ async def investigate(ctx, player: commands.UserConverter):
     )
     embed.set_thumbnail(url=client.get_user(player.id).display_avatar.url)
 
-    await ctx.message.delete()
-
-    await ctx.message.author.send(embed=embed)
+    await delete_command(ctx, game)
 
-    game.set_president()
+    await scheduled(game, ctx.message.author, INTERACTIVE).send(embed=embed)
 
     await start_nomination(game)
 
@@ -723,47 +688,47 @@ async def investigate(ctx, player: commands.UserConverter):
 async def veto(ctx):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
     if game.fascist_board < 5:
-        await ctx.send("The veto right is not enabled yet")
+        await reply(ctx, "The veto right is not enabled yet")
         return
 
     if game.state is not GameStates.LEGISLATIVE_CHANCELLOR:
-        await ctx.send("You can't veto at the moment")
+        await reply(ctx, "You can't veto at the moment")
         return
 
     if (
         game.chancellor is not None
-        and game.chancellor.player_id is not ctx.message.author.id
+        and game.chancellor.player_id != ctx.message.author.id
     ):
-        await ctx.send("You are not the chancellor")
+        await reply(ctx, "You are not the chancellor")
         return
 
-    game.state = GameStates.VETO
+    game.request_veto()
 
     embed = discord.Embed(
         title="Veto",
         description=f"The current chancellor requested veto for this agenda. The president needs to accept ({c_prefix}accept) or decline ({c_prefix}decline) the veto",
         color=discord.Color.dark_red(),
     )
-    await client.get_channel(game.channel_id).send(embed=embed)
+    await announce(game, embed)
 
 
 @client.command(name="accept")
 async def accept(ctx):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
     if game.state is not GameStates.VETO:
-        await ctx.send("You can't accept a veto at the moment")
+        await reply(ctx, "You can't accept a veto at the moment")
         return
 
-    if game.president.player_id is not ctx.message.author.id:
-        await ctx.send("You are not the president")
+    if game.president.player_id != ctx.message.author.id:
+        await reply(ctx, "You are not the president")
         return
 
     embed = discord.Embed(
@@ -771,13 +736,9 @@ async def accept(ctx):
         description="All three policies will be discarded",
         color=discord.Color.dark_red(),
     )
-    await client.get_channel(game.channel_id).send(embed=embed)
+    await announce(game, embed)
 
-    for i in range(len(game.policies)):
-        game.discard.append(game.policies[i])
-    game.policies.clear()
-
-    game.set_president()
+    game.accept_veto()
 
     await start_nomination(game)
 
@@ -786,15 +747,15 @@ async def accept(ctx):
 async def decline(ctx):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
     if game.state is not GameStates.VETO:
-        await ctx.send("You can't accept a veto at the moment")
+        await reply(ctx, "You can't accept a veto at the moment")
         return
 
-    if game.president.player_id is not ctx.message.author.id:
-        await ctx.send("You are not the president")
+    if game.president.player_id != ctx.message.author.id:
+        await reply(ctx, "You are not the president")
         return
 
     embed = discord.Embed(
@@ -802,189 +763,730 @@ async def decline(ctx):
         description="The chancellor has to discard a policy",
         color=discord.Color.dark_red(),
     )
-    await client.get_channel(game.channel_id).send(embed=embed)
+    await announce(game, embed)
 
-    game.state = GameStates.LEGISLATIVE_CHANCELLOR
+    game.decline_veto()
 
 
 @client.command(name="execute")
 async def execute(ctx, player: commands.MemberConverter):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
     if game.state is not GameStates.EXECUTION:
-        await ctx.send("You can't execute somebody at the moment")
+        await reply(ctx, "You can't execute somebody at the moment")
         return
 
-    if game.president.player_id is not ctx.message.author.id:
-        await ctx.send("You are not the president")
+    if game.president.player_id != ctx.message.author.id:
+        await reply(ctx, "You are not the president")
         return
 
     if not game.has_player(player.id):
-        await ctx.send("This player is not in the same game as you")
+        await reply(ctx, "This player is not in the same game as you")
         return
 
-    executed = game.execute_player(player.id)
+    executed = game.execute(player.id)
     if executed is None:
-        await ctx.send("This player could not be executed")
+        await reply(ctx, "This player could not be executed")
         return
 
-    fascists = []
-    liberal = []
-    executed_member = player
-
-    for player in game.players:
-        if player.get_party() == "Fascist":
-            fascists.append(player)
-        elif player.get_party() == "Liberal":
-            liberal.append(player)
+    if game.state == GameStates.GAME_OVER:
+        await send_game_over(game)
+        return
 
-    if executed.role == "Hitler":
-        game.state = GameStates.GAME_OVER
-        game.winner = "Liberal"
-        embed = discord.Embed(
-            title="Game over!",
-            description=game.winner
-            + f"s won the game. Use {c_prefix}restart to restart the game.",
-            color=discord.Color.dark_red(),
-        )
-        for player in game.players:
-            embed.add_field(
-                name=client.get_user(player.player_id).display_name,
-                value=player.role,
-                inline=False,
-            )
-        for player in game.dead:
-            embed.add_field(
-                name=client.get_user(executed.player_id).display_name,
-                value=player.role,
-                inline=False,
-            )
-        await client.get_channel(game.channel_id).send(embed=embed)
-    elif len(game.players) <= 1:
-        game.state = GameStates.GAME_OVER
-        game.winner = game.players[0].get_party()
-        embed = discord.Embed(
-            title="Game over!",
-            description=game.winner
-            + f"s won the game. Use {c_prefix}restart to restart the game.",
-            color=discord.Color.dark_red(),
-        )
-        for player in game.players:
-            embed.add_field(
-                name=client.get_user(player.player_id).display_name,
-                value=player.role,
-                inline=False,
-            )
-        for player in game.dead:
-            embed.add_field(
-                name=client.get_user(executed.player_id).display_name,
-                value=player.role,
-                inline=False,
-            )
-        await client.get_channel(game.channel_id).send(embed=embed)
-    elif len(liberal) == 0:
-        game.state = GameStates.GAME_OVER
-        game.winner = game.players[0].get_party()
-        embed = discord.Embed(
-            title="Game over!",
-            description=f"Liberals won the game. Use {c_prefix}restart to restart the game.",
-            color=discord.Color.dark_red(),
-        )
-        await client.get_channel(game.channel_id).send(embed=embed)
-    elif len(fascists) == 0:
-        game.state = GameStates.GAME_OVER
-        game.winner = game.players[0].get_party()
-        embed = discord.Embed(
-            title="Game over!",
-            description=f"Fascists won the game. Use {c_prefix}restart to restart the game.",
-            color=discord.Color.dark_red(),
-        )
-        await client.get_channel(game.channel_id).send(embed=embed)
-    else:
-        embed = discord.Embed(
-            title="Player executed",
-            description=client.get_user(executed.player_id).display_name
-            + " was executed.",
-        )
-        embed.set_thumbnail(url=client.get_user(executed.player_id).display_avatar.url)
-        await client.get_channel(game.channel_id).send(embed=embed)
+    embed = discord.Embed(
+        title="Player executed",
+        description=client.get_user(executed.player_id).display_name + " was executed.",
+    )
+    embed.set_thumbnail(url=client.get_user(executed.player_id).display_avatar.url)
+    await announce(game, embed)
 
-        executed_roles = discord.utils.get(
-            ctx.guild.roles, name="game_" + str(game.get_id()) + "_executed"
-        )
-        await executed_member.add_roles(executed_roles)
+    executed_roles = discord.utils.get(
+        ctx.guild.roles, name="game_" + str(game.get_id()) + "_executed"
+    )
+    await scheduler.call(
+        ctx.guild.id,
+        game.channel_id,
+        NORMAL,
+        functools.partial(player.add_roles, executed_roles),
+    )
 
-        game.state = GameStates.NOMINATION
-        game.set_president()
-        await start_nomination(game)
+    await start_nomination(game)
 
 
 @client.command(name="restart")
 async def restart(ctx):
     game = get_game_with_player(ctx.message.author.id)
     if not game:
-        await ctx.send("You are not in a game")
+        await reply(ctx, "You are not in a game")
         return
 
     if game.state is not GameStates.GAME_OVER:
-        await ctx.send("Game is not over yet")
+        await reply(ctx, "Game is not over yet")
         return
 
     channel = client.get_channel(game.channel_id)
-    await channel.purge(limit=100)
+    await scheduler.call(
+        ctx.guild.id, game.channel_id, BULK, lambda: channel.purge(limit=100)
+    )
+    # The purge deleted the status message too
+    drop_status(game.game_id)
 
     executed_role = discord.utils.get(
         ctx.guild.roles, name="game_" + str(game.get_id()) + "_executed"
     )
-    for executed in executed_role.members:
-        executed.remove_roles(executed_role)
+    await fan_out(
+        {
+            executed.id: functools.partial(
+                scheduler.call,
+                ctx.guild.id,
+                game.channel_id,
+                NORMAL,
+                functools.partial(executed.remove_roles, executed_role),
+            )
+            for executed in executed_role.members
+        },
+        config.configuration["fanout_concurrency"],
+    )
 
     game.restart_game()
 
     if game.start_game():
-        await client.get_channel(game.channel_id).send(
-            "All players joined the game. Let's get it started. Ha."
-        )
+        post(game, content="All players joined the game. Let's get it started. Ha.")
         await send_players_info(game)
         await sendRoles(game)
         await sendBoard(game)
         await start_nomination(game)
 
 
+def in_game_guild(ctx, game: Game):
+    channel = client.get_channel(game.channel_id)
+    return (
+        channel is not None
+        and ctx.guild is not None
+        and ctx.guild.id == channel.guild.id
+    )
+
+
+@client.command(name="odds")
+async def odds_command(ctx, id: int):
+    game = registry.get_game(id)
+    if not game:
+        await reply(ctx, "This game does not exist")
+        return
+
+    channel = client.get_channel(game.channel_id)
+    if not in_game_guild(ctx, game):
+        await reply(ctx, "This game does not exist")
+        return
+
+    # Players could learn about the deck, so while the game runs the odds are
+    # only for spectators that can see the game channel and for dead players
+    if game.state is not GameStates.GAME_OVER:
+        if get_game_with_player(ctx.message.author.id) is game:
+            await reply(ctx, "You can't see the odds of a game you are playing")
+            return
+        dead = any(player.player_id == ctx.message.author.id for player in game.dead)
+        if not dead and not channel.permissions_for(ctx.message.author).read_messages:
+            await reply(ctx, "You can only see the odds of a game you are watching")
+            return
+
+    result = odds.game_odds(game)
+    embed = discord.Embed(
+        title="Odds of game " + str(id),
+        description="Policies in the deck: "
+        + str(len(game.deck))
+        + ", in the discard pile: "
+        + str(len(game.discard)),
+        color=discord.Color.dark_red(),
+    )
+    embed.add_field(
+        name="Next hand",
+        value="\n".join(
+            f"{fascists} fascist: {p:.1%}" for fascists, p in enumerate(result["draw"])
+        ),
+        inline=False,
+    )
+    embed.add_field(
+        name="Fascist policy enacted",
+        value=f"Liberal government: {result['liberal_government']:.1%}\n"
+        f"Fascist government: {result['fascist_government']:.1%}\n"
+        f"Top deck: {result['top_deck']:.1%}",
+        inline=False,
+    )
+    embed.add_field(
+        name="Liberal policy track win",
+        value=f"{result['liberal_win']:.1%} if {result['p_liberal']:.0%} "
+        "of governments are liberal",
+        inline=False,
+    )
+    await reply(ctx, embed=embed)
+
+
+@client.command(name="recording")
+async def recording_command(ctx, id: int):
+    game = registry.get_game(id)
+    if not game:
+        await reply(ctx, "This game does not exist")
+        return
+
+    # Recordings contain user ids, so they stay with the game's server
+    players = game.players + game.dead
+    if not in_game_guild(ctx, game) and not any(
+        player.player_id == ctx.message.author.id for player in players
+    ):
+        await reply(ctx, "This game does not exist")
+        return
+
+    # The recording contains every role and the order of the deck
+    if game.state is not GameStates.GAME_OVER:
+        await reply(ctx, "The recording is available once the game is over")
+        return
+
+    data = json.dumps(replay.recording(game)).encode()
+    await reply(
+        ctx,
+        "Recording of game " + str(id),
+        file=discord.File(io.BytesIO(data), "game_" + str(id) + ".json"),
+    )
+
+
+# The statistics cover every server the bot is in, so they're for its owner
+@client.command(name="stats")
+@commands.is_owner()
+async def stats_command(ctx):
+    data = bot_stats()
+    embed = discord.Embed(
+        title="Statistics",
+        description=str(data["games"])
+        + " games running. "
+        + str(data["rest"]["global_limits"])
+        + " global rate limits.",
+        color=discord.Color.dark_red(),
+    )
+    # The routes spending the most requests
+    for route, bucket in list(data["rest"]["routes"].items())[:5]:
+        embed.add_field(
+            name=route,
+            value=f"{bucket['requests']} requests, {bucket['rate_limited']} 429s "
+            f"({bucket['retry_after']:.1f}s), used up {bucket['exhausted']} times "
+            f"({bucket['reset_wait']:.1f}s), {bucket['mean_time'] * 1000:.0f}ms",
+            inline=False,
+        )
+    guild = data["guilds"].get(ctx.guild.id) if ctx.guild is not None else None
+    if guild is not None:
+        embed.add_field(
+            name="This server",
+            value=f"{guild['requests']} requests, waited "
+            f"{guild['mean_wait'] * 1000:.0f}ms on average "
+            f"(at most {guild['max_wait'] * 1000:.0f}ms)",
+            inline=False,
+        )
+    outbox_stats = data["outbox"]
+    embed.add_field(
+        name="Outbox",
+        value=f"{outbox_stats['queued']} queued, {outbox_stats['sent']} sent, "
+        f"{outbox_stats['coalesced']} coalesced",
+        inline=False,
+    )
+    await reply(
+        ctx,
+        embed=embed,
+        file=discord.File(
+            io.BytesIO(json.dumps(data, indent=2).encode()), "stats.json"
+        ),
+    )
+
+
+def bot_stats():
+    # Everything the bot measures, JSON compatible
+    return {
+        "games": len(registry.games),
+        "rest": telemetry.stats(),
+        "guilds": scheduler.stats(),
+        "outbox": outbox.stats(),
+        "status": status.stats(),
+        "locks": locks.stats(),
+        "timers": {"scheduled": len(timers.entries), "fired": timers.fired},
+        "journal": {"written": journal.written, "snapshots": journal.snapshots},
+        "render": renderer.stats(),
+        "assets": {"uploads": assets.uploads, "hits": assets.hits},
+        "boards": {
+            "hits": images.board_cache.hits,
+            "misses": images.board_cache.misses,
+            "bytes": images.board_cache.size,
+        },
+    }
+
+
 # Game Handling
 
 
-async def start_chancellor_legislative(game: Game):
-    game.chancellor_legislative()
-    file = discord.File(
-        "secret_hitler/img/chancellor_" + str(game.game_id) + ".png",
-        filename="chancellor.png",
+async def count_votes(game: Game):
+    message_id = game.vote_message_id
+    outcome = game.calculate_votes()
+    if outcome is None:
+        return
+
+    if status_enabled():
+        # The status message shows the result, so the channel keeps only it
+        await delete_message(game.channel_id, message_id)
+
+    if outcome == VoteOutcome.ELECTED:
+        # Start Legislative Session
+        embed = discord.Embed(
+            title="New Chancellor",
+            description=client.get_user(game.chancellor.player_id).display_name
+            + " is the new chancellor. Legislative Session starts now",
+            color=discord.Color.dark_red(),
+        )
+        embed.set_thumbnail(
+            url=client.get_user(game.chancellor.player_id).display_avatar.url
+        )
+        await announce(game, embed)
+        await start_president_legislative(game)
+        return
+
+    if outcome == VoteOutcome.HITLER_ELECTED:
+        await send_game_over(game)
+        return
+
+    if outcome == VoteOutcome.TOP_DECKED:
+        embed = discord.Embed(
+            title="Election Failed three times in a row",
+            description="The election failed three times in a row. The top policy will be revealed",
+            color=discord.Color.dark_red(),
+        )
+        await announce(game, embed)
+        await sendBoard(game)
+        await announce_state(game)
+        return
+
+    embed = discord.Embed(
+        title="Election Failed",
+        description="The vote failed. After 3 failed votes the top policy will be revealed",
+        color=discord.Color.dark_red(),
+    )
+    embed.add_field(name="Failed Votes", value=str(game.failed_votes) + "/3")
+    await announce(game, embed)
+    await start_nomination(game)
+
+
+async def send_to_channel(channel_id, priority=NORMAL, **kwargs):
+    # Board uploads are bulk work, a game's flow is its channel
+    channel = client.get_channel(channel_id)
+    if "file" in kwargs and priority == NORMAL:
+        priority = BULK
+    return await scheduler.call(
+        channel.guild.id, channel_id, priority, lambda: channel.send(**kwargs)
+    )
+
+
+def scheduled(game: Game, target, priority):
+    # Sends to target take their turn in the game's share of the REST budget
+    guild_id = client.get_channel(game.channel_id).guild.id
+    return ScheduledTarget(scheduler, target, guild_id, game.channel_id, priority)
+
+
+# Messages to game channels are queued per channel, so a burst of
+# announcements is sent as one message with several embeds
+outbox = Outbox(send_to_channel, config.configuration["outbox"]["linger"])
+
+
+def post(game: Game, **kwargs):
+    # Queues a message to the game's channel and returns the future of the
+    # sent message, which only needs to be awaited to use the message
+    return outbox.post(game.channel_id, **kwargs)
+
+
+# With the status message enabled every game keeps its announcements in a
+# single pinned message edited in place. announce() replaces the message's
+# prompt, the rest of it is rebuilt from the game on every change.
+def status_enabled():
+    return config.configuration["status_message"]["enabled"]
+
+
+async def create_status(game_id, embed):
+    # Posted alone, edits would replace the embeds merged into its message
+    message = await outbox.post(
+        registry.get_game(game_id).channel_id, alone=True, embed=embed
+    )
+    try:
+        await scheduler.call(message.guild.id, message.channel.id, NORMAL, message.pin)
+    except discord.HTTPException as e:
+        logger.warning("Couldn't pin the status of game %s: %s", game_id, e)
+    return message
+
+
+async def edit_status(message, embed):
+    await scheduler.call(
+        message.guild.id,
+        message.channel.id,
+        NORMAL,
+        functools.partial(message.edit, embed=embed),
     )
+
+
+status = StatusMessages(
+    create_status, edit_status, config.configuration["status_message"]["delay"]
+)
+# game id -> embed of the last announcement and url of the current board
+prompts = {}
+boards = {}
+
+
+async def announce(game: Game, embed, to_channel=False):
+    # Sends an announcement to the game's channel or shows it in the status
+    # message. to_channel sends it to the channel in both modes.
+    if to_channel or not status_enabled():
+        post(game, embed=embed)
+    if status_enabled():
+        prompts[game.game_id] = embed
+        refresh_status(game)
+
+
+def refresh_status(game: Game):
+    if status_enabled() and game.game_id in prompts:
+        status.update(game.game_id, status_embed(game))
+
+
+def status_embed(game: Game):
+    embed = prompts[game.game_id].copy()
+    embed.clear_fields()
+    if game.president is not None:
+        embed.add_field(
+            name="President",
+            value=client.get_user(game.president.player_id).display_name,
+        )
+    if game.chancellor is not None:
+        embed.add_field(
+            name="Chancellor",
+            value=client.get_user(game.chancellor.player_id).display_name,
+        )
+    if game.state == GameStates.ELECTION:
+        embed.add_field(
+            name="Votes", value=str(len(game.votes)) + "/" + str(len(game.players))
+        )
+    embed.add_field(name="Liberal policies", value=str(game.liberal_board) + "/5")
+    embed.add_field(name="Fascist policies", value=str(game.fascist_board) + "/6")
+    embed.add_field(name="Failed elections", value=str(game.failed_votes) + "/3")
+    if game.game_id in boards:
+        embed.set_image(url=boards[game.game_id])
+    return embed
+
+
+def drop_status(game_id):
+    status.remove(game_id)
+    prompts.pop(game_id, None)
+    boards.pop(game_id, None)
+
+
+async def delete_message(channel_id, message_id):
+    if message_id is None:
+        return
+    message = client.get_channel(channel_id).get_partial_message(message_id)
+    try:
+        await scheduler.call(message.guild.id, channel_id, NORMAL, message.delete)
+    except discord.HTTPException as e:
+        logger.warning("Couldn't delete message " + str(message_id) + ": " + str(e))
+
+
+# Executive powers the president is asked to use, by the state the power
+# table in game.py moves the game to
+POWER_ANNOUNCEMENTS = {
+    GameStates.INVESTIGATION: (
+        "Investigation",
+        f"The current president can now investigate a players party. Please use {c_prefix}investigate <playername> to do that",
+    ),
+    GameStates.SPECIAL_ELECTION: (
+        "Special Election",
+        f"The current president picks the next President. Please use {c_prefix}president <playername>",
+    ),
+    GameStates.EXECUTION: (
+        "Execution",
+        f"The current president can execute a player. Please use {c_prefix}execute <playername>",
+    ),
+}
+
+
+async def announce_state(game: Game):
+    # Announces what happens next after a policy was enacted
+    if game.state == GameStates.GAME_OVER:
+        await send_game_over(game)
+    elif game.state == GameStates.NOMINATION:
+        await start_nomination(game)
+    elif game.state == GameStates.POLICY_PEEK:
+        await start_policy_peek(game)
+    else:
+        title, description = POWER_ANNOUNCEMENTS[game.state]
+        embed = discord.Embed(
+            title=title, description=description, color=discord.Color.dark_red()
+        )
+        await announce(game, embed)
+
+
+async def send_game_over(game: Game):
+    embed = discord.Embed(
+        title="Game over!",
+        description=game.winner
+        + f"s won the game. Use {c_prefix}restart to restart the game.",
+        color=discord.Color.dark_red(),
+    )
+    for player in game.players + game.dead:
+        embed.add_field(
+            name=client.get_user(player.player_id).display_name,
+            value=player.role,
+            inline=False,
+        )
+    await announce(game, embed, to_channel=True)
+
+
+async def start_policy_peek(game: Game):
+    hand = await renderer.render(images.policy_hand, game.policy_peek())
+    embed = discord.Embed(
+        title="Policy Peek",
+        description="These are the next three policies.",
+        color=discord.Color.dark_red(),
+    )
+    await send_file(
+        scheduled(game, client.get_user(game.president.player_id), INTERACTIVE),
+        embed,
+        hand,
+        "president.png",
+    )
+    embed = discord.Embed(
+        title="Policy Peek",
+        description="The current president sees the top three policies. Please check your Direct Message!",
+        color=discord.Color.dark_red(),
+    )
+    await announce(game, embed)
+    game.finish_policy_peek()
+    await start_nomination(game)
+
+
+def turn_key(game: Game):
+    # A turn ends when the state, the president or a track changes
+    president = game.president.player_id if game.president else None
+    return (
+        game.state.name,
+        president,
+        game.liberal_board,
+        game.fascist_board,
+        game.failed_votes,
+    )
+
+
+def timer_steps(state: GameStates):
+    # Seconds after the start of a turn its reminders and its timeout are due
+    settings = config.configuration["timers"].get(state.name)
+    if settings is None:
+        return []
+    steps = sorted(settings["reminders"])
+    if settings["timeout"] is not None:
+        steps.append(settings["timeout"])
+    return steps
+
+
+def track_turn(game: Game):
+    steps = timer_steps(game.state)
+    timers.track(game.game_id, turn_key(game), steps[0] if steps else None)
+
+
+def waiting_for(game: Game):
+    if game.state == GameStates.ELECTION:
+        return [p for p in game.players if p.player_id not in game.votes]
+    if game.state == GameStates.LEGISLATIVE_CHANCELLOR:
+        return [game.chancellor]
+    return [game.president]
+
+
+async def on_turn_timer(game_id, turn, step):
+    game = registry.get_game(game_id)
+    if game is None:
+        return
+
+    async with locks.hold(game_id):
+        if turn_key(game) != turn:
+            return
+
+        steps = timer_steps(game.state)
+        if step + 1 < len(steps):
+            timers.schedule(game_id, steps[step + 1] - steps[step], (turn, step + 1))
+
+        settings = config.configuration["timers"][game.state.name]
+        if step < len(settings["reminders"]):
+            await send_reminder(game, settings["timeout"], steps[step])
+        elif not await take_turn(game):
+            # The turn can't be played for them, try again after another
+            # timeout instead of leaving the game without a timer
+            timers.schedule(game_id, settings["timeout"], (turn, step))
+            await send_reminder(game, settings["timeout"], 0)
+        game_changed(game)
+
+
+async def send_reminder(game: Game, timeout, elapsed):
+    # Mentions only notify in a message's content, not in an embed, so the
+    # reminder is always posted, in the status message mode too
+    mentions = " ".join(f"<@{player.player_id}>" for player in waiting_for(game))
+    description = "The game is waiting for you."
+    if timeout is not None:
+        description = (
+            description + f" Your turn is taken for you in {timeout - elapsed} seconds."
+        )
+    embed = discord.Embed(
+        title="Reminder", description=description, color=discord.Color.dark_red()
+    )
+    post(game, content=mentions, embed=embed)
+
+
+async def take_turn(game: Game):
+    # Plays a timed out turn: a random nomination, nein for every missing
+    # vote, a random discard or declining the veto. Returns False if the turn
+    # can't be played, when nobody can be nominated.
+    state = game.state
+    if state == GameStates.NOMINATION:
+        candidates = game.nominees()
+        if not candidates:
+            return False
+
+    embed = discord.Embed(
+        title="Time is up",
+        description=", ".join(
+            client.get_user(player.player_id).display_name
+            for player in waiting_for(game)
+        )
+        + " didn't play in time. The turn is taken for them.",
+        color=discord.Color.dark_red(),
+    )
+    await announce(game, embed)
+
+    if state == GameStates.NOMINATION:
+        candidate = random.choice(candidates)
+        game.nominate(candidate.player_id)
+        await start_election(game, client.get_user(candidate.player_id))
+    elif state == GameStates.ELECTION:
+        for player in waiting_for(game):
+            game.vote(player.player_id, "n")
+        await count_votes(game)
+    elif state == GameStates.LEGISLATIVE_PRESIDENT:
+        game.discard_policy(game.president.player_id, random.choice(game.policies))
+        await after_discard(game)
+    elif state == GameStates.LEGISLATIVE_CHANCELLOR:
+        game.discard_policy(game.chancellor.player_id, random.choice(game.policies))
+        await after_discard(game)
+    elif state == GameStates.VETO:
+        game.decline_veto()
+        embed = discord.Embed(
+            title="Veto declined",
+            description="The chancellor has to discard a policy",
+            color=discord.Color.dark_red(),
+        )
+        await announce(game, embed)
+    return True
+
+
+# (guild id, name) -> emoji, saves scanning the guild's emojis every election
+vote_emojis = {}
+
+
+def vote_emoji(guild, name):
+    emoji = vote_emojis.get((guild.id, name))
+    if emoji is None:
+        emoji = discord.utils.get(guild.emojis, name=name)
+        if emoji is not None:
+            vote_emojis[(guild.id, name)] = emoji
+    return emoji
+
+
+async def start_election(game: Game, nominee):
+    next_president_id: int = (
+        0 if game.president_id >= (len(game.players) - 1) else game.president_id + 1
+    )
+    buttons = config.configuration["voting"] == "buttons"
+    embed = discord.Embed(
+        title="Player " + nominee.display_name + " was nominated for chancellor",
+        description=(VOTE_BUTTONS if buttons else VOTE_REACTIONS)
+        + "\nVote wisely - "
+        + client.get_user(game.players[next_president_id].player_id).display_name
+        + " will be President next round!",
+        color=discord.Color.dark_red(),
+    )
+
+    embed.set_thumbnail(url=nominee.display_avatar.url)
+    if buttons:
+        msg = await post(game, priority=INTERACTIVE, embed=embed, view=VoteView())
+        game.set_vote_message(msg.id)
+        return
+
+    msg = await post(game, priority=INTERACTIVE, embed=embed)
+    channel = msg.channel
+    game.set_vote_message(msg.id)
+    for name in (JA, NEIN):
+        await scheduler.call(
+            channel.guild.id,
+            game.channel_id,
+            INTERACTIVE,
+            functools.partial(msg.add_reaction, vote_emoji(channel.guild, name)),
+        )
+
+
+async def after_discard(game: Game):
+    if game.state == GameStates.LEGISLATIVE_CHANCELLOR:
+        embed = discord.Embed(
+            title="The President discarded a policy",
+            description="Waiting for the chancellor to discard a policy",
+            color=discord.Color.dark_red(),
+        )
+        await announce(game, embed)
+        await start_chancellor_legislative(game)
+        return
+
+    await sendBoard(game)
+
+    if game.fascist_board == 5 and game.state not in (
+        GameStates.NOMINATION,
+        GameStates.GAME_OVER,
+    ):
+        embed = discord.Embed(
+            title="Veto right",
+            description=f"Five fascist policies are enacted. The chancellor can now veto an agenda. Use {c_prefix}veto to do that",
+            color=discord.Color.dark_red(),
+        )
+        await announce(game, embed)
+
+    await announce_state(game)
+
+
+async def start_chancellor_legislative(game: Game):
+    hand = await renderer.render(images.policy_hand, game.chancellor_legislative())
     embed = discord.Embed(
         title="Policies",
         description=f"These are the three new policies. Use {c_prefix}discard <f/l> to discard a policy",
         color=discord.Color.dark_red(),
     )
-    embed.set_image(url="attachment://chancellor.png")
-    msg = await client.get_user(game.chancellor.player_id).send(embed=embed, file=file)
+    msg = await send_file(
+        scheduled(game, client.get_user(game.chancellor.player_id), INTERACTIVE),
+        embed,
+        hand,
+        "chancellor.png",
+    )
 
 
 async def start_president_legislative(game: Game):
-    game.president_legislative()
-    file = discord.File(
-        "secret_hitler/img/president_" + str(game.game_id) + ".png",
-        filename="president.png",
-    )
+    hand = await renderer.render(images.policy_hand, game.president_legislative())
     embed = discord.Embed(
         title="Policies",
         description=f"These are the three new policies. Use {c_prefix}discard <f/l> to discard a policy",
         color=discord.Color.dark_red(),
     )
-    embed.set_image(url="attachment://president.png")
-    msg = await client.get_user(game.president.player_id).send(embed=embed, file=file)
+    msg = await send_file(
+        scheduled(game, client.get_user(game.president.player_id), INTERACTIVE),
+        embed,
+        hand,
+        "president.png",
+    )
 
 
 async def cleanup(guild):
@@ -994,18 +1496,21 @@ async def cleanup(guild):
     if category is not None:
         for c in category.channels:
             logger.debug("Deleting channel: " + c.name)
-            await c.delete()
+            await scheduler.call(guild.id, "setup", BULK, c.delete)
             logger.debug("Deleted channel: " + c.name)
         logger.debug("Deleting category: " + category.name)
-        await category.delete()
+        await scheduler.call(guild.id, "setup", BULK, category.delete)
         logger.debug("Deleted category: " + category.name)
 
     for e in await guild.fetch_emojis():
         if e.user.id == client.user.id:
             logger.debug("Deleting emoji: " + e.name)
-            await e.delete()
+            await scheduler.call(guild.id, "setup", BULK, e.delete)
             logger.debug("Deleted emoji: " + e.name)
 
+    for key in [key for key in vote_emojis if key[0] == guild.id]:
+        del vote_emojis[key]
+
     logger.info("Completed cleanup of emojis and channels")
 
 
@@ -1017,7 +1522,12 @@ async def get_channel(name, category):
         return c
 
     logger.debug("Creating channel: " + name)
-    channel = await category.create_text_channel(name=name)
+    channel = await scheduler.call(
+        category.guild.id,
+        "setup",
+        BULK,
+        functools.partial(category.create_text_channel, name=name),
+    )
     logger.debug("Created channel: " + name)
 
     return channel
@@ -1030,7 +1540,14 @@ async def setup(guild):
     category = get_category(guild)
     if category is None:
         logger.debug("Creating category: " + config.configuration["category"])
-        category = await guild.create_category(name=config.configuration["category"])
+        category = await scheduler.call(
+            guild.id,
+            "setup",
+            BULK,
+            functools.partial(
+                guild.create_category, name=config.configuration["category"]
+            ),
+        )
         logger.debug("Created category: " + category.name)
     else:
         logger.debug("Found existing category: " + category.name)
@@ -1047,7 +1564,12 @@ async def setup(guild):
         with open(efile, "rb") as image:
             f = image.read()
             b = bytearray(f)
-        await guild.create_custom_emoji(name=ename, image=b)
+        await scheduler.call(
+            guild.id,
+            "setup",
+            BULK,
+            functools.partial(guild.create_custom_emoji, name=ename, image=b),
+        )
         logger.debug("Added custom emoji: " + ename)
 
     logger.info("Setup completed")
@@ -1086,7 +1608,7 @@ async def start_nomination(game: Game):
         url=client.get_user(game.president.player_id).display_avatar.url
     )
     game.start_nomination()
-    await client.get_channel(game.channel_id).send(embed=embed)
+    await announce(game, embed)
 
 
 def get_category(guild):
@@ -1098,10 +1620,32 @@ def get_category(guild):
 
 
 def get_game_with_player(player):
-    for k, game in running_games.items():
-        if game.has_player(player):
-            return game
-    return None
+    return registry.get_game_with_player(player)
+
+
+def save_game(game: Game):
+    # Serialising is cheap, writing happens on the journal's thread
+    journal.record(game.game_id, game.to_dict())
+
+
+def game_changed(game: Game):
+    # An event that waited for the lock of a stopped game must not journal
+    # it again
+    if registry.get_game(game.game_id) is not game:
+        return
+    save_game(game)
+    track_turn(game)
+    refresh_status(game)
+
+
+def restore_games():
+    start = time.perf_counter()
+    for state in journal.games().values():
+        track_turn(Game.from_dict(state, registry))
+    logger.info(
+        f"Restored {len(registry.games)} games in "
+        f"{(time.perf_counter() - start) * 1000:.1f}ms"
+    )
 
 
 async def send_players_info(game: Game):
@@ -1115,20 +1659,78 @@ async def send_players_info(game: Game):
             name="Player " + str(i + 1),
             value=str(client.get_user(game.players[i].player_id).display_name),
         )
-    await client.get_channel(game.channel_id).send(embed=embed)
+    post(game, embed=embed)
+
+
+def set_asset_channel():
+    # Images are uploaded to a channel configured by the bot's owner, never to
+    # a channel of a server whose admins could read or delete the uploads
+    channel_id = config.configuration["asset_channel_id"]
+    if channel_id is None:
+        return
+    channel = client.get_channel(channel_id)
+    if channel is None:
+        logger.warning("Asset channel " + str(channel_id) + " not found")
+        return
+    # Asset uploads are bulk work of the server hosting the channel
+    assets.setChannel(
+        ScheduledTarget(scheduler, channel, channel.guild.id, "assets", BULK)
+    )
+
+
+async def send_image(target, embed, data, filename):
+    # Reference the uploaded asset if there is one, otherwise attach the image
+    url = await assets.get_url(data, filename)
+    if url is not None:
+        embed.set_image(url=url)
+        return await target.send(embed=embed)
+    return await send_file(target, embed, data, filename)
+
+
+async def send_file(target, embed, data, filename):
+    # Secret images like policy hands are always attached: an upload to the
+    # asset channel would show when which hand was drawn
+    embed.set_image(url="attachment://" + filename)
+    file = discord.File(io.BytesIO(data), filename=filename)
+    return await target.send(embed=embed, file=file)
 
 
 async def sendBoard(game: Game):
-    game.printBoard()
-    liberal = discord.File(game.return_path_to_liberal_board())
-    fascist = discord.File(game.return_path_to_fascist_board())
-    await client.get_channel(game.channel_id).send(file=liberal)
-    await client.get_channel(game.channel_id).send(file=fascist)
+    board_config = config.configuration["board"]
+    if board_config["combined"] or status_enabled():
+        board = await renderer.render(
+            images.combined_board,
+            game.max_players,
+            game.liberal_board,
+            game.fascist_board,
+            board_config["width"],
+            board_config["format"],
+        )
+        filename = "board." + images.file_extension(board_config["format"])
+        # The status message can only show an uploaded board
+        url = await assets.get_url(board, filename) if status_enabled() else None
+        if url is not None:
+            boards[game.game_id] = url
+            refresh_status(game)
+            return
+        await send_image(
+            outbox.channel(game.channel_id), discord.Embed(), board, filename
+        )
+        return
+
+    liberal_board = await renderer.render(images.liberal_board, game.liberal_board)
+    fascist_board = await renderer.render(
+        images.fascist_board, game.max_players, game.fascist_board
+    )
+    channel = outbox.channel(game.channel_id)
+    await send_image(channel, discord.Embed(), liberal_board, "liberal.png")
+    await send_image(channel, discord.Embed(), fascist_board, "fascist.png")
 
 
 async def sendRoles(game: Game):
     hitler = None
     fascists = []
+    liberals = []
     for player in game.players:
         if player.role is None:
             return
@@ -1137,18 +1739,23 @@ async def sendRoles(game: Game):
         elif player.role == "Fascist":
             fascists.append(player)
         elif player.role == "Liberal":
-            file = discord.File(
-                "secret_hitler/img/liberal_role.png", filename="role.png"
-            )
-            embed = discord.Embed(
-                title="Liberal",
-                description="Liberal is your secret role.",
-                color=discord.Color.blue(),
-            )
-            embed.set_image(url="attachment://role.png")
-            await client.get_user(player.player_id).send(file=file, embed=embed)
+            liberals.append(player)
+
+    sends = {}
+    for player in liberals:
+        embed = discord.Embed(
+            title="Liberal",
+            description="Liberal is your secret role.",
+            color=discord.Color.blue(),
+        )
+        sends[player.player_id] = functools.partial(
+            send_image,
+            scheduled(game, client.get_user(player.player_id), NORMAL),
+            embed,
+            images.asset("secret_hitler/img/liberal_role.png"),
+            "role.png",
+        )
 
-    file = discord.File("secret_hitler/img/hitler_role.png", filename="role.png")
     embed = discord.Embed(
         title="Hitler",
         description="Hitler is your secret role.",
@@ -1158,11 +1765,15 @@ async def sendRoles(game: Game):
     # if len(game.players) <= 6 and len(fascists) > 0:
     #    embed.add_field(name="Fascist", value="The fascist is "+client.get_user(fascists[0].player_id).display_name)
 
-    embed.set_image(url="attachment://role.png")
-    await client.get_user(hitler.player_id).send(file=file, embed=embed)
+    sends[hitler.player_id] = functools.partial(
+        send_image,
+        scheduled(game, client.get_user(hitler.player_id), NORMAL),
+        embed,
+        images.asset("secret_hitler/img/hitler_role.png"),
+        "role.png",
+    )
 
     for player in fascists:
-        file = discord.File("secret_hitler/img/fascist_role.png", filename="role.png")
         embed = discord.Embed(
             title="Fascist",
             description="Fascist is your secret role.",
@@ -1180,8 +1791,42 @@ async def sendRoles(game: Game):
                     value=client.get_user(fas.player_id).display_name,
                     inline=False,
                 )
-        embed.set_image(url="attachment://role.png")
-        await client.get_user(player.player_id).send(file=file, embed=embed)
+        sends[player.player_id] = functools.partial(
+            send_image,
+            scheduled(game, client.get_user(player.player_id), NORMAL),
+            embed,
+            images.asset("secret_hitler/img/fascist_role.png"),
+            "role.png",
+        )
+
+    result = await fan_out(sends, config.configuration["fanout_concurrency"])
+    logger.debug(
+        "Sent roles of game %s to %d players in %.1fms",
+        game.game_id,
+        len(result.sent),
+        result.elapsed * 1000,
+    )
+    await report_failed_sends(game, result, "their secret role")
+
+
+async def report_failed_sends(game: Game, result, what):
+    if not result.failed:
+        return
+    embed = discord.Embed(
+        title="Direct Message failed",
+        description=f"Some players couldn't receive {what}. Please allow Direct Messages from this server",
+        color=discord.Color.dark_red(),
+    )
+    for player_id, error in result.failed.items():
+        logger.warning(
+            "Couldn't send " + what + " to " + str(player_id) + ": " + str(error)
+        )
+        embed.add_field(
+            name=client.get_user(player_id).display_name,
+            value=str(error),
+            inline=False,
+        )
+    post(game, embed=embed)
 
 
 # Tasks
@@ -1293,6 +1938,21 @@ async def printHelp(channel):
     embed.add_field(
         name=f"{c_prefix}execute <playername>", value="Executes a player", inline=False
     )
+    embed.add_field(
+        name=f"{c_prefix}odds <id>",
+        value="Shows the policy odds of a game you are spectating or that is over",
+        inline=False,
+    )
+    embed.add_field(
+        name=f"{c_prefix}recording <id>",
+        value="Sends the recording of a finished game, to replay it without Discord",
+        inline=False,
+    )
+    embed.add_field(
+        name=f"{c_prefix}stats",
+        value="Shows how many requests the bot sends and how often it is rate limited (bot owner only)",
+        inline=False,
+    )
     embed.add_field(
         name=f"{c_prefix}setup",
         value="Creates a Secret Hitler section in the discord and configures it for running games",
@@ -1310,4 +1970,7 @@ token = os.getenv("SECRET_HITLER_DISCORD_TOKEN")
 if token is None:
     raise RuntimeError("SECRET_HITLER_DISCORD_TOKEN environment variable not set")
 
+restore_games()
 client.run(token)
+# Writes what is still queued
+journal.close()
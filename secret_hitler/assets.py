@@ -0,0 +1,61 @@
+import asyncio
+import hashlib
+import io
+import logging
+import time
+
+import discord
+
+logger = logging.getLogger("secret_hitler")
+
+
+class AssetCache:
+    # Uploads images once to a bot owned channel and remembers the CDN url
+    # by content hash, so embeds can reference the url instead of attaching
+    # the same file again. Attachment urls are signed and expire, so they
+    # are uploaded again after ttl seconds.
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._channel = None
+        self.urls = {}
+        self.pending = {}
+        self.uploads = 0
+        self.hits = 0
+
+    def setChannel(self, channel=None):
+        self._channel = channel
+        self.urls.clear()
+
+    def get_channel(self):
+        return self._channel
+
+    async def get_url(self, data, filename):
+        if self._channel is None:
+            return None
+
+        key = hashlib.sha256(data).hexdigest()
+        cached = self.urls.get(key)
+        if cached is not None and time.monotonic() - cached[1] < self.ttl:
+            self.hits = self.hits + 1
+            return cached[0]
+
+        # Concurrent requests for the same image share one upload
+        if key in self.pending:
+            return await asyncio.shield(self.pending[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        url = None
+        try:
+            msg = await self._channel.send(
+                file=discord.File(io.BytesIO(data), filename=filename)
+            )
+            url = msg.attachments[0].url
+            self.uploads = self.uploads + 1
+            self.urls[key] = (url, time.monotonic())
+        except discord.HTTPException as e:
+            logger.warning("Couldn't upload asset " + filename + ": " + str(e))
+        finally:
+            del self.pending[key]
+            future.set_result(url)
+        return url
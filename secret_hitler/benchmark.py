@@ -0,0 +1,78 @@
+import argparse
+import random
+import time
+import tracemalloc
+
+from secret_hitler import config
+from secret_hitler.simulator import RandomAgent, Simulator
+
+
+def player_counts():
+    # 2-4 players are testing configurations that can't finish a game
+    return sorted(n for n in config.configuration if isinstance(n, int) and n >= 5)
+
+
+def percentile(values, q):
+    return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+def throughput(max_players, games, seed):
+    sim = Simulator(max_players, RandomAgent(random.Random(seed)), seed=seed)
+    transitions = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        transitions = transitions + sim.play().transitions
+    elapsed = time.perf_counter() - start
+    return games / elapsed, transitions / elapsed
+
+
+def latencies(max_players, games, seed):
+    timings = {}
+    sim = Simulator(max_players, RandomAgent(random.Random(seed)), timings, seed)
+    for _ in range(games):
+        sim.play()
+    return {method: sorted(values) for method, values in timings.items()}
+
+
+def peak_memory(max_players, games, seed):
+    tracemalloc.start()
+    sim = Simulator(max_players, RandomAgent(random.Random(seed)), seed=seed)
+    for _ in range(games):
+        sim.play()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(games, seed):
+    for max_players in player_counts():
+        games_per_sec, transitions_per_sec = throughput(max_players, games, seed)
+        peak = peak_memory(max_players, max(1, games // 10), seed)
+        print(
+            f"{max_players} players: {games_per_sec:,.0f} games/s, "
+            f"{transitions_per_sec:,.0f} transitions/s, "
+            f"peak memory {peak / 1024:,.1f} KiB"
+        )
+
+        timings = latencies(max_players, max(1, games // 10), seed)
+        for method, values in sorted(timings.items()):
+            print(
+                f"    {method:<24} n={len(values):<8} "
+                f"p50={percentile(values, 50) / 1000:8.2f}us "
+                f"p90={percentile(values, 90) / 1000:8.2f}us "
+                f"p99={percentile(values, 99) / 1000:8.2f}us"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Secret Hitler engine with simulated games"
+    )
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.games, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,22 @@
 configuration = {
+    # roles of every player count and the executive power granted by each
+    # fascist policy, from the first to the fifth. Powers are "investigation",
+    # "special_election", "policy_peek" or "execution", None grants nothing.
     # Only for testing
     2: {
        "roles": [
            "Liberal",
            "Hitler"
-       ]
+       ],
+       "powers": [None, None, "policy_peek", "execution", "execution"]
     },
     3: {
         "roles": [
             "Liberal",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": [None, None, "policy_peek", "execution", "execution"]
     },
     4: {
         "roles": [
@@ -19,7 +24,8 @@ configuration = {
             "Liberal",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": [None, None, "policy_peek", "execution", "execution"]
     },
     5: {
         "roles": [
@@ -28,7 +34,8 @@ configuration = {
             "Liberal",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": [None, None, "policy_peek", "execution", "execution"]
     },
     6: {
         "roles": [
@@ -38,7 +45,8 @@ configuration = {
             "Liberal",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": [None, None, "policy_peek", "execution", "execution"]
     },
     7: {
         "roles": [
@@ -49,7 +57,8 @@ configuration = {
             "Fascist",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": [None, "investigation", "special_election", "execution", "execution"]
     },
     8: {
         "roles": [
@@ -61,7 +70,8 @@ configuration = {
             "Fascist",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": [None, "investigation", "special_election", "execution", "execution"]
     },
     9: {
         "roles": [
@@ -74,7 +84,8 @@ configuration = {
             "Fascist",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": ["investigation", "investigation", "special_election", "execution", "execution"]
     },
     10: {
         "roles": [
@@ -88,7 +99,8 @@ configuration = {
             "Fascist",
             "Fascist",
             "Hitler"
-        ]
+        ],
+        "powers": ["investigation", "investigation", "special_election", "execution", "execution"]
     },
     "liberal_board": [
         (173,90),
@@ -115,5 +127,75 @@ configuration = {
         "secret_hitler_fascist_policy": "secret_hitler/img/policy_fascist.png",
     },
     # category name
-    "category": "Secret Hitler"
+    "category": "Secret Hitler",
+    # id of a channel only the bot's owner and the bot can see (e.g. in a
+    # private server) that static images are uploaded to once, their urls
+    # are then reused by embeds until they expire after asset_ttl seconds.
+    # None attaches the images to every message instead.
+    "asset_channel_id": None,
+    "asset_ttl": 12 * 60 * 60,
+    # memory budget for rendered board images shared by all games
+    "board_cache_bytes": 16 * 1024 * 1024,
+    # combined sends both tracks stacked in a single message
+    # format is one of "PNG", "PNG8" (palette quantized) or "WEBP"
+    "board": {
+        "combined": False,
+        "width": 800,
+        "format": "PNG8"
+    },
+    # size of the discord.py message cache, voting doesn't depend on it
+    "max_messages": 100,
+    # how many direct messages are sent at once when messaging all players
+    "fanout_concurrency": 5,
+    # pool that renders images off the event loop ("thread" or "process")
+    "render": {
+        "executor": "thread",
+        "workers": 2,
+        "max_queue": 32
+    },
+    # sqlite file the running games are journaled to, games are folded into
+    # a snapshot every snapshot_every records
+    "journal": {
+        "path": "secret_hitler.db",
+        "snapshot_every": 50
+    },
+    # how players vote on a nomination: "reactions" with the custom Ja/Nein
+    # emojis or "buttons", which need one API call per vote and no emojis
+    "voting": "reactions",
+    # REST requests per second (and burst) the bot spends before requests
+    # queue up and are shared fairly between guilds and their games. Discord
+    # allows a bot 50 requests per second in total.
+    "rest": {
+        "rate": 40,
+        "burst": 10
+    },
+    # messages to a game channel wait linger seconds in a queue per channel,
+    # consecutive embeds are then sent together as one message
+    "outbox": {
+        "linger": 0.05
+    },
+    # keep the announcements of a game in one pinned message that is edited
+    # in place (president, chancellor, votes, tracks and the current prompt)
+    # instead of posting a message for every phase. Updates within delay
+    # seconds of each other are sent as a single edit.
+    "status_message": {
+        "enabled": False,
+        "delay": 1.5
+    },
+    # turn timers per game state: seconds after the turn started the players
+    # are reminded and after which the turn is played for them (a random
+    # nomination, nein votes, a random discard or declining the veto).
+    # Turns are only reminded by default, set a timeout (e.g. 300) to play
+    # them automatically. Executive powers can't time out. Remove a state to
+    # disable its timer.
+    "timers": {
+        "NOMINATION": {"reminders": [120], "timeout": None},
+        "ELECTION": {"reminders": [120], "timeout": None},
+        "LEGISLATIVE_PRESIDENT": {"reminders": [120], "timeout": None},
+        "LEGISLATIVE_CHANCELLOR": {"reminders": [120], "timeout": None},
+        "VETO": {"reminders": [60], "timeout": None},
+        "INVESTIGATION": {"reminders": [120, 600], "timeout": None},
+        "SPECIAL_ELECTION": {"reminders": [120, 600], "timeout": None},
+        "EXECUTION": {"reminders": [120, 600], "timeout": None}
+    }
 }
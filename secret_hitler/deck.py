@@ -0,0 +1,69 @@
+import random
+
+LIBERAL_POLICIES = 6
+FASCIST_POLICIES = 11
+
+
+class Deck:
+    # The policy pile as a string of "L" and "F" with a cursor on the top card.
+    # Drawing moves the cursor and peeking slices, so both are O(1) and the
+    # pile takes a few dozen bytes. Compares equal to any sequence of the same
+    # cards so it can be used where a list of policies was used before.
+    __slots__ = ("cards", "top")
+
+    def __init__(self, cards=()):
+        self.cards = "".join(cards)
+        self.top = 0
+
+    @classmethod
+    def full(cls):
+        return cls("L" * LIBERAL_POLICIES + "F" * FASCIST_POLICIES)
+
+    def draw(self):
+        card = self.cards[self.top]
+        self.top = self.top + 1
+        return card
+
+    def peek(self, count=3):
+        # The top cards without removing them
+        return self.cards[self.top : self.top + count]
+
+    def put_back(self, cards):
+        # Returns cards to the top, the first card ends up on top
+        top = self.top - len(cards)
+        if top >= 0 and self.cards.startswith(cards, top):
+            self.top = top
+        else:
+            self.cards = cards + self.cards[self.top :]
+            self.top = 0
+
+    def shuffle(self, rng=random):
+        self.refill(self.cards[self.top :], rng)
+
+    def refill(self, cards, rng=random):
+        # Replaces the pile with the given cards in random order
+        self.cards = "".join(rng.sample(cards, len(cards)))
+        self.top = 0
+
+    def count(self, card):
+        return self.cards.count(card, self.top)
+
+    def __len__(self):
+        return len(self.cards) - self.top
+
+    def __iter__(self):
+        return iter(self.cards[self.top :])
+
+    def __getitem__(self, index):
+        return self.cards[self.top :][index]
+
+    def __eq__(self, other):
+        if isinstance(other, Deck):
+            return self.cards[self.top :] == other.cards[other.top :]
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return "Deck(" + repr(self.cards[self.top :]) + ")"
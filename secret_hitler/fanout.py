@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+
+class FanOutResult:
+    def __init__(self):
+        self.sent = []
+        self.failed = {}
+        self.elapsed = 0.0
+
+
+async def fan_out(sends, limit):
+    # sends maps a recipient to a coroutine function delivering its message.
+    # At most limit sends run at once and a failing recipient (e.g. closed
+    # DMs) is recorded without cancelling the others.
+    result = FanOutResult()
+    slots = asyncio.Semaphore(limit)
+    start = time.perf_counter()
+
+    async def send(recipient, deliver):
+        async with slots:
+            try:
+                await deliver()
+                result.sent.append(recipient)
+            except Exception as e:
+                result.failed[recipient] = e
+
+    await asyncio.gather(
+        *(send(recipient, deliver) for recipient, deliver in sends.items())
+    )
+    result.elapsed = time.perf_counter() - start
+    return result
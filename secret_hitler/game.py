@@ -1,12 +1,14 @@
+import functools
 import random
 from enum import Enum
 
-from PIL import Image
-
 from secret_hitler import config
+from secret_hitler.deck import Deck
 
 
 class Player:
+    __slots__ = ("player_id", "role", "dead")
+
     def __init__(self, player_id):
         self.player_id = player_id
         self.role = None
@@ -22,8 +24,68 @@ class Player:
             return "Liberal"
 
 
+def command(method):
+    # Engine methods that change the game are recorded with their arguments
+    # so the game can be replayed. Calls from one engine method to another
+    # belong to the outer command and aren't recorded again, and a command
+    # that raises isn't recorded at all.
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        if self.in_command:
+            return method(self, *args)
+        self.in_command = True
+        try:
+            result = method(self, *args)
+        finally:
+            self.in_command = False
+        self.commands.append((method.__name__, args))
+        return result
+
+    return wrapper
+
+
 class Game:
-    def __init__(self, channel_id, game_id, max_players, admin_id):
+    __slots__ = (
+        "president_id",
+        "president",
+        "chancellor",
+        "nominated",
+        "prev_president",
+        "prev_chancellor",
+        "prev_chancellor_id",
+        "prev_president_id",
+        "liberal_board",
+        "fascist_board",
+        "failed_votes",
+        "channel_id",
+        "admin_id",
+        "max_players",
+        "game_id",
+        "_deck",
+        "discard",
+        "policies",
+        "players",
+        "dead",
+        "state",
+        "winner",
+        "registry",
+        "votes",
+        "vote_message_id",
+        "seed",
+        "rng",
+        "commands",
+        "in_command",
+        "recording_start",
+    )
+
+    def __init__(
+        self, channel_id, game_id, max_players, admin_id, registry=None, seed=None
+    ):
+        # Every random choice of the game comes from its own generator
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.commands = []
+        self.in_command = False
         self.president_id = 0
         self.president = None
         self.chancellor = None
@@ -39,56 +101,57 @@ class Game:
         self.admin_id = admin_id
         self.max_players = max_players
         self.game_id = game_id
-        self.deck = [
-            "L",
-            "L",
-            "L",
-            "L",
-            "L",
-            "L",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-        ]
+        self.deck = Deck.full()
         self.discard = []
         self.nominated = None
         self.policies = []
-        self.investigated_one = False
-        self.investigated = False
-        self.peeked = False
-        self.executed_one = False
-        self.executed_two = False
-        random.shuffle(self.deck)
+        self.deck.shuffle(self.rng)
         self.players = []
         self.dead = []
         self.state = GameStates.GAME_STARTING
+        self.winner = None
+        self.registry = registry
+        if self.registry is not None:
+            self.registry.add_game(self)
         self.add_player(admin_id)
         self.votes = {}
+        self.vote_message_id = None
+        self.begin_recording()
+
+    def begin_recording(self):
+        # Commands are recorded from here, on top of a snapshot of the state
+        self.commands = []
+        self.recording_start = self.to_dict()
+
+    @property
+    def deck(self):
+        return self._deck
 
+    @deck.setter
+    def deck(self, cards):
+        # Any sequence of policies can be assigned, it's stored as a Deck
+        self._deck = cards if isinstance(cards, Deck) else Deck(cards)
+
+    @command
     def add_player(self, player_id):
         if len(self.players) == self.max_players:
             return False
         self.players.append(Player(player_id))
+        if self.registry is not None:
+            self.registry.add_player(player_id, self)
         return True
 
+    @command
     def start_game(self):
         if len(self.players) < self.max_players:
             return False
 
         # Shuffle seets
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
 
         # Shuffle roles
-        roles = config.configuration[self.max_players]["roles"]
-        random.shuffle(roles)
+        roles = list(config.configuration[self.max_players]["roles"])
+        self.rng.shuffle(roles)
 
         for i in range(self.max_players):
             self.players[i].role = roles[i]
@@ -96,30 +159,58 @@ class Game:
         self.president = self.players[0]
         return True
 
-    def nominate(self, player_id):
-        player = self.get_player(player_id)
+    def can_nominate(self, player_id):
         player_num = len(self.players)
         if player_num <= 5:
-            print(self.prev_chancellor_id)
-            print(player_id)
-            if self.chancellor is not None and self.chancellor.player_id is player_id:
+            if self.chancellor is not None and self.chancellor.player_id == player_id:
                 return False
         elif player_num > 5:
             if (
-                self.chancellor is not None and self.chancellor.player_id is player_id
-            ) or self.prev_president_id is player_id:
+                self.chancellor is not None and self.chancellor.player_id == player_id
+            ) or self.prev_president_id == player_id:
                 return False
 
-        if self.president is not None and self.president.player_id is player_id:
+        if self.president is not None and self.president.player_id == player_id:
             return False
-        self.nominated = player
+        return True
+
+    def nominees(self):
+        # Players the president can nominate for chancellor
+        return [p for p in self.players if self.can_nominate(p.player_id)]
+
+    @command
+    def nominate(self, player_id):
+        if not self.can_nominate(player_id):
+            return False
+        self.nominated = self.get_player(player_id)
         self.state = GameStates.ELECTION
         return True
 
+    def set_vote_message(self, message_id):
+        self.clear_vote_message()
+        self.vote_message_id = message_id
+        if self.registry is not None:
+            self.registry.add_vote_message(message_id, self)
+
+    def clear_vote_message(self):
+        if self.registry is not None and self.vote_message_id is not None:
+            self.registry.remove_vote_message(self.vote_message_id)
+        self.vote_message_id = None
+
+    def is_vote_message(self, message_id):
+        return (
+            self.state == GameStates.ELECTION
+            and self.vote_message_id is not None
+            and self.vote_message_id == message_id
+        )
+
+    def get_vote(self, player_id):
+        return self.votes.get(player_id)
+
+    @command
     def vote(self, player_id, vote):
-        for id, s_v in self.votes.items():
-            if id == player_id:
-                return False
+        if player_id in self.votes:
+            return False
 
         if len(self.votes) == len(self.players):
             return False
@@ -127,11 +218,18 @@ class Game:
         self.votes[player_id] = vote
         return True
 
+    @command
     def unvote(self, player_id, vote):
-        if self.votes[player_id] == vote:
-            del self.votes[player_id]
+        if self.votes.get(player_id) != vote:
+            return False
+        del self.votes[player_id]
+        return True
 
+    @command
     def calculate_votes(self):
+        # Votes are counted once per election, a second count finds no election
+        if self.state is not GameStates.ELECTION:
+            return None
         yes = 0
         no = 0
         for id, vote in self.votes.items():
@@ -141,6 +239,7 @@ class Game:
                 no = no + 1
 
         self.votes = {}
+        self.clear_vote_message()
 
         if yes > no:
             if self.chancellor is None or self.prev_chancellor_id == -1:
@@ -152,60 +251,38 @@ class Game:
             if self.chancellor.role == "Hitler" and self.fascist_board >= 3:
                 self.state = GameStates.GAME_OVER
                 self.winner = "Fascist"
-                return False
+                return VoteOutcome.HITLER_ELECTED
             self.failed_votes = 0
             self.state = GameStates.LEGISLATIVE_PRESIDENT
-            return True
+            return VoteOutcome.ELECTED
         else:
             self.nominated = None
             self.failed_votes = self.failed_votes + 1
             if self.failed_votes > 3:
-                policy = self.get_policy()
-                self.place_policy(policy)
-                if self.state == GameStates.GAME_OVER:
-                    self.policies.clear()
-                    return False
-                self.policies.clear()
-                if policy == "L":
-                    self.state = GameStates.NOMINATION
-                    return False
-                else:
-                    if (
-                        self.fascist_board == 1
-                        and not self.investigated_one
-                        and self.max_players > 8
-                    ):
-                        self.state = GameStates.INVESTIGATION
-                        return False
-                    if (
-                        self.fascist_board == 2
-                        and not self.investigated
-                        and self.max_players > 6
-                    ):
-                        print(self.max_players)
-                        print("HH")
-                        self.state = GameStates.INVESTIGATION
-                        return False
-                    elif self.fascist_board == 3 and not self.peeked:
-                        if self.max_players > 6:
-                            self.state = GameStates.SPECIAL_ELECTION
-                        else:
-                            self.state = GameStates.POLICY_PEEK
-                        return False
-                    elif self.fascist_board == 4 and not self.executed_one:
-                        self.state = GameStates.EXECUTION
-                        return False
-                    elif self.fascist_board == 5 and not self.executed_two:
-                        self.state = GameStates.EXECUTION
-                        return False
-
-                    self.state = GameStates.NOMINATION
-                    return False
-                # Do some stuff here
-                return False
+                # The top policy is enacted and the election tracker resets
+                self.failed_votes = 0
+                self.enact_policy(self.get_policy())
+                return VoteOutcome.TOP_DECKED
             self.set_president()
-            return False
+            self.state = GameStates.NOMINATION
+            return VoteOutcome.FAILED
+
+    def enact_policy(self, policy):
+        self.place_policy(policy)
+        if self.state == GameStates.GAME_OVER:
+            self.policies.clear()
+            return
+        self.policies.clear()
+        self.state = self.next_state(policy)
+        if self.state == GameStates.NOMINATION:
+            self.set_president()
+
+    def next_state(self, policy):
+        if policy == "L":
+            return GameStates.NOMINATION
+        return POWERS.get((self.max_players, self.fascist_board), GameStates.NOMINATION)
 
+    @command
     def start_nomination(self):
         self.state = GameStates.NOMINATION
 
@@ -216,6 +293,8 @@ class Game:
         return self.game_id
 
     def has_player(self, player_id):
+        if self.registry is not None:
+            return self.registry.get_game_with_player(player_id) is self
         for player in self.players:
             if player_id == player.get_id():
                 return True
@@ -227,20 +306,6 @@ class Game:
                 return player
         return None
 
-    def return_path_to_fascist_board(self):
-        if self.fascist_board == 0:
-            if self.max_players < 7:
-                return "secret_hitler/img/FascistBoard1.png"
-            elif self.max_players < 9:
-                return "secret_hitler/img/FascistBoard2.png"
-            return "secret_hitler/img/FascistBoard3.png"
-        return "secret_hitler/img/fascist_" + str(self.game_id) + ".png"
-
-    def return_path_to_liberal_board(self):
-        if self.liberal_board == 0:
-            return "secret_hitler/img/LiberalBoard.png"
-        return "secret_hitler/img/liberal_" + str(self.game_id) + ".png"
-
     def set_president(self):
         if self.president_id >= (len(self.players) - 1):
             self.president_id = 0
@@ -251,11 +316,10 @@ class Game:
         self.president = self.players[self.president_id]
 
     def get_policy(self):
-        if len(self.deck) == 0:
-            self.deck = self.discard.copy()
+        if len(self._deck) == 0:
+            self._deck.refill(self.discard, self.rng)
             self.discard.clear()
-            random.shuffle(self.deck)
-        return self.deck.pop(0)
+        return self._deck.draw()
 
     def place_policy(self, policy):
         if "L" in policy:
@@ -270,6 +334,7 @@ class Game:
             self.state = GameStates.GAME_OVER
             self.winner = "Fascist"
 
+    @command
     def president_legislative(self):
         policy1 = self.get_policy()
         policy2 = self.get_policy()
@@ -278,118 +343,30 @@ class Game:
         self.policies.append(policy2)
         self.policies.append(policy3)
 
-        img1 = Image.open("secret_hitler/img/policy_liberal.png")
-        img1 = img1.resize((292, 450))
-        img2 = Image.open("secret_hitler/img/policy_fascist.png")
-        img2 = img2.resize((292, 450))
-
-        new_size = 3 * 292 + 20
-
-        img_new = Image.new("RGBA", (new_size, 470), (255, 0, 0, 0))
-        if policy1 == "L":
-            img_new.paste(img1, (10, 10))
-        else:
-            img_new.paste(img2, (10, 10))
-
-        if policy2 == "L":
-            img_new.paste(img1, (292 + 10, 10))
-        else:
-            img_new.paste(img2, (292 + 10, 10))
-
-        if policy3 == "L":
-            img_new.paste(img1, (2 * 292 + 10, 10))
-        else:
-            img_new.paste(img2, (2 * 292 + 10, 10))
-        img_new.save("secret_hitler/img/president_" + str(self.game_id) + ".png")
+        return "".join(self.policies)
 
+    @command
     def policy_peek(self):
-        policy1 = self.get_policy()
-        policy2 = self.get_policy()
-        policy3 = self.get_policy()
-
-        img1 = Image.open("secret_hitler/img/policy_liberal.png")
-        img1 = img1.resize((292, 450))
-        img2 = Image.open("secret_hitler/img/policy_fascist.png")
-        img2 = img2.resize((292, 450))
-
-        new_size = 3 * 292 + 20
-
-        img_new = Image.new("RGBA", (new_size, 470), (255, 0, 0, 0))
-        if policy1 == "L":
-            img_new.paste(img1, (10, 10))
-        else:
-            img_new.paste(img2, (10, 10))
-
-        if policy2 == "L":
-            img_new.paste(img1, (292 + 10, 10))
-        else:
-            img_new.paste(img2, (292 + 10, 10))
-
-        if policy3 == "L":
-            img_new.paste(img1, (2 * 292 + 10, 10))
-        else:
-            img_new.paste(img2, (2 * 292 + 10, 10))
-        img_new.save("secret_hitler/img/policypeek_" + str(self.game_id) + ".png")
-
-        self.deck.insert(0, policy3)
-        self.deck.insert(0, policy2)
-        self.deck.insert(0, policy1)
+        if len(self.deck) >= 3:
+            return self.deck.peek(3)
 
-        self.peeked = True
-
-    def printBoard(self):
-        img1 = Image.open("secret_hitler/img/liberal_policy.png")
-
-        img_new = Image.open("secret_hitler/img/LiberalBoard.png")
-        for i in range(self.liberal_board):
-            img_new.paste(img1, config.configuration["liberal_board"][i])
-        img_new.save("secret_hitler/img/liberal_" + str(self.game_id) + ".png")
-
-        img2 = Image.open("secret_hitler/img/fascist_policy.png")
-
-        if self.max_players < 7:
-            img_new_2 = Image.open("secret_hitler/img/FascistBoard1.png")
-        elif self.max_players < 9:
-            img_new_2 = Image.open("secret_hitler/img/FascistBoard2.png")
-        else:
-            img_new_2 = Image.open("secret_hitler/img/FascistBoard3.png")
-
-        for i in range(self.fascist_board):
-            img_new_2.paste(img2, config.configuration["fascist_board"][i])
-        img_new_2.save("secret_hitler/img/fascist_" + str(self.game_id) + ".png")
+        # The discard pile is shuffled in while drawing, like for a hand
+        policies = self.get_policy() + self.get_policy() + self.get_policy()
+        self.deck.put_back(policies)
+        return policies
 
     def chancellor_legislative(self):
-        policy1 = self.policies[0]
-        policy2 = self.policies[1]
-
-        img1 = Image.open("secret_hitler/img/policy_liberal.png")
-        img1 = img1.resize((292, 450))
-        img2 = Image.open("secret_hitler/img/policy_fascist.png")
-        img2 = img2.resize((292, 450))
-
-        new_size = 2 * 292 + 20
-
-        img_new = Image.new("RGBA", (new_size, 470), (255, 0, 0, 0))
-        if policy1 == "L":
-            img_new.paste(img1, (10, 10))
-        else:
-            img_new.paste(img2, (10, 10))
-
-        if policy2 == "L":
-            img_new.paste(img1, (292 + 10, 10))
-        else:
-            img_new.paste(img2, (292 + 10, 10))
-
-        img_new.save("secret_hitler/img/chancellor_" + str(self.game_id) + ".png")
+        return "".join(self.policies[:2])
 
+    @command
     def discard_policy(self, player_id, card):
         card = card.upper()
         if (
             self.state is GameStates.LEGISLATIVE_PRESIDENT
-            and self.president.player_id is player_id
+            and self.president.player_id == player_id
         ) or (
             self.state is GameStates.LEGISLATIVE_CHANCELLOR
-            and self.chancellor.player_id is player_id
+            and self.chancellor.player_id == player_id
         ):
             if card == "F" or card == "L":
                 for i in range(len(self.policies)):
@@ -398,47 +375,7 @@ class Game:
                         self.policies.pop(i)
                         self.discard.append(popped)
                         if len(self.policies) == 1:
-                            policy = self.policies[0]
-                            self.place_policy(self.policies[0])
-                            if self.state == GameStates.GAME_OVER:
-                                return True
-                            self.policies.clear()
-                            if policy == "L":
-                                self.state = GameStates.NOMINATION
-                                return True
-                            else:
-                                if (
-                                    self.fascist_board == 1
-                                    and not self.investigated_one
-                                    and self.max_players > 8
-                                ):
-                                    self.state = GameStates.INVESTIGATION
-                                    return True
-                                elif (
-                                    self.fascist_board == 2
-                                    and not self.investigated
-                                    and self.max_players > 6
-                                ):
-                                    print(self.max_players)
-                                    print("HH")
-                                    self.state = GameStates.INVESTIGATION
-                                    return True
-                                elif self.fascist_board == 3 and not self.peeked:
-                                    if self.max_players > 6:
-                                        self.state = GameStates.SPECIAL_ELECTION
-                                    else:
-                                        self.state = GameStates.POLICY_PEEK
-                                    return True
-                                elif self.fascist_board == 4 and not self.executed_one:
-                                    self.state = GameStates.EXECUTION
-                                    return True
-                                elif self.fascist_board == 5 and not self.executed_two:
-                                    self.state = GameStates.EXECUTION
-                                    return True
-
-                                self.state = GameStates.NOMINATION
-                                return True
-                            # Do some stuff here
+                            self.enact_policy(self.policies[0])
                             return True
                         elif len(self.policies) == 2:
                             self.state = GameStates.LEGISLATIVE_CHANCELLOR
@@ -447,22 +384,99 @@ class Game:
             return False
         return False
 
+    @command
+    def request_veto(self):
+        if (
+            self.fascist_board < 5
+            or self.state is not GameStates.LEGISLATIVE_CHANCELLOR
+        ):
+            return False
+        self.state = GameStates.VETO
+        return True
+
+    @command
+    def accept_veto(self):
+        if self.state is not GameStates.VETO:
+            return False
+        for policy in self.policies:
+            self.discard.append(policy)
+        self.policies.clear()
+        self.set_president()
+        self.state = GameStates.NOMINATION
+        return True
+
+    @command
+    def decline_veto(self):
+        if self.state is not GameStates.VETO:
+            return False
+        self.state = GameStates.LEGISLATIVE_CHANCELLOR
+        return True
+
+    @command
+    def investigate(self, player_id):
+        player = self.get_player(player_id)
+        if self.state is not GameStates.INVESTIGATION or player is None:
+            return None
+        self.set_president()
+        self.state = GameStates.NOMINATION
+        return player.get_party()
+
+    @command
+    def special_election(self, player_id):
+        player = self.get_player(player_id)
+        if self.state is not GameStates.SPECIAL_ELECTION or player is None:
+            return False
+        self.prev_president_id = self.president.player_id
+        self.president = player
+        self.state = GameStates.NOMINATION
+        return True
+
+    @command
+    def finish_policy_peek(self):
+        self.set_president()
+        self.state = GameStates.NOMINATION
+
+    @command
+    def execute(self, player_id):
+        if self.state is not GameStates.EXECUTION:
+            return None
+        executed = self.execute_player(player_id)
+        if executed is None:
+            return None
+
+        parties = [player.get_party() for player in self.players]
+        if executed.role == "Hitler":
+            self.state = GameStates.GAME_OVER
+            self.winner = "Liberal"
+        elif (
+            len(self.players) <= 1
+            or "Liberal" not in parties
+            or "Fascist" not in parties
+        ):
+            self.state = GameStates.GAME_OVER
+            self.winner = self.players[0].get_party()
+        else:
+            self.set_president()
+            self.state = GameStates.NOMINATION
+        return executed
+
+    @command
     def execute_player(self, player_id):
         for i in range(len(self.players)):
             player = self.players[i]
             if player.player_id == player_id:
                 self.players.pop(i)
                 self.dead.append(player)
-                if self.fascist_board == 4:
-                    self.executed_one = True
-                elif self.fascist_board == 5:
-                    self.executed_one = True
+                if self.registry is not None:
+                    self.registry.remove_player(player_id)
                 return player
         return None
 
     def restart_game(self):
         for player in self.dead:
             self.players.append(player)
+            if self.registry is not None:
+                self.registry.add_player(player.player_id, self)
         self.dead.clear()
         self.discard.clear()
         self.president_id = 0
@@ -474,34 +488,120 @@ class Game:
         self.liberal_board = 0
         self.fascist_board = 0
         self.failed_votes = 0
-        self.deck = [
-            "L",
-            "L",
-            "L",
-            "L",
-            "L",
-            "L",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-            "F",
-        ]
+        self.deck = Deck.full()
         self.nominated = None
         self.policies.clear()
-        self.investigated = False
-        self.peeked = False
-        self.executed_one = False
-        self.executed_two = False
-        random.shuffle(self.deck)
+        self.deck.shuffle(self.rng)
         self.votes = {}
+        self.clear_vote_message()
+        self.winner = None
         self.state = GameStates.GAME_STARTING
+        self.begin_recording()
+
+    def to_dict(self):
+        # A JSON compatible copy of the state, players are referenced by id
+        def player_id(player):
+            return None if player is None else player.player_id
+
+        version, internal, gauss = self.rng.getstate()
+
+        return {
+            "game_id": self.game_id,
+            "channel_id": self.channel_id,
+            "admin_id": self.admin_id,
+            "max_players": self.max_players,
+            "players": [[p.player_id, p.role] for p in self.players],
+            "dead": [[p.player_id, p.role] for p in self.dead],
+            "president_id": self.president_id,
+            "president": player_id(self.president),
+            "chancellor": player_id(self.chancellor),
+            "nominated": player_id(self.nominated),
+            "prev_president": player_id(self.prev_president),
+            "prev_chancellor": player_id(self.prev_chancellor),
+            "prev_president_id": self.prev_president_id,
+            "prev_chancellor_id": self.prev_chancellor_id,
+            "liberal_board": self.liberal_board,
+            "fascist_board": self.fascist_board,
+            "failed_votes": self.failed_votes,
+            "deck": self.deck.peek(len(self.deck)),
+            "discard": "".join(self.discard),
+            "policies": "".join(self.policies),
+            "state": self.state.name,
+            "winner": self.winner,
+            "votes": [[player_id, vote] for player_id, vote in self.votes.items()],
+            "vote_message_id": self.vote_message_id,
+            "seed": self.seed,
+            "rng": [version, list(internal), gauss],
+        }
+
+    @classmethod
+    def from_dict(cls, data, registry=None):
+        # Keys that aren't read are ignored, journals written before the
+        # executive powers moved to POWERS still carry their flags
+        game = cls.__new__(cls)
+        game.game_id = data["game_id"]
+        game.channel_id = data["channel_id"]
+        game.admin_id = data["admin_id"]
+        game.max_players = data["max_players"]
+
+        players = {}
+        for key in ("players", "dead"):
+            setattr(game, key, [])
+            for player_id, role in data[key]:
+                player = Player(player_id)
+                player.role = role
+                player.dead = key == "dead"
+                players[player_id] = player
+                getattr(game, key).append(player)
+
+        for key in (
+            "president",
+            "chancellor",
+            "nominated",
+            "prev_president",
+            "prev_chancellor",
+        ):
+            setattr(game, key, players.get(data[key]))
+
+        for key in (
+            "president_id",
+            "prev_president_id",
+            "prev_chancellor_id",
+            "liberal_board",
+            "fascist_board",
+            "failed_votes",
+            "winner",
+            "vote_message_id",
+        ):
+            setattr(game, key, data[key])
+
+        game.deck = data["deck"]
+        game.discard = list(data["discard"])
+        game.policies = list(data["policies"])
+        game.state = GameStates[data["state"]]
+        game.votes = {player_id: vote for player_id, vote in data["votes"]}
+        game.seed = data["seed"]
+        game.rng = random.Random()
+        version, internal, gauss = data["rng"]
+        game.rng.setstate((version, tuple(internal), gauss))
+        game.in_command = False
+
+        game.registry = registry
+        if registry is not None:
+            registry.add_game(game)
+            for player in game.players:
+                registry.add_player(player.player_id, game)
+            if game.vote_message_id is not None:
+                registry.add_vote_message(game.vote_message_id, game)
+        game.begin_recording()
+        return game
+
+
+class VoteOutcome(Enum):
+    ELECTED = 1
+    HITLER_ELECTED = 2
+    FAILED = 3
+    TOP_DECKED = 4
 
 
 class GameStates(Enum):
@@ -516,3 +616,32 @@ class GameStates(Enum):
     POLICY_PEEK = 9
     EXECUTION = 10
     GAME_OVER = 11
+
+
+POWER_STATES = {
+    "investigation": GameStates.INVESTIGATION,
+    "special_election": GameStates.SPECIAL_ELECTION,
+    "policy_peek": GameStates.POLICY_PEEK,
+    "execution": GameStates.EXECUTION,
+}
+
+
+def compile_powers(configuration):
+    # (player count, fascist policies enacted) -> state the game moves to
+    # after that fascist policy, built once from the configured powers
+    table = {}
+    for players, settings in configuration.items():
+        if not isinstance(players, int):
+            continue
+        for board, power in enumerate(settings["powers"], 1):
+            if power is None:
+                continue
+            if power not in POWER_STATES:
+                raise ValueError(
+                    "Unknown power " + str(power) + " for " + str(players) + " players"
+                )
+            table[(players, board)] = POWER_STATES[power]
+    return table
+
+
+POWERS = compile_powers(config.configuration)
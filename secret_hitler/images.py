@@ -0,0 +1,224 @@
+import io
+import itertools
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from PIL import Image
+
+from secret_hitler import config
+
+CARD_WIDTH = 292
+CARD_HEIGHT = 450
+CARD_MARGIN = 10
+
+POLICY_IMAGES = {
+    "L": "secret_hitler/img/policy_liberal.png",
+    "F": "secret_hitler/img/policy_fascist.png",
+}
+
+LIBERAL_BOARD = "secret_hitler/img/LiberalBoard.png"
+LIBERAL_TILE = "secret_hitler/img/liberal_policy.png"
+FASCIST_TILE = "secret_hitler/img/fascist_policy.png"
+
+
+class BoardCache:
+    # LRU of encoded board images, bounded by the total size of the images.
+    # Boards are rendered from the render executor's threads, so the
+    # bookkeeping is locked while the rendering itself is not.
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.boards = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, render):
+        board = self.lookup(key)
+        if board is None:
+            board = render()
+            self.store(key, board)
+        return board
+
+    def lookup(self, key):
+        with self.lock:
+            board = self.boards.get(key)
+            if board is not None:
+                self.hits = self.hits + 1
+                self.boards.move_to_end(key)
+                return board
+            self.misses = self.misses + 1
+            return None
+
+    def store(self, key, board):
+        with self.lock:
+            if key not in self.boards:
+                self.boards[key] = board
+                self.size = self.size + len(board)
+            while self.size > self.max_bytes and len(self.boards) > 1:
+                _, evicted = self.boards.popitem(last=False)
+                self.size = self.size - len(evicted)
+
+    def clear(self):
+        with self.lock:
+            self.boards.clear()
+            self.size = 0
+
+
+class CachedRender:
+    # A render function whose images are cached in the process that calls
+    # it. The render executor looks the cache up itself and only hands
+    # misses to its pool, so with a process pool the cache stays in the bot's
+    # process instead of one copy per worker.
+    def __init__(self, name, cache, key, render):
+        self.__name__ = name
+        self.cache = cache
+        self.key = key
+        self.render = render
+
+    def __call__(self, *args):
+        return self.cache.get(self.key(*args), lambda: self.render(*args))
+
+
+board_cache = BoardCache(config.configuration["board_cache_bytes"])
+# Every possible hand fits, so hands are never evicted
+hand_cache = BoardCache(64 * 1024 * 1024)
+
+
+def encode(img, img_format="PNG"):
+    buffer = io.BytesIO()
+    img.save(buffer, format=img_format)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=None)
+def asset(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def policy_card(policy):
+    img = Image.open(POLICY_IMAGES[policy])
+    return img.resize((CARD_WIDTH, CARD_HEIGHT))
+
+
+def render_policy_hand(policies):
+    width = len(policies) * CARD_WIDTH + 2 * CARD_MARGIN
+    height = CARD_HEIGHT + 2 * CARD_MARGIN
+    img_new = Image.new("RGBA", (width, height), (255, 0, 0, 0))
+    for i, policy in enumerate(policies):
+        img_new.paste(policy_card(policy), (i * CARD_WIDTH + CARD_MARGIN, CARD_MARGIN))
+    return encode(img_new)
+
+
+# policies is a string like "LFF", there are only a few possible hands so
+# every hand is rendered and encoded once and then served from memory. The
+# bot renders all POLICY_HANDS at startup.
+policy_hand = CachedRender(
+    "policy_hand", hand_cache, lambda policies: policies, render_policy_hand
+)
+POLICY_HANDS = [
+    "".join(hand)
+    for size in (2, 3)
+    for hand in itertools.product(POLICY_IMAGES.keys(), repeat=size)
+]
+
+
+def fascist_board_path(max_players):
+    if max_players < 7:
+        return "secret_hitler/img/FascistBoard1.png"
+    elif max_players < 9:
+        return "secret_hitler/img/FascistBoard2.png"
+    return "secret_hitler/img/FascistBoard3.png"
+
+
+def compose_board(path, tile_path, positions, policies):
+    img_new = Image.open(path)
+    if policies > 0:
+        tile = Image.open(tile_path)
+        for i in range(policies):
+            img_new.paste(tile, positions[i])
+    return img_new
+
+
+def compose_liberal_board(policies):
+    return compose_board(
+        LIBERAL_BOARD, LIBERAL_TILE, config.configuration["liberal_board"], policies
+    )
+
+
+def compose_fascist_board(path, policies):
+    return compose_board(
+        path, FASCIST_TILE, config.configuration["fascist_board"], policies
+    )
+
+
+def render_liberal_board(policies):
+    return encode(compose_liberal_board(policies))
+
+
+def render_fascist_board(max_players, policies):
+    return encode(compose_fascist_board(fascist_board_path(max_players), policies))
+
+
+liberal_board = CachedRender(
+    "liberal_board",
+    board_cache,
+    lambda policies: ("liberal", policies),
+    render_liberal_board,
+)
+fascist_board = CachedRender(
+    "fascist_board",
+    board_cache,
+    lambda max_players, policies: (
+        "fascist",
+        fascist_board_path(max_players),
+        policies,
+    ),
+    render_fascist_board,
+)
+
+
+def encode_board(img, img_format):
+    if img_format == "PNG8":
+        # palette quantized PNG, a fraction of the size of the RGBA board
+        return encode(img.quantize(colors=256, method=Image.Quantize.FASTOCTREE))
+    return encode(img, img_format)
+
+
+def render_combined_board(max_players, liberal, fascist, width, img_format="PNG"):
+    # Both tracks stacked into one image, so a board update is one upload
+    path = fascist_board_path(max_players)
+    liberal_img = compose_liberal_board(liberal)
+    fascist_img = compose_fascist_board(path, fascist)
+    boards = [
+        img.resize((width, round(img.height * width / img.width)))
+        for img in (liberal_img, fascist_img)
+    ]
+    img_new = Image.new("RGBA", (width, boards[0].height + boards[1].height))
+    img_new.paste(boards[0], (0, 0))
+    img_new.paste(boards[1], (0, boards[0].height))
+    return encode_board(img_new, img_format)
+
+
+combined_board = CachedRender(
+    "combined_board",
+    board_cache,
+    lambda max_players, liberal, fascist, width, img_format="PNG": (
+        "combined",
+        fascist_board_path(max_players),
+        liberal,
+        fascist,
+        width,
+        img_format,
+    ),
+    render_combined_board,
+)
+
+
+def file_extension(img_format):
+    if img_format == "WEBP":
+        return "webp"
+    return "png"
@@ -0,0 +1,148 @@
+import json
+import logging
+import queue
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    game_id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_id INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_game ON records (game_id);
+"""
+
+logger = logging.getLogger("secret_hitler")
+
+
+def connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class Journal:
+    # Write-ahead journal of game states in SQLite. record() only queues the
+    # state, a background thread stores the fields that changed since the
+    # previous record of the game and replaces a game's records with a single
+    # snapshot every snapshot_every records. Loading replays at most that many
+    # records per game on top of its snapshot.
+    def __init__(self, path, snapshot_every=50):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.queue = queue.Queue()
+        self.written = 0
+        self.snapshots = 0
+
+        # Only used by the writer thread once it's started
+        self.states = {}
+        self.pending = {}
+        self.load()
+
+        self.thread = threading.Thread(
+            target=self.run, name="secret-hitler-journal", daemon=True
+        )
+        self.thread.start()
+
+    def load(self):
+        connection = connect(self.path)
+        try:
+            for game_id, data in connection.execute(
+                "SELECT game_id, data FROM snapshots"
+            ):
+                self.states[game_id] = json.loads(data)
+                self.pending[game_id] = 0
+            for game_id, data in connection.execute(
+                "SELECT game_id, data FROM records ORDER BY seq"
+            ):
+                if game_id in self.states:
+                    self.states[game_id].update(json.loads(data))
+                    self.pending[game_id] = self.pending[game_id] + 1
+        finally:
+            connection.close()
+
+    def games(self):
+        # The last journaled state of every game, by game id
+        return {game_id: dict(state) for game_id, state in self.states.items()}
+
+    def record(self, game_id, state):
+        self.queue.put(("record", game_id, state))
+
+    def remove(self, game_id):
+        self.queue.put(("remove", game_id, None))
+
+    def flush(self):
+        # Waits until everything queued so far is written
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def run(self):
+        connection = connect(self.path)
+        try:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    connection.commit()
+                    self.queue.task_done()
+                    return
+                action, game_id, state = item
+                try:
+                    if action == "record":
+                        self.write(connection, game_id, state)
+                    else:
+                        self.delete(connection, game_id)
+                except sqlite3.Error:
+                    logger.exception("Couldn't journal game " + str(game_id))
+                # Commit once the queue is drained, so bursts share a commit
+                if self.queue.empty():
+                    connection.commit()
+                self.queue.task_done()
+        finally:
+            connection.close()
+
+    def write(self, connection, game_id, state):
+        previous = self.states.get(game_id)
+        self.states[game_id] = state
+        if previous is None:
+            self.snapshot(connection, game_id, state)
+            return
+
+        delta = {
+            key: value for key, value in state.items() if previous.get(key) != value
+        }
+        if not delta:
+            return
+        if self.pending[game_id] + 1 >= self.snapshot_every:
+            self.snapshot(connection, game_id, state)
+            return
+        connection.execute(
+            "INSERT INTO records (game_id, data) VALUES (?, ?)",
+            (game_id, json.dumps(delta)),
+        )
+        self.pending[game_id] = self.pending[game_id] + 1
+        self.written = self.written + 1
+
+    def snapshot(self, connection, game_id, state):
+        connection.execute(
+            "INSERT OR REPLACE INTO snapshots (game_id, data) VALUES (?, ?)",
+            (game_id, json.dumps(state)),
+        )
+        connection.execute("DELETE FROM records WHERE game_id = ?", (game_id,))
+        self.pending[game_id] = 0
+        self.snapshots = self.snapshots + 1
+
+    def delete(self, connection, game_id):
+        connection.execute("DELETE FROM snapshots WHERE game_id = ?", (game_id,))
+        connection.execute("DELETE FROM records WHERE game_id = ?", (game_id,))
+        self.states.pop(game_id, None)
+        self.pending.pop(game_id, None)
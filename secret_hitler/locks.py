@@ -0,0 +1,66 @@
+import asyncio
+import contextlib
+import time
+
+
+class LockStats:
+    def __init__(self):
+        self.waiting = 0
+        self.max_waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def as_dict(self):
+        return {
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "acquired": self.acquired,
+            "mean_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class GameLocks:
+    # One lock per game. Commands and votes of a game are applied one at a
+    # time in the order they arrived (asyncio.Lock wakes waiters first in,
+    # first out) while other games keep running in between.
+    def __init__(self):
+        self.locks = {}
+        self.game_stats = {}
+
+    async def acquire(self, game_id):
+        lock = self.locks.get(game_id)
+        if lock is None:
+            lock = self.locks[game_id] = asyncio.Lock()
+            self.game_stats[game_id] = LockStats()
+        stats = self.game_stats[game_id]
+
+        stats.waiting = stats.waiting + 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        start = time.perf_counter()
+        try:
+            await lock.acquire()
+        finally:
+            stats.waiting = stats.waiting - 1
+        wait = time.perf_counter() - start
+        stats.acquired = stats.acquired + 1
+        stats.total_wait = stats.total_wait + wait
+        stats.max_wait = max(stats.max_wait, wait)
+        return lock
+
+    @contextlib.asynccontextmanager
+    async def hold(self, game_id):
+        lock = await self.acquire(game_id)
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def remove(self, game_id):
+        # Called once a game is gone, holders release the lock they acquired
+        self.locks.pop(game_id, None)
+        self.game_stats.pop(game_id, None)
+
+    def stats(self):
+        return {game_id: s.as_dict() for game_id, s in self.game_stats.items()}
@@ -0,0 +1,258 @@
+import argparse
+import time
+
+import numpy as np
+
+from secret_hitler import config
+from secret_hitler.game import POWERS, GameStates
+
+LIBERAL_POLICIES = 6
+FASCIST_POLICIES = 11
+MAX_ROUNDS = 100
+
+# Reasons a simulated game ended
+LIBERAL_TRACK = 1
+FASCIST_TRACK = 2
+HITLER_ELECTED = 3
+HITLER_EXECUTED = 4
+
+
+def power_track(max_players):
+    # The executive power of every fascist track position, taken from the
+    # engine's power table so the simulation follows the same rules as the bot
+    return [None] + [
+        POWERS.get((max_players, board), GameStates.NOMINATION) for board in range(1, 6)
+    ]
+
+
+class Batch:
+    # A batch of simplified games played in lockstep with array operations.
+    # Liberals enact liberal policies whenever they can and fascists enact
+    # fascist policies whenever they can, elections pass with p_elect, and
+    # executions and special elections pick uniformly random players.
+    # Decks are stored as counts: drawing from a shuffled deck is the same as
+    # drawing each card with the probability of its share of the deck.
+    def __init__(self, size, roles, p_elect, rng):
+        self.size = size
+        self.players = len(roles)
+        self.p_elect = p_elect
+        self.rng = rng
+        self.track = power_track(self.players)
+
+        role_ids = np.array(
+            [{"Liberal": 0, "Fascist": 1, "Hitler": 2}[r] for r in roles], np.int8
+        )
+        self.roles = rng.permuted(np.tile(role_ids, (size, 1)), axis=1)
+        self.alive = np.ones((size, self.players), bool)
+
+        self.deck_l = np.full(size, LIBERAL_POLICIES, np.int16)
+        self.deck_f = np.full(size, FASCIST_POLICIES, np.int16)
+        self.discard_l = np.zeros(size, np.int16)
+        self.discard_f = np.zeros(size, np.int16)
+        self.liberal_board = np.zeros(size, np.int8)
+        self.fascist_board = np.zeros(size, np.int8)
+        self.failed_votes = np.zeros(size, np.int8)
+
+        self.president = np.zeros(size, np.int16)
+        self.special_president = np.full(size, -1, np.int16)
+        self.prev_president = np.full(size, -1, np.int16)
+        self.prev_chancellor = np.full(size, -1, np.int16)
+
+        self.active = np.ones(size, bool)
+        self.winner = np.zeros(size, np.int8)
+        self.reason = np.zeros(size, np.int8)
+        self.rounds = np.zeros(size, np.int16)
+        self.index = np.arange(size)
+
+    def finish(self, mask, winner, reason):
+        mask = mask & self.active
+        self.winner[mask] = winner
+        self.reason[mask] = reason
+        self.active[mask] = False
+
+    def draw(self, mask):
+        # Reshuffle the discard pile into empty decks before drawing
+        empty = mask & (self.deck_l + self.deck_f == 0)
+        self.deck_l[empty] += self.discard_l[empty]
+        self.deck_f[empty] += self.discard_f[empty]
+        self.discard_l[empty] = 0
+        self.discard_f[empty] = 0
+
+        total = np.maximum(self.deck_l + self.deck_f, 1)
+        fascist = mask & (self.rng.random(self.size) * total < self.deck_f)
+        liberal = mask & ~fascist
+        self.deck_f -= fascist
+        self.deck_l -= liberal
+        return fascist
+
+    def random_player(self, mask, excluded):
+        # Uniformly random living player that isn't excluded, per game
+        keys = self.rng.random((self.size, self.players))
+        keys[~self.alive | excluded] = -1
+        choice = keys.argmax(axis=1)
+        return np.where(mask, choice, -1)
+
+    def seat_mask(self, seats):
+        mask = np.zeros((self.size, self.players), bool)
+        valid = seats >= 0
+        mask[self.index[valid], seats[valid]] = True
+        return mask
+
+    def role_of(self, seats):
+        return self.roles[self.index, np.maximum(seats, 0)]
+
+    def play(self):
+        while self.active.any() and self.rounds.max() < MAX_ROUNDS:
+            self.round()
+        self.finish(self.active, 0, 0)
+
+    def round(self):
+        active = self.active.copy()
+        self.rounds[active] += 1
+        president = self.president.copy()
+        special = self.special_president >= 0
+        president[special] = self.special_president[special]
+        self.special_president[:] = -1
+
+        # Election
+        elected = active & (self.rng.random(self.size) < self.p_elect)
+        excluded = self.seat_mask(president) | self.seat_mask(self.prev_chancellor)
+        if self.players > 5:
+            excluded = excluded | self.seat_mask(self.prev_president)
+        chancellor = self.random_player(elected, excluded)
+
+        self.finish(
+            elected & (self.role_of(chancellor) == 2) & (self.fascist_board >= 3),
+            2,
+            HITLER_ELECTED,
+        )
+        elected = elected & self.active
+        self.prev_president[elected] = president[elected]
+        self.prev_chancellor[elected] = chancellor[elected]
+        self.failed_votes[elected] = 0
+
+        failed = active & ~elected & self.active
+        self.failed_votes[failed] += 1
+        top_deck = failed & (self.failed_votes > 3)
+        self.failed_votes[top_deck] = 0
+
+        # Legislative session: three cards for the president, two for the
+        # chancellor, each discards the policy their party doesn't want
+        hand_f = sum(self.draw(elected).astype(np.int8) for _ in range(3))
+        fascist_president = self.role_of(president) > 0
+        fascist_chancellor = self.role_of(chancellor) > 0
+
+        drop_f = np.where(fascist_president, hand_f == 3, hand_f > 0)
+        drop_f = drop_f & elected
+        self.discard_f += drop_f
+        self.discard_l += elected & ~drop_f
+        hand_f = hand_f - drop_f
+
+        enact_f = np.where(fascist_chancellor, hand_f > 0, hand_f == 2)
+        enact_f = enact_f & elected
+        discard_f = hand_f - enact_f
+        self.discard_f += np.where(elected, discard_f, 0).astype(np.int16)
+        self.discard_l += elected & (discard_f == 0)
+
+        top_f = self.draw(top_deck)
+        enact_f = enact_f | top_f
+        enact_l = (elected | top_deck) & ~enact_f
+
+        self.liberal_board += enact_l
+        self.fascist_board += enact_f
+        self.finish(self.liberal_board >= 5, 1, LIBERAL_TRACK)
+        self.finish(self.fascist_board >= 6, 2, FASCIST_TRACK)
+
+        self.powers(enact_f & self.active, president)
+        self.next_president(active & self.active, president)
+
+    def powers(self, enacted, president):
+        for board in range(1, 6):
+            power = self.track[board]
+            mask = enacted & (self.fascist_board == board)
+            if not mask.any():
+                continue
+            if power is GameStates.EXECUTION:
+                target = self.random_player(mask, self.seat_mask(president))
+                self.alive[self.seat_mask(target)] = False
+                self.finish(mask & (self.role_of(target) == 2), 1, HITLER_EXECUTED)
+            elif power is GameStates.SPECIAL_ELECTION:
+                target = self.random_player(mask, self.seat_mask(president))
+                self.special_president[mask] = target[mask]
+
+    def next_president(self, mask, president):
+        # The next living seat after the regular president
+        seats = (self.president[:, None] + np.arange(1, self.players + 1)) % (
+            self.players
+        )
+        alive = self.alive[self.index[:, None], seats]
+        following = seats[self.index, alive.argmax(axis=1)]
+        self.president[mask] = following[mask]
+
+
+class Report:
+    def __init__(self, max_players, roles):
+        self.max_players = max_players
+        self.roles = roles
+        self.games = 0
+        self.liberal_wins = 0
+        self.fascist_wins = 0
+        self.reasons = np.zeros(5, np.int64)
+        self.lengths = np.zeros(MAX_ROUNDS + 1, np.int64)
+
+    def add(self, batch):
+        self.games = self.games + batch.size
+        self.liberal_wins = self.liberal_wins + int((batch.winner == 1).sum())
+        self.fascist_wins = self.fascist_wins + int((batch.winner == 2).sum())
+        self.reasons += np.bincount(batch.reason, minlength=5)
+        self.lengths += np.bincount(batch.rounds, minlength=MAX_ROUNDS + 1)
+
+    def length_percentile(self, q):
+        cumulative = np.cumsum(self.lengths)
+        return int(np.searchsorted(cumulative, q / 100 * cumulative[-1]))
+
+    def mean_length(self):
+        return float((self.lengths * np.arange(len(self.lengths))).sum() / self.games)
+
+
+def simulate(max_players, games, roles=None, p_elect=0.7, batch_size=100000, seed=0):
+    roles = roles or config.configuration[max_players]["roles"]
+    rng = np.random.default_rng(seed)
+    report = Report(max_players, roles)
+    while report.games < games:
+        batch = Batch(min(batch_size, games - report.games), roles, p_elect, rng)
+        batch.play()
+        report.add(batch)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo rule balance of Secret Hitler per table size"
+    )
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--p-elect", type=float, default=0.7)
+    parser.add_argument("--batch-size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for max_players in range(5, 11):
+        start = time.perf_counter()
+        report = simulate(
+            max_players, args.games, None, args.p_elect, args.batch_size, args.seed
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{max_players} players: "
+            f"liberal {report.liberal_wins / report.games:.1%}, "
+            f"fascist {report.fascist_wins / report.games:.1%} "
+            f"(hitler elected {report.reasons[HITLER_ELECTED] / report.games:.1%}, "
+            f"hitler executed {report.reasons[HITLER_EXECUTED] / report.games:.1%}), "
+            f"rounds mean {report.mean_length():.1f} "
+            f"p50 {report.length_percentile(50)} p90 {report.length_percentile(90)}, "
+            f"{report.games / elapsed:,.0f} games/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
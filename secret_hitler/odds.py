@@ -0,0 +1,147 @@
+from functools import lru_cache
+
+from secret_hitler import config
+from secret_hitler.game import GameStates
+
+# Exact odds over the policy deck. States are compact tuples of counts:
+# (deck liberal, deck fascist, discard liberal, discard fascist). Draws follow
+# Game.get_policy: cards are taken one at a time and the discard pile is
+# shuffled into the deck when it runs out, even in the middle of a hand.
+
+
+@lru_cache(maxsize=None)
+def draw_outcomes(deck_l, deck_f, discard_l, discard_f, cards):
+    # Returns ((deck_l, deck_f, discard_l, discard_f, fascists drawn), p)
+    # pairs for drawing the given number of cards
+    if cards == 0:
+        return (((deck_l, deck_f, discard_l, discard_f, 0), 1.0),)
+    if deck_l + deck_f == 0:
+        if discard_l + discard_f == 0:
+            raise ValueError("There are no policies left to draw")
+        return draw_outcomes(discard_l, discard_f, 0, 0, cards)
+
+    outcomes = {}
+    total = deck_l + deck_f
+    if deck_f > 0:
+        p = deck_f / total
+        for (dl, df, xl, xf, k), q in draw_outcomes(
+            deck_l, deck_f - 1, discard_l, discard_f, cards - 1
+        ):
+            key = (dl, df, xl, xf, k + 1)
+            outcomes[key] = outcomes.get(key, 0.0) + p * q
+    if deck_l > 0:
+        p = deck_l / total
+        for key, q in draw_outcomes(
+            deck_l - 1, deck_f, discard_l, discard_f, cards - 1
+        ):
+            outcomes[key] = outcomes.get(key, 0.0) + p * q
+    return tuple(outcomes.items())
+
+
+@lru_cache(maxsize=None)
+def draw_distribution(deck_l, deck_f, discard_l, discard_f, cards=3):
+    # Probability of drawing 0..cards fascist policies
+    distribution = [0.0] * (cards + 1)
+    for (_, _, _, _, k), p in draw_outcomes(
+        deck_l, deck_f, discard_l, discard_f, cards
+    ):
+        distribution[k] = distribution[k] + p
+    return tuple(distribution)
+
+
+def fascist_enact_probability(deck_l, deck_f, discard_l, discard_f, liberal):
+    # A liberal government only enacts a fascist policy from three fascist
+    # policies, a fascist government whenever it draws at least one
+    distribution = draw_distribution(deck_l, deck_f, discard_l, discard_f)
+    if liberal:
+        return distribution[3]
+    return 1.0 - distribution[0]
+
+
+def top_deck_probability(deck_l, deck_f, discard_l, discard_f):
+    # Probability the top policy enacted after failed elections is fascist
+    return draw_distribution(deck_l, deck_f, discard_l, discard_f, 1)[1]
+
+
+@lru_cache(maxsize=None)
+def liberal_win_probability(
+    deck_l, deck_f, discard_l, discard_f, liberal_board, fascist_board, p_liberal
+):
+    # Probability the liberal track is completed first when every government
+    # is liberal with probability p_liberal and otherwise fascist. Elections,
+    # Hitler and executive powers are not part of this model.
+    if liberal_board >= 5:
+        return 1.0
+    if fascist_board >= 6:
+        return 0.0
+
+    result = 0.0
+    for (dl, df, xl, xf, k), p in draw_outcomes(
+        deck_l, deck_f, discard_l, discard_f, 3
+    ):
+        hand_l = 3 - k
+        # liberal government: enact a liberal policy if there is one
+        if hand_l > 0:
+            liberal = liberal_win_probability(
+                dl,
+                df,
+                xl + hand_l - 1,
+                xf + k,
+                liberal_board + 1,
+                fascist_board,
+                p_liberal,
+            )
+        else:
+            liberal = liberal_win_probability(
+                dl, df, xl, xf + 2, liberal_board, fascist_board + 1, p_liberal
+            )
+        # fascist government: enact a fascist policy if there is one
+        if k > 0:
+            fascist = liberal_win_probability(
+                dl,
+                df,
+                xl + hand_l,
+                xf + k - 1,
+                liberal_board,
+                fascist_board + 1,
+                p_liberal,
+            )
+        else:
+            fascist = liberal_win_probability(
+                dl, df, xl + 2, xf, liberal_board + 1, fascist_board, p_liberal
+            )
+        result = result + p * (p_liberal * liberal + (1 - p_liberal) * fascist)
+    return result
+
+
+def game_counts(game):
+    # While a hand is out only the government knows it, so its policies and
+    # the president's discard are counted as if they were still in the deck
+    hand = list(game.policies)
+    discard = list(game.discard)
+    if game.state in (GameStates.LEGISLATIVE_CHANCELLOR, GameStates.VETO):
+        hand.append(discard.pop())
+    return (
+        game.deck.count("L") + hand.count("L"),
+        game.deck.count("F") + hand.count("F"),
+        discard.count("L"),
+        discard.count("F"),
+    )
+
+
+def game_odds(game):
+    # Governments are assumed to be liberal as often as the table is liberal.
+    # The share comes from the configured roles so it reveals nothing.
+    counts = game_counts(game)
+    roles = config.configuration[game.max_players]["roles"]
+    p_liberal = round(roles.count("Liberal") / len(roles), 2)
+    return {
+        "draw": draw_distribution(*counts),
+        "top_deck": top_deck_probability(*counts),
+        "liberal_government": fascist_enact_probability(*counts, True),
+        "fascist_government": fascist_enact_probability(*counts, False),
+        "liberal_win": liberal_win_probability(
+            *counts, game.liberal_board, game.fascist_board, p_liberal
+        ),
+        "p_liberal": p_liberal,
+    }
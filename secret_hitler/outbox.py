@@ -0,0 +1,114 @@
+import asyncio
+import collections
+import logging
+
+logger = logging.getLogger("secret_hitler")
+
+# Discord's limits for the embeds of a single message
+MAX_EMBEDS = 10
+MAX_EMBED_CHARACTERS = 6000
+
+
+class QueuedChannel:
+    # Stands in for a channel where only send() is used. send() returns the
+    # future of the message instead of waiting for it.
+    def __init__(self, outbox, channel_id):
+        self.outbox = outbox
+        self.channel_id = channel_id
+
+    async def send(self, content=None, **kwargs):
+        if content is not None:
+            kwargs["content"] = content
+        return self.outbox.post(self.channel_id, **kwargs)
+
+
+class Outbox:
+    # Messages to a channel are queued and sent in order by one task per
+    # channel. Consecutive messages with nothing but an embed are sent as one
+    # message with several embeds, so a burst of announcements costs a single
+    # request. The task waits linger seconds before sending to let a burst
+    # build up. send(channel_id, **kwargs) sends a message and returns it.
+    def __init__(self, send, linger=0.05):
+        self.send = send
+        self.linger = linger
+        self.queues = {}
+        self.tasks = {}
+        self.queued = 0
+        self.sent = 0
+        self.coalesced = 0
+
+    def channel(self, channel_id):
+        return QueuedChannel(self, channel_id)
+
+    def post(self, channel_id, alone=False, **kwargs):
+        # Returns a future of the message the kwargs were sent with. It
+        # doesn't have to be awaited, failures are logged. alone keeps the
+        # message from being merged, e.g. when it's edited later.
+        future = asyncio.get_running_loop().create_future()
+        self.queues.setdefault(channel_id, collections.deque()).append(
+            (kwargs, future, alone)
+        )
+        self.queued = self.queued + 1
+        if channel_id not in self.tasks:
+            self.tasks[channel_id] = asyncio.get_running_loop().create_task(
+                self.flush(channel_id)
+            )
+        return future
+
+    async def flush(self, channel_id):
+        queue = self.queues[channel_id]
+        try:
+            while queue:
+                if self.linger:
+                    await asyncio.sleep(self.linger)
+                batch = take_batch(queue)
+                if len(batch) > 1:
+                    kwargs = {"embeds": [kwargs["embed"] for kwargs, _, _ in batch]}
+                else:
+                    kwargs = batch[0][0]
+                try:
+                    message = await self.send(channel_id, **kwargs)
+                except Exception as e:
+                    logger.warning("Couldn't send to channel %s: %s", channel_id, e)
+                    for _, future, _ in batch:
+                        future.set_exception(e)
+                        # Logged above, don't log it again if nobody waits
+                        future.exception()
+                    continue
+                self.sent = self.sent + 1
+                self.coalesced = self.coalesced + len(batch) - 1
+                for _, future, _ in batch:
+                    future.set_result(message)
+        finally:
+            del self.tasks[channel_id]
+            if not queue:
+                del self.queues[channel_id]
+
+    def stats(self):
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "waiting": sum(len(queue) for queue in self.queues.values()),
+        }
+
+
+def mergeable(item):
+    kwargs, _, alone = item
+    return not alone and list(kwargs) == ["embed"]
+
+
+def take_batch(queue):
+    # The next message, together with the embed only messages after it if it
+    # is one itself, within the limits of a single message
+    batch = [queue.popleft()]
+    if not mergeable(batch[0]):
+        return batch
+    characters = len(batch[0][0]["embed"])
+    while queue and len(batch) < MAX_EMBEDS and mergeable(queue[0]):
+        size = len(queue[0][0]["embed"])
+        if characters + size > MAX_EMBED_CHARACTERS:
+            break
+        characters = characters + size
+        batch.append(queue.popleft())
+    return batch
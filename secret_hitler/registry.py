@@ -0,0 +1,56 @@
+class GameRegistry:
+    # Keeps the lookup tables for running games in sync, so finding the game
+    # of a player, channel or vote message doesn't need to scan every game
+    def __init__(self):
+        self.games = {}
+        self.players = {}
+        self.channels = {}
+        self.vote_messages = {}
+        self.last_game_id = 0
+
+    def add_game(self, game):
+        self.games[game.game_id] = game
+        self.channels[game.channel_id] = game
+
+    def remove_game(self, game_id):
+        game = self.games.pop(game_id, None)
+        if game is None:
+            return None
+        if self.channels.get(game.channel_id) is game:
+            del self.channels[game.channel_id]
+        if self.vote_messages.get(game.vote_message_id) is game:
+            del self.vote_messages[game.vote_message_id]
+        for player in game.players + game.dead:
+            if self.players.get(player.player_id) is game:
+                del self.players[player.player_id]
+        return game
+
+    def add_player(self, player_id, game):
+        self.players[player_id] = game
+
+    def remove_player(self, player_id):
+        self.players.pop(player_id, None)
+
+    def add_vote_message(self, message_id, game):
+        self.vote_messages[message_id] = game
+
+    def remove_vote_message(self, message_id):
+        self.vote_messages.pop(message_id, None)
+
+    def get_game(self, game_id):
+        return self.games.get(game_id)
+
+    def get_game_with_player(self, player_id):
+        return self.players.get(player_id)
+
+    def get_game_with_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+    def get_game_with_vote_message(self, message_id):
+        return self.vote_messages.get(message_id)
+
+    def next_game_id(self):
+        # Every call reserves a new id, a game that is still being created
+        # isn't registered yet but its id mustn't be handed out again
+        self.last_game_id = max([self.last_game_id, *self.games.keys()]) + 1
+        return self.last_game_id
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+logger = logging.getLogger("secret_hitler")
+
+
+def timed(fn, *args):
+    # Runs inside the worker, so the render time doesn't include queueing
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+class RenderTiming:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.wait = 0.0
+
+    def add(self, elapsed, wait):
+        self.count = self.count + 1
+        self.total = self.total + elapsed
+        self.max = max(self.max, elapsed)
+        self.wait = self.wait + wait
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "avg_wait": self.wait / self.count if self.count else 0.0,
+        }
+
+
+class RenderExecutor:
+    # Runs PIL work in a thread or process pool so the event loop keeps
+    # serving other games. At most max_queue renders are submitted at once,
+    # further callers wait on the loop until a slot is free.
+    def __init__(self, kind="thread", workers=2, max_queue=32):
+        if kind == "process":
+            self.pool = ProcessPoolExecutor(max_workers=workers)
+        elif kind == "thread":
+            self.pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="render"
+            )
+        else:
+            raise ValueError("Unknown render executor: " + str(kind))
+        self.max_queue = max_queue
+        self.slots = asyncio.Semaphore(max_queue)
+        self.queued = 0
+        self.timings = {}
+
+    async def render(self, fn, *args):
+        # Cached renders are looked up here, only misses go to the pool
+        cache = getattr(fn, "cache", None)
+        if cache is None:
+            return await self.run(fn.__name__, fn, *args)
+        key = fn.key(*args)
+        result = cache.lookup(key)
+        if result is None:
+            result = await self.run(fn.__name__, fn.render, *args)
+            cache.store(key, result)
+        return result
+
+    async def run(self, name, fn, *args):
+        self.queued = self.queued + 1
+        start = time.perf_counter()
+        try:
+            async with self.slots:
+                loop = asyncio.get_running_loop()
+                result, elapsed = await loop.run_in_executor(
+                    self.pool, timed, fn, *args
+                )
+        finally:
+            self.queued = self.queued - 1
+
+        wait = time.perf_counter() - start - elapsed
+        timing = self.timings.setdefault(name, RenderTiming())
+        timing.add(elapsed, wait)
+        logger.debug(
+            "Rendered %s in %.1fms (waited %.1fms)",
+            name,
+            elapsed * 1000,
+            wait * 1000,
+        )
+        return result
+
+    def stats(self):
+        return {name: t.to_dict() for name, t in self.timings.items()}
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False)
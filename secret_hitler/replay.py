@@ -0,0 +1,59 @@
+import argparse
+import json
+import time
+
+from secret_hitler.game import Game
+
+# A recording is the state a game's command stream starts from together with
+# the commands, both JSON compatible. Games own their random generator, so
+# replaying the commands on top of the start state reproduces the game
+# exactly, without Discord and without rendering.
+
+
+def recording(game):
+    return {
+        "start": game.recording_start,
+        "commands": [[name, list(args)] for name, args in game.commands],
+    }
+
+
+def replay(data):
+    game = Game.from_dict(data["start"])
+    for name, args in data["commands"]:
+        getattr(game, name)(*args)
+    return game
+
+
+def save(path, game):
+    with open(path, "w") as f:
+        json.dump(recording(game), f)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Secret Hitler game")
+    parser.add_argument("recording")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    data = load(args.recording)
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        game = replay(data)
+    elapsed = time.perf_counter() - start
+
+    commands = len(data["commands"]) * args.repeat
+    print(
+        f"{len(data['commands'])} commands, state {game.state.name}, "
+        f"liberal {game.liberal_board}/5, fascist {game.fascist_board}/6, "
+        f"winner {game.winner}"
+    )
+    print(f"{commands / elapsed:,.0f} commands/s")
+
+
+if __name__ == "__main__":
+    main()
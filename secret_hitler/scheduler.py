@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+# Priority classes, a class is only served when no request of a more urgent
+# class is waiting
+INTERACTIVE = 0
+NORMAL = 1
+BULK = 2
+
+
+class LatencyStats:
+    def __init__(self):
+        self.requests = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def add(self, wait, latency):
+        self.requests = self.requests + 1
+        self.total_wait = self.total_wait + wait
+        self.max_wait = max(self.max_wait, wait)
+        self.total_latency = self.total_latency + latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self):
+        requests = self.requests or 1
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "mean_wait": self.total_wait / requests,
+            "max_wait": self.max_wait,
+            "mean_latency": self.total_latency / requests,
+            "max_latency": self.max_latency,
+        }
+
+
+class FairScheduler:
+    # Shares the bot's REST budget (rate requests per second, bursts of up to
+    # burst requests) between guilds and, within a guild, between its games.
+    # Requests pass straight through while there is budget left. Otherwise
+    # they wait in a heap ordered by priority class and then by self-clocked
+    # fair queuing tags: every guild gets an equal share and a guild's share
+    # is split between its flows (games) that have requests waiting.
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = burst
+        self.updated = clock()
+        self.heap = []
+        self.counter = itertools.count()
+        self.virtual_time = 0.0
+        self.finish = {}
+        self.waiting = {}
+        self.task = None
+        self.guild_stats = {}
+
+    def refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def back_off(self, seconds):
+        # Spends the budget of the next seconds, e.g. after a global 429
+        self.refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+    async def call(self, guild_id, flow, priority, request):
+        # Awaits request() once it's the turn of the guild's flow
+        stats = self.guild_stats.get(guild_id)
+        if stats is None:
+            stats = self.guild_stats[guild_id] = LatencyStats()
+        start = self.clock()
+
+        self.refill()
+        if not self.heap and self.tokens >= 1:
+            self.tokens = self.tokens - 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            tag = self.tag(guild_id, flow)
+            heapq.heappush(
+                self.heap,
+                (priority, tag, next(self.counter), guild_id, flow, future),
+            )
+            stats.queued = stats.queued + 1
+            if self.task is None:
+                self.task = asyncio.get_running_loop().create_task(self.dispatch())
+            try:
+                await future
+            finally:
+                stats.queued = stats.queued - 1
+
+        wait = self.clock() - start
+        try:
+            return await request()
+        finally:
+            stats.add(wait, self.clock() - start)
+
+    def tag(self, guild_id, flow):
+        flows = self.waiting.setdefault(guild_id, {})
+        flows[flow] = flows.get(flow, 0) + 1
+        # A flow's requests cost as much as its guild has waiting flows, so
+        # all flows of a guild together advance like a single flow
+        start = max(self.virtual_time, self.finish.get((guild_id, flow), 0.0))
+        finish = start + len(flows)
+        self.finish[(guild_id, flow)] = finish
+        return finish
+
+    def leave(self, guild_id, flow):
+        flows = self.waiting[guild_id]
+        flows[flow] = flows[flow] - 1
+        if flows[flow] == 0:
+            del flows[flow]
+            if self.finish.get((guild_id, flow), 0.0) <= self.virtual_time:
+                self.finish.pop((guild_id, flow), None)
+        if not flows:
+            del self.waiting[guild_id]
+
+    async def dispatch(self):
+        try:
+            while self.heap:
+                self.refill()
+                if self.tokens < 1:
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+                    continue
+                _, tag, _, guild_id, flow, future = heapq.heappop(self.heap)
+                self.virtual_time = max(self.virtual_time, tag)
+                self.leave(guild_id, flow)
+                # The caller may have been cancelled while it waited
+                if future.done():
+                    continue
+                self.tokens = self.tokens - 1
+                future.set_result(None)
+        finally:
+            self.task = None
+
+    def stats(self):
+        return {
+            guild_id: stats.as_dict() for guild_id, stats in self.guild_stats.items()
+        }
+
+
+class ScheduledTarget:
+    # Stands in for a channel, user or message whose send() is scheduled.
+    # Other attributes are the target's own.
+    def __init__(self, scheduler, target, guild_id, flow, priority):
+        self.scheduler = scheduler
+        self.target = target
+        self.guild_id = guild_id
+        self.flow = flow
+        self.priority = priority
+
+    async def send(self, *args, **kwargs):
+        return await self.scheduler.call(
+            self.guild_id,
+            self.flow,
+            self.priority,
+            lambda: self.target.send(*args, **kwargs),
+        )
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
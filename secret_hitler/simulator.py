@@ -0,0 +1,138 @@
+import random
+import time
+
+from secret_hitler.game import Game, GameStates
+
+MAX_TRANSITIONS = 1000
+
+
+class RandomAgent:
+    # Makes every decision of every player uniformly at random
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def nominate(self, game, candidates):
+        return self.rng.choice(candidates).player_id
+
+    def vote(self, game, player):
+        return self.rng.choice(("y", "n"))
+
+    def discard(self, game, player, hand):
+        return self.rng.choice(hand)
+
+    def target(self, game, state, candidates):
+        return self.rng.choice(candidates).player_id
+
+
+class ScriptedAgent:
+    # Replays fixed decisions, taken in order per kind of decision
+    # ("nominate", "vote", "discard" and "target"). When a script runs out
+    # the first legal choice is made.
+    def __init__(self, script):
+        self.script = {kind: list(decisions) for kind, decisions in script.items()}
+
+    def next(self, kind, default):
+        decisions = self.script.get(kind)
+        if decisions:
+            return decisions.pop(0)
+        return default
+
+    def nominate(self, game, candidates):
+        return self.next("nominate", candidates[0].player_id)
+
+    def vote(self, game, player):
+        return self.next("vote", "y")
+
+    def discard(self, game, player, hand):
+        return self.next("discard", hand[0])
+
+    def target(self, game, state, candidates):
+        return self.next("target", candidates[0].player_id)
+
+
+class SimulationResult:
+    def __init__(self, winner, transitions, liberal_board, fascist_board):
+        self.winner = winner
+        self.transitions = transitions
+        self.liberal_board = liberal_board
+        self.fascist_board = fascist_board
+
+
+class Simulator:
+    # Plays complete games through the Game engine without Discord. With
+    # timings set, the latency of every engine call is recorded per method.
+    # The seed makes the games reproducible together with a seeded agent.
+    def __init__(self, max_players, agent, timings=None, seed=None):
+        self.max_players = max_players
+        self.agent = agent
+        self.timings = timings
+        self.game = Game(0, 0, max_players, 0, seed=seed)
+        for player_id in range(1, max_players):
+            self.game.add_player(player_id)
+        self.transitions = 0
+
+    def call(self, method, *args):
+        self.transitions = self.transitions + 1
+        if self.timings is None:
+            return getattr(self.game, method)(*args)
+        start = time.perf_counter_ns()
+        result = getattr(self.game, method)(*args)
+        self.timings.setdefault(method, []).append(time.perf_counter_ns() - start)
+        return result
+
+    def play(self):
+        game = self.game
+        if game.state is not GameStates.GAME_STARTING:
+            self.call("restart_game")
+        self.transitions = 0
+        self.call("start_game")
+        self.call("start_nomination")
+
+        while game.state is not GameStates.GAME_OVER:
+            if self.transitions > MAX_TRANSITIONS:
+                raise RuntimeError("Game didn't finish in time: " + str(game.state))
+            self.step()
+
+        return SimulationResult(
+            game.winner, self.transitions, game.liberal_board, game.fascist_board
+        )
+
+    def step(self):
+        game = self.game
+        state = game.state
+        president = game.president
+        others = [p for p in game.players if p is not president]
+
+        if state is GameStates.NOMINATION:
+            candidates = list(others)
+            while candidates:
+                player_id = self.agent.nominate(game, candidates)
+                if self.call("nominate", player_id):
+                    return
+                candidates = [p for p in candidates if p.player_id != player_id]
+            raise RuntimeError("Nobody can be nominated")
+        elif state is GameStates.ELECTION:
+            for player in list(game.players):
+                self.call("vote", player.player_id, self.agent.vote(game, player))
+            self.call("calculate_votes")
+        elif state is GameStates.LEGISLATIVE_PRESIDENT:
+            self.discard(president, self.call("president_legislative"))
+        elif state is GameStates.LEGISLATIVE_CHANCELLOR:
+            self.discard(game.chancellor, self.call("chancellor_legislative"))
+        elif state is GameStates.INVESTIGATION:
+            self.call("investigate", self.agent.target(game, state, others))
+        elif state is GameStates.SPECIAL_ELECTION:
+            self.call("special_election", self.agent.target(game, state, others))
+        elif state is GameStates.POLICY_PEEK:
+            self.call("policy_peek")
+            self.call("finish_policy_peek")
+        elif state is GameStates.EXECUTION:
+            self.call("execute", self.agent.target(game, state, others))
+        else:
+            raise RuntimeError("Unexpected state: " + str(state))
+
+    def discard(self, player, hand):
+        # A card that isn't in the hand is refused, then any card is discarded
+        card = self.agent.discard(self.game, player, hand)
+        if not self.call("discard_policy", player.player_id, card):
+            self.call("discard_policy", player.player_id, hand[0])
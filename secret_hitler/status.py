@@ -0,0 +1,79 @@
+import asyncio
+import logging
+
+import discord
+
+logger = logging.getLogger("secret_hitler")
+
+
+class StatusMessages:
+    # One message per game that is edited in place instead of posting a new
+    # message for every change. update() only stores the newest content, the
+    # message is edited delay seconds later, so bursts of updates cost a
+    # single edit. create(game_id, content) sends the message and returns it,
+    # edit(message, content) edits it.
+    def __init__(self, create, edit, delay=1.0):
+        self.create = create
+        self.edit = edit
+        self.delay = delay
+        self.messages = {}
+        self.pending = {}
+        self.tasks = {}
+        self.created = 0
+        self.edits = 0
+        self.coalesced = 0
+
+    def update(self, game_id, content):
+        if game_id in self.pending:
+            self.coalesced = self.coalesced + 1
+        self.pending[game_id] = content
+        if game_id not in self.tasks:
+            self.tasks[game_id] = asyncio.get_running_loop().create_task(
+                self.flush_later(game_id)
+            )
+
+    async def flush_later(self, game_id):
+        try:
+            # Updates that arrive while the message is sent wait for the next
+            # round instead of sending concurrently
+            while game_id in self.pending:
+                await asyncio.sleep(self.delay)
+                await self.send(game_id, self.pending.pop(game_id))
+        except Exception:
+            logger.exception("Couldn't update the status of game " + str(game_id))
+        finally:
+            self.tasks.pop(game_id, None)
+
+    async def send(self, game_id, content):
+        message = self.messages.get(game_id)
+        if message is not None:
+            try:
+                await self.edit(message, content)
+                self.edits = self.edits + 1
+                return
+            except discord.NotFound:
+                # Deleted by somebody, a new message replaces it
+                pass
+        self.messages[game_id] = await self.create(game_id, content)
+        self.created = self.created + 1
+
+    async def wait(self, game_id):
+        # Waits until the pending update of a game is sent
+        task = self.tasks.get(game_id)
+        if task is not None:
+            await asyncio.shield(task)
+
+    def remove(self, game_id):
+        task = self.tasks.pop(game_id, None)
+        if task is not None:
+            task.cancel()
+        self.pending.pop(game_id, None)
+        self.messages.pop(game_id, None)
+
+    def stats(self):
+        return {
+            "games": len(self.messages),
+            "created": self.created,
+            "edits": self.edits,
+            "coalesced": self.coalesced,
+        }
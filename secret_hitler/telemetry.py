@@ -0,0 +1,142 @@
+import re
+import time
+
+import aiohttp
+
+API_PREFIX = re.compile(r"^/api/v\d+")
+# Routes with a token after the id
+TOKEN_ROUTES = ("interactions", "webhooks")
+
+
+def route_key(method, path):
+    # Groups requests by route, e.g. "PUT /channels/{id}/messages/{id}/
+    # reactions/{emoji}/@me", so a bucket can be traced back to a game flow
+    segments = API_PREFIX.sub("", path).split("/")
+    key = []
+    for i, segment in enumerate(segments):
+        previous = segments[i - 1] if i > 0 else ""
+        if segment.isdigit():
+            key.append("{id}")
+        elif previous == "reactions":
+            key.append("{emoji}")
+        elif previous.isdigit() and i > 1 and segments[i - 2] in TOKEN_ROUTES:
+            key.append("{token}")
+        else:
+            key.append(segment)
+    return method + " " + "/".join(key)
+
+
+class BucketStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.retry_after = 0.0
+        self.exhausted = 0
+        self.reset_wait = 0.0
+        self.queue_time = 0.0
+        self.max_queue_time = 0.0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def as_dict(self):
+        requests = self.requests or 1
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "retry_after": self.retry_after,
+            "exhausted": self.exhausted,
+            "reset_wait": self.reset_wait,
+            "mean_queue_time": self.queue_time / requests,
+            "max_queue_time": self.max_queue_time,
+            "mean_time": self.total_time / requests,
+            "max_time": self.max_time,
+        }
+
+
+class RateLimitTelemetry:
+    # Records every REST request of the client through aiohttp's tracing
+    # hooks (pass trace_config() as the client's http_trace), by route:
+    #  - requests and failed requests
+    #  - 429 responses and the retry after Discord asked for
+    #  - how often a bucket was used up and how long its reset took, that's
+    #    the time discord.py holds the next request of the bucket
+    #  - time spent waiting for a connection and the total request time
+    # on_global_limit(retry_after) is called for global rate limits.
+    def __init__(self, on_global_limit=None, clock=time.perf_counter):
+        self.on_global_limit = on_global_limit
+        self.clock = clock
+        self.buckets = {}
+        self.global_limits = 0
+        self.started = time.time()
+
+    def trace_config(self):
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self.request_start)
+        trace.on_connection_queued_start.append(self.queued_start)
+        trace.on_connection_queued_end.append(self.queued_end)
+        trace.on_request_end.append(self.request_end)
+        trace.on_request_exception.append(self.request_exception)
+        return trace
+
+    def bucket(self, method, url):
+        key = route_key(method, url.path)
+        stats = self.buckets.get(key)
+        if stats is None:
+            stats = self.buckets[key] = BucketStats()
+        return stats
+
+    async def request_start(self, session, context, params):
+        context.start = self.clock()
+        context.queue_time = 0.0
+
+    async def queued_start(self, session, context, params):
+        context.queued = self.clock()
+
+    async def queued_end(self, session, context, params):
+        context.queue_time = context.queue_time + self.clock() - context.queued
+
+    async def request_end(self, session, context, params):
+        stats = self.finish(context, params)
+        headers = params.response.headers
+        if params.response.status == 429:
+            retry_after = float(headers.get("Retry-After", 0))
+            stats.rate_limited = stats.rate_limited + 1
+            stats.retry_after = stats.retry_after + retry_after
+            if headers.get("X-RateLimit-Scope") == "global" or headers.get(
+                "X-RateLimit-Global"
+            ):
+                self.global_limits = self.global_limits + 1
+                if self.on_global_limit is not None:
+                    self.on_global_limit(retry_after)
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            stats.exhausted = stats.exhausted + 1
+            stats.reset_wait = stats.reset_wait + float(
+                headers.get("X-RateLimit-Reset-After", 0)
+            )
+
+    async def request_exception(self, session, context, params):
+        stats = self.finish(context, params)
+        stats.errors = stats.errors + 1
+
+    def finish(self, context, params):
+        stats = self.bucket(params.method, params.url)
+        elapsed = self.clock() - context.start
+        stats.requests = stats.requests + 1
+        stats.queue_time = stats.queue_time + context.queue_time
+        stats.max_queue_time = max(stats.max_queue_time, context.queue_time)
+        stats.total_time = stats.total_time + elapsed
+        stats.max_time = max(stats.max_time, elapsed)
+        return stats
+
+    def stats(self):
+        # Busiest routes first
+        buckets = sorted(
+            self.buckets.items(), key=lambda item: item[1].requests, reverse=True
+        )
+        return {
+            "since": self.started,
+            "global_limits": self.global_limits,
+            "routes": {key: stats.as_dict() for key, stats in buckets},
+        }
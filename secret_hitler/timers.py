@@ -0,0 +1,108 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+logger = logging.getLogger("secret_hitler")
+
+
+class TurnTimers:
+    # Deadlines for the current turn of every game in a single min-heap that
+    # one task sleeps on. Scheduling pushes an entry in O(log n). Cancelling
+    # only marks the entry, it's dropped when it reaches the top of the heap,
+    # and the heap is rebuilt once most of it is cancelled entries.
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.heap = []
+        self.entries = {}
+        self.turns = {}
+        self.cancelled = 0
+        self.fired = 0
+        self.counter = itertools.count()
+        self.changed = asyncio.Event()
+        self.running = set()
+        self.task = None
+
+    def track(self, game_id, turn, delay):
+        # Starts the timer of a new turn, the current turn keeps its timer.
+        # A delay of None means the turn has no timer.
+        if self.turns.get(game_id) == turn:
+            return False
+        self.turns[game_id] = turn
+        if delay is None:
+            self.cancel(game_id)
+        else:
+            self.schedule(game_id, delay, (turn, 0))
+        return True
+
+    def schedule(self, game_id, delay, step):
+        self.cancel(game_id)
+        entry = [self.clock() + delay, next(self.counter), game_id, step, True]
+        self.entries[game_id] = entry
+        heapq.heappush(self.heap, entry)
+        if self.heap[0] is entry:
+            self.changed.set()
+
+    def cancel(self, game_id):
+        entry = self.entries.pop(game_id, None)
+        if entry is None:
+            return
+        entry[-1] = False
+        self.cancelled = self.cancelled + 1
+        if self.cancelled > 64 and self.cancelled > len(self.heap) // 2:
+            self.heap = [e for e in self.heap if e[-1]]
+            heapq.heapify(self.heap)
+            self.cancelled = 0
+
+    def remove(self, game_id):
+        self.cancel(game_id)
+        self.turns.pop(game_id, None)
+
+    def next_deadline(self):
+        while self.heap and not self.heap[0][-1]:
+            heapq.heappop(self.heap)
+            self.cancelled = max(0, self.cancelled - 1)
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now=None):
+        # (game id, step) of every timer that has expired
+        now = self.clock() if now is None else now
+        due = []
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > now:
+                return due
+            _, _, game_id, step, _ = heapq.heappop(self.heap)
+            del self.entries[game_id]
+            due.append((game_id, step))
+
+    async def run(self, callback):
+        # Calls callback(game_id, turn, step) for every expired timer
+        while True:
+            deadline = self.next_deadline()
+            self.changed.clear()
+            timeout = None if deadline is None else max(0, deadline - self.clock())
+            try:
+                await asyncio.wait_for(self.changed.wait(), timeout)
+                continue
+            except asyncio.TimeoutError:
+                pass
+            # A slow game must not hold up the timers of the other games
+            for game_id, (turn, step) in self.pop_due():
+                self.fired = self.fired + 1
+                task = asyncio.get_running_loop().create_task(
+                    self.fire(callback, game_id, turn, step)
+                )
+                self.running.add(task)
+                task.add_done_callback(self.running.discard)
+
+    async def fire(self, callback, game_id, turn, step):
+        try:
+            await callback(game_id, turn, step)
+        except Exception:
+            logger.exception("Turn timer of game " + str(game_id) + " failed")
+
+    def start(self, callback):
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run(callback))
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from secret_hitler.assets import AssetCache
+
+
+class FakeAttachment:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakeMessage:
+    def __init__(self, url):
+        self.attachments = [FakeAttachment(url)]
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = 0
+
+    async def send(self, file):
+        self.sent = self.sent + 1
+        await asyncio.sleep(0)
+        return FakeMessage("https://cdn/" + file.filename + "/" + str(self.sent))
+
+
+class AssetCacheTestCase(unittest.TestCase):
+    def test_no_channel(self):
+        """Test images are attached when there is no asset channel"""
+        cache = AssetCache(60)
+        assert(asyncio.run(cache.get_url(b"role", "role.png")) is None)
+
+    def test_upload_once(self):
+        """Test the same image is only uploaded once"""
+        cache = AssetCache(60)
+        channel = FakeChannel()
+        cache.setChannel(channel)
+
+        async def run():
+            return await asyncio.gather(
+                cache.get_url(b"role", "role.png"),
+                cache.get_url(b"role", "role.png"),
+                cache.get_url(b"board", "board.png"),
+            )
+
+        urls = asyncio.run(run())
+        assert(urls[0] == urls[1])
+        assert(urls[0] != urls[2])
+        assert(asyncio.run(cache.get_url(b"role", "role.png")) == urls[0])
+        assert(channel.sent == 2)
+        assert(cache.uploads == 2)
+
+    def test_expired_url(self):
+        """Test expired urls are uploaded again"""
+        cache = AssetCache(0)
+        channel = FakeChannel()
+        cache.setChannel(channel)
+        asyncio.run(cache.get_url(b"role", "role.png"))
+        asyncio.run(cache.get_url(b"role", "role.png"))
+        assert(channel.sent == 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import random
+import unittest
+
+from secret_hitler.deck import Deck
+
+
+class DeckTestCase(unittest.TestCase):
+    def setUp(self):
+        self.deck = Deck("LFFLF")
+
+    def test_draw(self):
+        """Test cards are drawn from the top"""
+        assert(self.deck.draw() == "L")
+        assert(self.deck.draw() == "F")
+        assert(len(self.deck) == 3)
+        assert(self.deck == ["F", "L", "F"])
+
+    def test_peek(self):
+        """Test peeking leaves the deck untouched"""
+        assert(self.deck.peek(3) == "LFF")
+        assert(self.deck.peek(10) == "LFFLF")
+        assert(len(self.deck) == 5)
+
+    def test_put_back(self):
+        """Test returned cards end up on top in order"""
+        cards = self.deck.draw() + self.deck.draw()
+        self.deck.put_back(cards)
+        assert(self.deck == "LFFLF")
+        self.deck.put_back("FF")
+        assert(self.deck == "FFLFFLF")
+        assert(self.deck[0] == "F")
+
+    def test_shuffle(self):
+        """Test shuffling keeps the cards"""
+        deck = Deck.full()
+        deck.draw()
+        deck.shuffle(random.Random(0))
+        assert(len(deck) == 16)
+        assert(deck.count("L") == 5)
+        assert(deck.count("F") == 11)
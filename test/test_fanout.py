@@ -0,0 +1,32 @@
+import asyncio
+import unittest
+
+from secret_hitler.fanout import fan_out
+
+
+class FanOutTestCase(unittest.TestCase):
+    def test_failures_dont_abort(self):
+        """Test a failing recipient doesn't stop the other sends"""
+        running = []
+        peak = []
+
+        def deliver(fail):
+            async def send():
+                running.append(1)
+                peak.append(len(running))
+                await asyncio.sleep(0.01)
+                running.pop()
+                if fail:
+                    raise RuntimeError("closed DMs")
+            return send
+
+        sends = {i: deliver(i == 2) for i in range(6)}
+        result = asyncio.run(fan_out(sends, 2))
+        assert(sorted(result.sent) == [0, 1, 3, 4, 5])
+        assert(list(result.failed.keys()) == [2])
+        assert(max(peak) == 2)
+        assert(result.elapsed > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
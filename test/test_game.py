@@ -14,5 +14,170 @@ class GameInitTestCase(unittest.TestCase):
         assert(fascist_count == 11)
 
 
+class GameLegislativeTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = game.Game(0, 0, 5, 0)
+
+    def test_legislative_hands(self):
+        """Test the drawn hands are returned for rendering"""
+        deck = list(self.game.deck)
+        president = self.game.president_legislative()
+        chancellor = self.game.chancellor_legislative()
+        assert(president == "".join(deck[:3]))
+        assert(chancellor == president[:2])
+        assert(len(self.game.deck) == 14)
+
+    def test_policy_peek_keeps_deck(self):
+        """Test peeking returns the top policies and leaves the deck untouched"""
+        deck = list(self.game.deck)
+        assert(self.game.policy_peek() == "".join(deck[:3]))
+        assert(self.game.deck == deck)
+
+
+class GameVoteTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = game.Game(0, 0, 5, 0)
+        for player_id in range(1, 5):
+            self.game.add_player(player_id)
+        self.game.start_game()
+        self.game.nominate(self.game.players[1].player_id)
+        self.game.set_vote_message(42)
+
+    def test_vote_message(self):
+        """Test only the active vote message accepts ballots"""
+        assert(self.game.is_vote_message(42))
+        assert(not self.game.is_vote_message(41))
+
+    def test_ballots(self):
+        """Test ballots are recorded once and can be withdrawn"""
+        assert(self.game.vote(1, "y"))
+        assert(not self.game.vote(1, "n"))
+        assert(self.game.get_vote(1) == "y")
+        self.game.unvote(1, "y")
+        assert(self.game.get_vote(1) is None)
+        assert(self.game.vote(1, "n"))
+
+    def test_vote_message_cleared(self):
+        """Test counting the votes closes the vote message"""
+        for player in self.game.players:
+            self.game.vote(player.player_id, "y")
+        self.game.calculate_votes()
+        assert(not self.game.is_vote_message(42))
+
+    def test_votes_counted_once(self):
+        """Test a second count of the same election does nothing"""
+        for player in self.game.players:
+            self.game.vote(player.player_id, "n")
+        assert(self.game.calculate_votes() == game.VoteOutcome.FAILED)
+        assert(self.game.calculate_votes() is None)
+        assert(self.game.failed_votes == 1)
+
+
+class GameTransitionTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = game.Game(0, 0, 7, 0)
+        for player_id in range(1, 7):
+            self.game.add_player(player_id)
+        self.game.start_game()
+        self.game.start_nomination()
+
+    def fail_election(self):
+        assert(any(self.game.nominate(p.player_id) for p in self.game.players))
+        for player in self.game.players:
+            self.game.vote(player.player_id, "n")
+        return self.game.calculate_votes()
+
+    def test_top_deck(self):
+        """Test the fourth failed election enacts the top policy"""
+        top = self.game.deck[0]
+        for _ in range(3):
+            assert(self.fail_election() == game.VoteOutcome.FAILED)
+        assert(self.fail_election() == game.VoteOutcome.TOP_DECKED)
+        assert(self.game.failed_votes == 0)
+        if top == "L":
+            assert(self.game.liberal_board == 1)
+        else:
+            assert(self.game.fascist_board == 1)
+        assert(self.game.state == game.GameStates.NOMINATION)
+
+    def test_power_table(self):
+        """Test fascist policies move to the configured power"""
+        expected = {
+            5: [None, None, "POLICY_PEEK", "EXECUTION", "EXECUTION"],
+            7: [None, "INVESTIGATION", "SPECIAL_ELECTION", "EXECUTION", "EXECUTION"],
+            9: ["INVESTIGATION", "INVESTIGATION", "SPECIAL_ELECTION", "EXECUTION",
+                "EXECUTION"],
+        }
+        for max_players, powers in expected.items():
+            for board, power in enumerate(powers, 1):
+                self.game.max_players = max_players
+                self.game.fascist_board = board
+                state = self.game.next_state("F")
+                assert(state.name == (power or "NOMINATION"))
+                assert(self.game.next_state("L") == game.GameStates.NOMINATION)
+
+    def test_unknown_power(self):
+        """Test a misspelled power is reported when the table is built"""
+        with self.assertRaises(ValueError):
+            game.compile_powers({5: {"roles": [], "powers": ["peek"]}})
+
+    def test_special_election(self):
+        """Test the president can hand the presidency to any player"""
+        self.game.state = game.GameStates.SPECIAL_ELECTION
+        president = self.game.president
+        chosen = self.game.players[4]
+        assert(self.game.special_election(chosen.player_id))
+        assert(self.game.president is chosen)
+        assert(self.game.prev_president_id == president.player_id)
+        assert(self.game.state == game.GameStates.NOMINATION)
+
+    def test_investigate(self):
+        """Test investigating returns the party and passes the presidency"""
+        self.game.state = game.GameStates.INVESTIGATION
+        self.game.fascist_board = 2
+        target = self.game.players[2]
+        assert(self.game.investigate(target.player_id) == target.get_party())
+        assert(self.game.president is self.game.players[1])
+
+    def test_nominees(self):
+        """Test the president and the last chancellor can't be nominated"""
+        for player_id in range(1, 5):
+            self.game.add_player(player_id)
+        self.game.start_game()
+        self.game.chancellor = self.game.players[1]
+        assert(self.game.nominees() == self.game.players[2:])
+        assert(not self.game.nominate(self.game.players[1].player_id))
+        self.game.players = self.game.players[:2]
+        assert(self.game.nominees() == [])
+
+    def test_unvote(self):
+        """Test taking back a vote only removes that player's own ballot"""
+        assert(not self.game.unvote(999, "y"))
+        self.game.vote(0, "y")
+        assert(not self.game.unvote(0, "n"))
+        assert(self.game.unvote(0, "y"))
+        assert(self.game.get_vote(0) is None)
+
+    def test_veto(self):
+        """Test an accepted veto discards the whole agenda"""
+        self.game.fascist_board = 5
+        self.game.state = game.GameStates.LEGISLATIVE_CHANCELLOR
+        self.game.policies = ["F", "L"]
+        assert(self.game.request_veto())
+        assert(self.game.state == game.GameStates.VETO)
+        assert(self.game.accept_veto())
+        assert(self.game.policies == [])
+        assert(self.game.discard == ["F", "L"])
+        assert(self.game.state == game.GameStates.NOMINATION)
+
+    def test_execute_hitler(self):
+        """Test executing Hitler ends the game for the liberals"""
+        self.game.state = game.GameStates.EXECUTION
+        hitler = next(p for p in self.game.players if p.role == "Hitler")
+        assert(self.game.execute(hitler.player_id) is hitler)
+        assert(self.game.state == game.GameStates.GAME_OVER)
+        assert(self.game.winner == "Liberal")
+
+
 if __name__ == '__main__':
     unittest.main()
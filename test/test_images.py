@@ -0,0 +1,53 @@
+import io
+import unittest
+
+from PIL import Image
+
+from secret_hitler import images
+
+
+class PolicyHandTestCase(unittest.TestCase):
+    def test_hand_size(self):
+        """Test hands are rendered with one card slot per policy"""
+        three = Image.open(io.BytesIO(images.policy_hand("LFF")))
+        two = Image.open(io.BytesIO(images.policy_hand("FL")))
+        assert(three.size == (3 * 292 + 20, 470))
+        assert(two.size == (2 * 292 + 20, 470))
+
+    def test_hand_cached(self):
+        """Test the same hand is only rendered once"""
+        assert(images.policy_hand("LLF") is images.policy_hand("LLF"))
+        assert(images.hand_cache.lookup("LLF") is images.policy_hand("LLF"))
+        assert(len(images.POLICY_HANDS) == 12)
+
+
+class BoardCacheTestCase(unittest.TestCase):
+    def test_board_shared(self):
+        """Test boards in the same state share the encoded image"""
+        assert(images.fascist_board(5, 2) is images.fascist_board(6, 2))
+        assert(images.fascist_board(5, 2) is not images.fascist_board(7, 2))
+        assert(images.liberal_board(0) is images.liberal_board(0))
+
+    def test_byte_budget(self):
+        """Test the least recently used boards are evicted over budget"""
+        cache = images.BoardCache(10)
+        cache.get("a", lambda: b"aaaa")
+        cache.get("b", lambda: b"bbbb")
+        cache.get("a", lambda: b"xxxx")
+        cache.get("c", lambda: b"cccc")
+        assert(list(cache.boards.keys()) == ["a", "c"])
+        assert(cache.size == 8)
+        assert(cache.hits == 1 and cache.misses == 3)
+
+    def test_combined_board(self):
+        """Test both tracks are stacked into one image of the given width"""
+        board = Image.open(io.BytesIO(images.combined_board(7, 2, 3, 400, "PNG8")))
+        assert(board.size[0] == 400)
+        assert(board.size[1] > 2 * 120)
+        assert(board.mode == "P")
+        webp = images.combined_board(7, 2, 3, 400, "WEBP")
+        assert(Image.open(io.BytesIO(webp)).format == "WEBP")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from secret_hitler.game import Game, GameStates
+from secret_hitler.journal import Journal
+from secret_hitler.registry import GameRegistry
+
+
+class JournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "journal.db")
+        self.game = Game(100, 1, 5, 10)
+        for player_id in range(11, 15):
+            self.game.add_player(player_id)
+        self.game.start_game()
+        self.game.start_nomination()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def reopen(self, journal):
+        journal.close()
+        return Journal(self.path, journal.snapshot_every)
+
+    def test_round_trip(self):
+        """Test a game is rebuilt from its dict"""
+        self.game.nominate(self.game.players[1].player_id)
+        self.game.vote(11, "y")
+        registry = GameRegistry()
+        game = Game.from_dict(self.game.to_dict(), registry)
+        assert(game.to_dict() == self.game.to_dict())
+        assert(game.state is GameStates.ELECTION)
+        assert(game.president is game.players[0])
+        assert(registry.get_game_with_player(12) is game)
+        assert(registry.get_game_with_channel(100) is game)
+
+    def test_old_state(self):
+        """Test states journaled with the old executive power flags load"""
+        data = self.game.to_dict()
+        data.update(investigated_one=True, investigated=False, peeked=True)
+        data.update(executed_one=False, executed_two=False)
+        game = Game.from_dict(data)
+        assert(game.to_dict() == self.game.to_dict())
+
+    def test_restore(self):
+        """Test the last recorded state survives a restart"""
+        journal = Journal(self.path, 50)
+        journal.record(1, self.game.to_dict())
+        self.game.nominate(self.game.players[1].player_id)
+        journal.record(1, self.game.to_dict())
+        journal = self.reopen(journal)
+        assert(journal.games()[1] == self.game.to_dict())
+        journal.close()
+
+    def test_snapshots(self):
+        """Test records are folded into a snapshot"""
+        journal = Journal(self.path, 3)
+        for failed_votes in range(9):
+            self.game.failed_votes = failed_votes
+            journal.record(1, self.game.to_dict())
+        journal.flush()
+        assert(journal.snapshots == 3)
+        assert(journal.pending[1] == 2)
+        journal = self.reopen(journal)
+        assert(journal.games()[1]["failed_votes"] == 8)
+        journal.close()
+
+    def test_remove(self):
+        """Test removed games aren't restored"""
+        journal = Journal(self.path)
+        journal.record(1, self.game.to_dict())
+        journal.remove(1)
+        journal = self.reopen(journal)
+        assert(journal.games() == {})
+        journal.close()
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+
+from secret_hitler.locks import GameLocks
+
+
+class GameLocksTestCase(unittest.TestCase):
+    def test_commands_in_order(self):
+        """Test commands of one game run one at a time in arrival order"""
+        locks = GameLocks()
+        log = []
+
+        async def command(game_id, name):
+            async with locks.hold(game_id):
+                log.append((game_id, name, "start"))
+                await asyncio.sleep(0.01)
+                log.append((game_id, name, "end"))
+
+        async def main():
+            await asyncio.gather(*(command(1, i) for i in range(3)))
+
+        asyncio.run(main())
+        assert(log == [(1, i, step) for i in range(3) for step in ("start", "end")])
+        stats = locks.stats()[1]
+        assert(stats["acquired"] == 3)
+        assert(stats["max_waiting"] == 2)
+        assert(stats["waiting"] == 0)
+        assert(stats["max_wait"] >= 0.01)
+
+    def test_games_in_parallel(self):
+        """Test a busy game doesn't hold up other games"""
+        locks = GameLocks()
+        finished = []
+
+        async def command(game_id, delay):
+            async with locks.hold(game_id):
+                await asyncio.sleep(delay)
+                finished.append(game_id)
+
+        async def main():
+            await asyncio.gather(command(1, 0.05), command(2, 0))
+
+        asyncio.run(main())
+        assert(finished == [2, 1])
+
+    def test_remove_while_held(self):
+        """Test a game can be removed by the command holding its lock"""
+        locks = GameLocks()
+
+        async def main():
+            async with locks.hold(1):
+                locks.remove(1)
+            assert(locks.stats() == {})
+
+        asyncio.run(main())
@@ -0,0 +1,41 @@
+import unittest
+
+try:
+    import numpy as np
+    from secret_hitler import montecarlo
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class MonteCarloTestCase(unittest.TestCase):
+    def test_policies_conserved(self):
+        """Test no policy is lost or duplicated across draws and reshuffles"""
+        rng = np.random.default_rng(0)
+        roles = ["Liberal"] * 4 + ["Fascist"] * 2 + ["Hitler"]
+        batch = montecarlo.Batch(2000, roles, 0.6, rng)
+        batch.play()
+        liberal = batch.deck_l + batch.discard_l + batch.liberal_board
+        fascist = batch.deck_f + batch.discard_f + batch.fascist_board
+        assert((liberal == 6).all())
+        assert((fascist == 11).all())
+        assert(not batch.active.any())
+        assert((batch.winner > 0).all())
+
+    def test_power_track(self):
+        """Test the power track follows the engine rules"""
+        track = montecarlo.power_track(10)
+        assert(track[1] is montecarlo.GameStates.INVESTIGATION)
+        assert(track[3] is montecarlo.GameStates.SPECIAL_ELECTION)
+        assert(track[5] is montecarlo.GameStates.EXECUTION)
+
+    def test_report(self):
+        """Test every simulated game is counted once"""
+        report = montecarlo.simulate(5, 3000, batch_size=1000, seed=1)
+        assert(report.games == 3000)
+        assert(report.liberal_wins + report.fascist_wins == 3000)
+        assert(report.lengths.sum() == 3000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import itertools
+import unittest
+from fractions import Fraction
+
+from secret_hitler import odds
+from secret_hitler.game import Game, GameStates
+
+
+def enumerate_draws(deck, discard, cards):
+    # Brute force over every order of the deck and the reshuffled discard pile
+    counts = [Fraction(0)] * (cards + 1)
+    deck_orders = list(itertools.permutations(deck))
+    discard_orders = list(itertools.permutations(discard)) or [()]
+    weight = Fraction(1, len(deck_orders) * len(discard_orders))
+    for first in deck_orders:
+        for second in discard_orders:
+            hand = (list(first) + list(second))[:cards]
+            counts[hand.count("F")] += weight
+    return counts
+
+
+class OddsTestCase(unittest.TestCase):
+    def test_draw_distribution(self):
+        """Test the draw distribution against brute force enumeration"""
+        for deck, discard in [("LLFFF", ""), ("LF", "LLF"), ("F", "LLFF"), ("", "LFF")]:
+            expected = enumerate_draws(deck, discard, 3)
+            distribution = odds.draw_distribution(
+                deck.count("L"), deck.count("F"), discard.count("L"), discard.count("F")
+            )
+            for p, q in zip(distribution, expected):
+                assert(abs(p - float(q)) < 1e-9)
+
+    def test_full_deck(self):
+        """Test the well known odds of the first hand"""
+        distribution = odds.draw_distribution(6, 11, 0, 0)
+        assert(abs(sum(distribution) - 1) < 1e-9)
+        assert(abs(distribution[3] - 165 / 680) < 1e-9)
+        assert(abs(odds.top_deck_probability(6, 11, 0, 0) - 11 / 17) < 1e-9)
+
+    def test_win_probability(self):
+        """Test the win probability at the edges of the model"""
+        assert(odds.liberal_win_probability(6, 11, 0, 0, 0, 0, 1.0) > 0.99)
+        assert(odds.liberal_win_probability(6, 11, 0, 0, 0, 0, 0.0) < 0.01)
+        assert(odds.liberal_win_probability(0, 3, 0, 0, 4, 5, 0.5) == 0.0)
+        assert(odds.liberal_win_probability(3, 0, 0, 0, 4, 5, 0.5) == 1.0)
+        p = odds.liberal_win_probability(6, 11, 0, 0, 0, 0, 0.6)
+        assert(0 < p < 1)
+
+    def test_game_odds(self):
+        """Test the odds of a game follow its deck"""
+        game = Game(0, 0, 5, 0)
+        result = odds.game_odds(game)
+        assert(result["draw"] == odds.draw_distribution(6, 11, 0, 0))
+        assert(result["p_liberal"] == 0.6)
+
+    def test_hidden_hand(self):
+        """Test the hand being played doesn't show in the deck counts"""
+        game = Game(0, 0, 5, 0)
+        for player_id in range(1, 5):
+            game.add_player(player_id)
+        game.start_game()
+        game.state = GameStates.LEGISLATIVE_PRESIDENT
+        hand = game.president_legislative()
+        assert(odds.game_counts(game) == (6, 11, 0, 0))
+        game.discard_policy(game.president.player_id, hand[0])
+        assert(game.state == GameStates.LEGISLATIVE_CHANCELLOR)
+        assert(odds.game_counts(game) == (6, 11, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+
+from secret_hitler.outbox import Outbox
+
+
+class FakeChannels:
+    def __init__(self):
+        self.sent = []
+        self.fail = False
+
+    async def send(self, channel_id, **kwargs):
+        if self.fail:
+            raise RuntimeError("Missing Access")
+        self.sent.append((channel_id, kwargs))
+        return len(self.sent)
+
+
+class OutboxTestCase(unittest.TestCase):
+    def setUp(self):
+        self.channels = FakeChannels()
+        self.outbox = Outbox(self.channels.send, linger=0)
+
+    def test_embeds_coalesced(self):
+        """Test consecutive embeds are sent as one message"""
+
+        async def main():
+            futures = [self.outbox.post(1, embed="e" + str(i)) for i in range(3)]
+            return await asyncio.gather(*futures)
+
+        messages = asyncio.run(main())
+        assert(self.channels.sent == [(1, {"embeds": ["e0", "e1", "e2"]})])
+        assert(messages == [1, 1, 1])
+        assert(self.outbox.stats()["coalesced"] == 2)
+
+    def test_order_kept(self):
+        """Test messages that can't be merged keep their place"""
+
+        async def main():
+            self.outbox.post(1, embed="a")
+            self.outbox.post(1, embed="b", file="board.png")
+            self.outbox.post(1, embed="c")
+            await self.outbox.post(1, embed="d")
+
+        asyncio.run(main())
+        assert(
+            self.channels.sent
+            == [
+                (1, {"embed": "a"}),
+                (1, {"embed": "b", "file": "board.png"}),
+                (1, {"embeds": ["c", "d"]}),
+            ]
+        )
+
+    def test_alone(self):
+        """Test a message posted alone isn't merged with its neighbours"""
+
+        async def main():
+            self.outbox.post(1, embed="a")
+            self.outbox.post(1, alone=True, embed="status")
+            await self.outbox.post(1, embed="b")
+
+        asyncio.run(main())
+        assert(
+            self.channels.sent
+            == [(1, {"embed": "a"}), (1, {"embed": "status"}), (1, {"embed": "b"})]
+        )
+
+    def test_limits(self):
+        """Test a message holds at most ten embeds and 6000 characters"""
+
+        async def main():
+            for _ in range(12):
+                self.outbox.post(1, embed="x")
+            self.outbox.post(2, embed="y" * 4000)
+            await self.outbox.post(2, embed="z" * 4000)
+            await asyncio.sleep(0)
+
+        asyncio.run(main())
+        sizes = [len(kwargs.get("embeds", [1])) for _, kwargs in self.channels.sent]
+        assert(sorted(sizes) == [1, 1, 2, 10])
+        assert(self.outbox.stats()["sent"] == 4)
+        assert(self.outbox.queues == {})
+
+    def test_failure(self):
+        """Test a failed send reaches whoever waits for it"""
+        self.channels.fail = True
+
+        async def main():
+            with self.assertRaises(RuntimeError):
+                await self.outbox.post(1, content="hi")
+            self.outbox.post(1, content="nobody waits")
+            await asyncio.sleep(0)
+
+        asyncio.run(main())
+        assert(self.outbox.stats()["sent"] == 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from secret_hitler import game
+from secret_hitler.registry import GameRegistry
+
+
+class GameRegistryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = GameRegistry()
+        self.game = game.Game(100, 1, 5, 10, self.registry)
+        for player_id in range(11, 15):
+            self.game.add_player(player_id)
+
+    def test_lookups(self):
+        """Test games can be found by id, channel and player"""
+        assert(self.registry.get_game(1) is self.game)
+        assert(self.registry.get_game_with_channel(100) is self.game)
+        assert(self.registry.get_game_with_player(12) is self.game)
+        assert(self.registry.get_game_with_player(99) is None)
+        assert(self.registry.next_game_id() == 2)
+
+    def test_reserved_ids(self):
+        """Test ids are reserved before their games are registered"""
+        first = self.registry.next_game_id()
+        second = self.registry.next_game_id()
+        assert(first == 2 and second == 3)
+        self.registry.remove_game(1)
+        assert(self.registry.next_game_id() == 4)
+
+    def test_execute_and_restart(self):
+        """Test executed players leave the index until the game restarts"""
+        self.game.execute_player(12)
+        assert(self.registry.get_game_with_player(12) is None)
+        assert(not self.game.has_player(12))
+        self.game.restart_game()
+        assert(self.registry.get_game_with_player(12) is self.game)
+
+    def test_vote_messages(self):
+        """Test the active vote message is indexed until votes are counted"""
+        self.game.start_game()
+        self.game.nominate(self.game.players[1].player_id)
+        self.game.set_vote_message(7)
+        assert(self.registry.get_game_with_vote_message(7) is self.game)
+        self.game.set_vote_message(8)
+        assert(self.registry.get_game_with_vote_message(7) is None)
+        self.game.calculate_votes()
+        assert(self.registry.get_game_with_vote_message(8) is None)
+
+    def test_remove_game(self):
+        """Test removing a game drops all of its index entries"""
+        self.game.execute_player(12)
+        self.registry.remove_game(1)
+        assert(self.registry.get_game(1) is None)
+        assert(self.registry.get_game_with_channel(100) is None)
+        assert(self.registry.get_game_with_player(10) is None)
+        assert(self.registry.next_game_id() == 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
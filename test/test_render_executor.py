@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+
+from secret_hitler import images
+from secret_hitler.render_executor import RenderExecutor
+
+
+class RenderExecutorTestCase(unittest.TestCase):
+    def test_render_off_loop(self):
+        """Test renders run in the pool and are timed per function"""
+        async def run():
+            renderer = RenderExecutor("thread", 2, 1)
+            boards = await asyncio.gather(
+                renderer.render(images.liberal_board, 1),
+                renderer.render(images.fascist_board, 7, 1),
+            )
+            renderer.shutdown()
+            return renderer, boards
+
+        renderer, boards = asyncio.run(run())
+        assert(all(board.startswith(b"\x89PNG") for board in boards))
+        stats = renderer.stats()
+        assert(stats["liberal_board"]["count"] == 1)
+        assert(stats["fascist_board"]["count"] == 1)
+        assert(renderer.queued == 0)
+
+    def test_process_pool_cached_here(self):
+        """Test a process pool only renders misses and caches them here"""
+        images.board_cache.clear()
+        hits = images.board_cache.hits
+
+        async def run():
+            renderer = RenderExecutor("process", 1, 1)
+            first = await renderer.render(images.liberal_board, 2)
+            second = await renderer.render(images.liberal_board, 2)
+            renderer.shutdown()
+            return renderer, first, second
+
+        renderer, first, second = asyncio.run(run())
+        assert(first is second)
+        assert(renderer.stats()["liberal_board"]["count"] == 1)
+        assert(images.board_cache.hits == hits + 1)
+
+    def test_unknown_executor(self):
+        """Test an unknown pool kind is rejected"""
+        with self.assertRaises(ValueError):
+            RenderExecutor("gpu")
+
+
+if __name__ == '__main__':
+    unittest.main()
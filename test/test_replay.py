@@ -0,0 +1,66 @@
+import json
+import random
+import unittest
+
+from secret_hitler import replay
+from secret_hitler.game import Game, GameStates
+from secret_hitler.simulator import RandomAgent, Simulator
+
+
+class ReplayTestCase(unittest.TestCase):
+    def test_seeded_games(self):
+        """Test games with the same seed shuffle the same way"""
+        first = Game(0, 0, 5, 0, seed=42)
+        second = Game(0, 0, 5, 0, seed=42)
+        for game in (first, second):
+            for player_id in range(1, 5):
+                game.add_player(player_id)
+            game.start_game()
+        assert(first.to_dict() == second.to_dict())
+
+    def test_replay(self):
+        """Test a recorded game replays to the same final state"""
+        sim = Simulator(7, RandomAgent(random.Random(3)), seed=3)
+        sim.play()
+        data = json.loads(json.dumps(replay.recording(sim.game)))
+        game = replay.replay(data)
+        assert(game.to_dict() == sim.game.to_dict())
+
+    def test_replay_after_restart(self):
+        """Test the recording of a restarted game starts at the restart"""
+        sim = Simulator(5, RandomAgent(random.Random(5)), seed=5)
+        sim.play()
+        sim.play()
+        assert(sim.game.commands[0][0] == "start_game")
+        game = replay.replay(replay.recording(sim.game))
+        assert(game.to_dict() == sim.game.to_dict())
+
+    def test_nested_commands(self):
+        """Test engine calls inside a command aren't recorded twice"""
+        game = Game(0, 0, 5, 0, seed=1)
+        for player_id in range(1, 5):
+            game.add_player(player_id)
+        game.start_game()
+        game.commands.clear()
+        game.state = GameStates.EXECUTION
+        game.execute(game.players[1].player_id)
+        assert([name for name, _ in game.commands] == ["execute"])
+
+    def test_failed_command(self):
+        """Test a command that raises is left out of the recording"""
+        game = Game(0, 0, 5, 0, seed=2)
+        for player_id in range(1, 5):
+            game.add_player(player_id)
+        game.start_game()
+        game.state = GameStates.LEGISLATIVE_CHANCELLOR
+        game.begin_recording()
+        # There is no chancellor yet
+        with self.assertRaises(AttributeError):
+            game.discard_policy(1, "F")
+        game.request_veto()
+        assert(game.commands == [("request_veto", ())])
+        assert(replay.replay(replay.recording(game)).to_dict() == game.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+
+from secret_hitler.scheduler import BULK, INTERACTIVE, NORMAL, FairScheduler
+
+
+class FairSchedulerTestCase(unittest.TestCase):
+    def run_requests(self, scheduler, requests):
+        # Runs (guild, flow, priority, name) requests queued at once and
+        # returns the names in the order they were sent
+        sent = []
+
+        async def main():
+            async def request(name):
+                sent.append(name)
+
+            await asyncio.gather(
+                *(
+                    scheduler.call(guild, flow, priority, lambda n=name: request(n))
+                    for guild, flow, priority, name in requests
+                )
+            )
+
+        asyncio.run(main())
+        return sent
+
+    def test_passes_through_within_budget(self):
+        """Test requests within the burst aren't queued"""
+        scheduler = FairScheduler(rate=1000, burst=5)
+        sent = self.run_requests(scheduler, [(1, 1, NORMAL, i) for i in range(5)])
+        assert(sent == [0, 1, 2, 3, 4])
+        assert(scheduler.stats()[1]["requests"] == 5)
+
+    def test_guilds_share_equally(self):
+        """Test a guild with many games doesn't starve a guild with one"""
+        scheduler = FairScheduler(rate=1000, burst=1)
+        requests = [(0, 0, NORMAL, "first")]
+        requests += [(1, game, NORMAL, "a") for game in range(4) for _ in range(3)]
+        requests += [(2, 0, NORMAL, "b") for _ in range(3)]
+        sent = self.run_requests(scheduler, requests)
+        # Guild 2's requests are served within the first half, not after all
+        # twelve requests of guild 1
+        assert(sent[0] == "first")
+        assert(max(i for i, name in enumerate(sent) if name == "b") <= 8)
+        assert(scheduler.heap == [] and scheduler.waiting == {})
+
+    def test_priority_classes(self):
+        """Test interactive requests overtake queued bulk work"""
+        scheduler = FairScheduler(rate=1000, burst=1)
+        requests = [(1, 1, BULK, "purge")]
+        requests += [(1, 1, BULK, "emoji") for _ in range(3)]
+        requests += [(2, 2, NORMAL, "board"), (2, 2, INTERACTIVE, "nomination")]
+        sent = self.run_requests(scheduler, requests)
+        assert(sent[:3] == ["purge", "nomination", "board"])
+
+    def test_cancelled_request(self):
+        """Test a cancelled waiting request is skipped"""
+        scheduler = FairScheduler(rate=1000, burst=1)
+        sent = []
+
+        async def main():
+            async def request(name):
+                sent.append(name)
+
+            await scheduler.call(1, 1, NORMAL, lambda: request("a"))
+            task = asyncio.get_running_loop().create_task(
+                scheduler.call(1, 1, NORMAL, lambda: request("b"))
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            await scheduler.call(1, 1, NORMAL, lambda: request("c"))
+
+        asyncio.run(main())
+        assert(sent == ["a", "c"])
+        assert(scheduler.stats()[1]["queued"] == 0)
+
+    def test_back_off(self):
+        """Test requests wait after backing off"""
+        scheduler = FairScheduler(rate=100, burst=1)
+        scheduler.back_off(0.05)
+        self.run_requests(scheduler, [(1, 1, NORMAL, "a")])
+        assert(scheduler.stats()[1]["max_wait"] >= 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import random
+import unittest
+
+from secret_hitler import benchmark
+from secret_hitler.game import GameStates
+from secret_hitler.simulator import RandomAgent, ScriptedAgent, Simulator
+
+
+class SimulatorTestCase(unittest.TestCase):
+    def test_random_games_finish(self):
+        """Test random games finish for every player count"""
+        for max_players in benchmark.player_counts():
+            sim = Simulator(max_players, RandomAgent(random.Random(max_players)))
+            for _ in range(50):
+                result = sim.play()
+                assert(result.winner in ("Liberal", "Fascist"))
+                assert(sim.game.state is GameStates.GAME_OVER)
+
+    def test_scripted_liberal_win(self):
+        """Test a table that always discards fascist policies"""
+        sim = Simulator(5, ScriptedAgent({"discard": ["F"] * 10}), seed=1)
+        sim.game.deck = list("LFF" * 5 + "LF")
+        # Hitler is never nominated, so only a liberal track can end the game
+        sim.agent.nominate = lambda game, candidates: next(
+            p.player_id for p in candidates if p.role != "Hitler"
+        )
+        result = sim.play()
+        assert(result.winner == "Liberal")
+        assert(result.liberal_board == 5)
+
+    def test_timings(self):
+        """Test per method latencies are recorded"""
+        timings = {}
+        Simulator(7, RandomAgent(random.Random(0)), timings).play()
+        assert("calculate_votes" in timings)
+        assert(all(t >= 0 for t in timings["vote"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
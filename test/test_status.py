@@ -0,0 +1,107 @@
+import asyncio
+import unittest
+
+import discord
+
+from secret_hitler.status import StatusMessages
+
+
+class FakeMessage:
+    def __init__(self, content):
+        self.content = content
+        self.deleted = False
+
+
+class FakeResponse:
+    status = 404
+    reason = "Not Found"
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+        self.edits = 0
+
+    async def create(self, game_id, content):
+        message = FakeMessage(content)
+        self.sent.append(message)
+        return message
+
+    async def edit(self, message, content):
+        if message.deleted:
+            raise discord.NotFound(FakeResponse(), "Unknown Message")
+        message.content = content
+        self.edits = self.edits + 1
+
+
+class StatusMessagesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.channel = FakeChannel()
+        self.status = StatusMessages(self.channel.create, self.channel.edit, delay=0.01)
+
+    def test_updates_coalesced(self):
+        """Test a burst of updates sends only the newest content once"""
+
+        async def main():
+            for i in range(10):
+                self.status.update(1, i)
+            await self.status.wait(1)
+
+        asyncio.run(main())
+        assert(len(self.channel.sent) == 1)
+        assert(self.channel.sent[0].content == 9)
+        assert(self.status.coalesced == 9)
+
+    def test_edited_in_place(self):
+        """Test later updates edit the first message"""
+
+        async def main():
+            for i in range(3):
+                self.status.update(1, i)
+                await self.status.wait(1)
+
+        asyncio.run(main())
+        assert(len(self.channel.sent) == 1)
+        assert(self.channel.edits == 2)
+        assert(self.channel.sent[0].content == 2)
+
+    def test_update_while_sending(self):
+        """Test an update during an edit is sent afterwards"""
+
+        async def main():
+            self.status.update(1, "a")
+            await asyncio.sleep(0.015)
+            self.status.update(1, "b")
+            await self.status.wait(1)
+
+        asyncio.run(main())
+        assert(self.channel.sent[-1].content == "b")
+
+    def test_deleted_message_replaced(self):
+        """Test a new message is created when the old one was deleted"""
+
+        async def main():
+            self.status.update(1, "a")
+            await self.status.wait(1)
+            self.channel.sent[0].deleted = True
+            self.status.update(1, "b")
+            await self.status.wait(1)
+
+        asyncio.run(main())
+        assert(len(self.channel.sent) == 2)
+        assert(self.channel.sent[1].content == "b")
+
+    def test_remove(self):
+        """Test removing a game drops its pending update"""
+
+        async def main():
+            self.status.update(1, "a")
+            self.status.remove(1)
+            await asyncio.sleep(0.03)
+
+        asyncio.run(main())
+        assert(self.channel.sent == [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import types
+import unittest
+
+from multidict import CIMultiDict
+from yarl import URL
+
+from secret_hitler.telemetry import RateLimitTelemetry, route_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def response(status, headers):
+    return types.SimpleNamespace(status=status, headers=CIMultiDict(headers))
+
+
+class RateLimitTelemetryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limits = []
+        self.telemetry = RateLimitTelemetry(self.limits.append, self.clock)
+
+    def request(self, method, url, status, headers, elapsed=0.1, queued=0.0):
+        async def main():
+            context = types.SimpleNamespace()
+            params = types.SimpleNamespace(
+                method=method, url=URL(url), response=response(status, headers)
+            )
+            await self.telemetry.request_start(None, context, params)
+            if queued:
+                await self.telemetry.queued_start(None, context, params)
+                self.clock.now = self.clock.now + queued
+                await self.telemetry.queued_end(None, context, params)
+            self.clock.now = self.clock.now + elapsed
+            await self.telemetry.request_end(None, context, params)
+
+        asyncio.run(main())
+
+    def test_route_key(self):
+        """Test ids, emojis and tokens are folded into the route"""
+        assert(
+            route_key("PUT", "/api/v10/channels/1234/messages/5678/reactions/ja:99/@me")
+            == "PUT /channels/{id}/messages/{id}/reactions/{emoji}/@me"
+        )
+        assert(
+            route_key("POST", "/api/v10/interactions/1234/abc.def/callback")
+            == "POST /interactions/{id}/{token}/callback"
+        )
+        assert(route_key("GET", "/api/v10/gateway/bot") == "GET /gateway/bot")
+
+    def test_rate_limits(self):
+        """Test 429s and used up buckets are counted per route"""
+        url = "https://discord.com/api/v10/channels/1/messages"
+        self.request("POST", url, 200, {"X-RateLimit-Remaining": "1"}, queued=0.5)
+        self.request(
+            "POST",
+            url,
+            200,
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "2.5"},
+        )
+        self.request("POST", url, 429, {"Retry-After": "3"})
+        stats = self.telemetry.stats()["routes"]["POST /channels/{id}/messages"]
+        assert(stats["requests"] == 3)
+        assert(stats["rate_limited"] == 1)
+        assert(stats["retry_after"] == 3.0)
+        assert(stats["exhausted"] == 1)
+        assert(stats["reset_wait"] == 2.5)
+        assert(stats["max_queue_time"] == 0.5)
+        assert(self.limits == [])
+
+    def test_global_limit(self):
+        """Test global rate limits are reported"""
+        self.request(
+            "POST",
+            "https://discord.com/api/v10/channels/1/messages",
+            429,
+            {"Retry-After": "1.5", "X-RateLimit-Scope": "global"},
+        )
+        assert(self.telemetry.global_limits == 1)
+        assert(self.limits == [1.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+
+from secret_hitler.timers import TurnTimers
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TurnTimersTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timers = TurnTimers(self.clock)
+
+    def test_deadlines_in_order(self):
+        """Test expired timers are returned earliest first"""
+        self.timers.schedule(1, 30, "a")
+        self.timers.schedule(2, 10, "b")
+        self.timers.schedule(3, 20, "c")
+        self.clock.now = 25
+        assert(self.timers.pop_due() == [(2, "b"), (3, "c")])
+        assert(self.timers.next_deadline() == 30)
+
+    def test_reschedule_and_cancel(self):
+        """Test rescheduling and cancelling drop the old deadline"""
+        self.timers.schedule(1, 10, "old")
+        self.timers.schedule(1, 50, "new")
+        self.timers.schedule(2, 10, "x")
+        self.timers.cancel(2)
+        self.clock.now = 20
+        assert(self.timers.pop_due() == [])
+        self.clock.now = 50
+        assert(self.timers.pop_due() == [(1, "new")])
+        assert(self.timers.heap == [])
+
+    def test_track_turns(self):
+        """Test a timer only restarts when the turn changes"""
+        assert(self.timers.track(1, ("NOMINATION", 5), 60))
+        self.clock.now = 30
+        assert(not self.timers.track(1, ("NOMINATION", 5), 60))
+        assert(self.timers.next_deadline() == 60)
+        assert(self.timers.track(1, ("GAME_OVER", 5), None))
+        assert(self.timers.next_deadline() is None)
+
+    def test_compaction(self):
+        """Test cancelled entries don't pile up in the heap"""
+        for game_id in range(1000):
+            self.timers.schedule(game_id, 10, None)
+        for game_id in range(900):
+            self.timers.cancel(game_id)
+        assert(len(self.timers.heap) < 500)
+        self.clock.now = 10
+        assert(len(self.timers.pop_due()) == 100)
+
+    def test_run(self):
+        """Test the timer task fires callbacks when deadlines pass"""
+        timers = TurnTimers()
+        fired = []
+
+        async def callback(game_id, turn, step):
+            fired.append((game_id, turn, step))
+
+        async def main():
+            timers.start(callback)
+            timers.schedule(1, 0.05, ("ELECTION", 0))
+            timers.schedule(2, 0.01, ("NOMINATION", 0))
+            await asyncio.sleep(0.1)
+            timers.task.cancel()
+
+        asyncio.run(main())
+        assert(fired == [(2, "NOMINATION", 0), (1, "ELECTION", 0)])